@@ -8,16 +8,21 @@
 .. include:: ../../releases/README.md
 """
 
+import importlib
 import logging
+from typing import Optional
 
 import click
 
-from .cli.backstage import backstage
-from .cli.build import build
-from .cli.health import health
-from .cli.plan import plan
-from .cli.projects import projects
-from .utilities.pyaml_env import parse_config
+COMMANDS = {
+    "plan": ".cli.plan",
+    "projects": ".cli.projects",
+    "build": ".cli.build",
+    "health": ".cli.health",
+    "backstage": ".cli.backstage",
+}
+"""The modules of the subcommands, relative to this package. A subcommand is named after the module attribute that
+holds it."""
 
 
 def _disable_package_loggers(offending_loggers: list[str]):
@@ -27,17 +32,37 @@ def _disable_package_loggers(offending_loggers: list[str]):
                 logging.getLogger(name).setLevel(logging.WARNING)
 
 
-@click.group(name="mpyl", help="Command Line Interface for MPyL")
+class LazyGroup(click.Group):
+    """A group that imports the module of a subcommand when the subcommand is first looked up, so that an invocation
+    only pays for the dependencies of the command that it runs."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands:
+            module = importlib.import_module(self.lazy_commands.pop(cmd_name), __name__)
+            self.add_command(getattr(module, cmd_name))
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(name="mpyl", help="Command Line Interface for MPyL", cls=LazyGroup)
 def main_group():
     """Command Line Interface for MPyL"""
 
 
 def add_commands():
-    main_group.add_command(plan)
-    main_group.add_command(projects)
-    main_group.add_command(build)
-    main_group.add_command(health)
-    main_group.add_command(backstage)
+    main_group.lazy_commands.update(
+        {
+            name: module
+            for name, module in COMMANDS.items()
+            if name not in main_group.commands
+        }
+    )
 
 
 def main():
@@ -2,11 +2,14 @@
 
 import logging
 import os
+from typing import Optional
 
 import yaml
 
 from ..plan.discovery import find_projects
-from ..project import load_project, Project, Target, KeyValueProperty
+from ..project import Project, Target
+from ..projects.cache import ProjectCache
+from ..projects.loader import load_projects
 from ..steps import deploy
 from ..steps.deploy.k8s.chart import ChartBuilder
 
@@ -14,11 +17,15 @@ logger = logging.getLogger("mpyl")
 
 
 def generate_components(  # pylint: disable=too-many-locals
-    directory: str, repository_url: str, repository: str
+    directory: str,
+    repository_url: str,
+    repository: str,
+    workers: Optional[int] = None,
+    cache: Optional[ProjectCache] = None,
 ) -> None:
-    projects: list[Project] = []
-    for project_yaml_file in find_projects():
-        projects.append(load_project(project_yaml_file, validate_project_yaml=True))
+    projects = load_projects(
+        find_projects(), validate_project_yaml=True, workers=workers, cache=cache
+    ).raise_on_failure()
 
     service_components: list[dict] = []
     maintainers: list[str] = []
@@ -87,15 +94,17 @@ def __get_project_names(projects: list[Project]) -> list[str]:
 def __get_dependencies_for_project(
     project: Project, project_names: list[str]
 ) -> list[str]:
-    env_vars: list[KeyValueProperty] = []
-    for deployment in project.deployments:
-        if deployment.properties:
-            env_vars = env_vars + deployment.properties.env
+    raw_env_vars = ChartBuilder.extract_raw_env(
+        [
+            env
+            for deployment in project.resolve(Target.PRODUCTION).deployments
+            for env in deployment.env
+        ]
+    )
 
     dependencies: list[str] = []
 
     for project_name in project_names:
-        raw_env_vars = ChartBuilder.extract_raw_env(Target.PRODUCTION, env_vars)
         for value in raw_env_vars.values():
             if "svc.cluster.local" in value and project_name in value:
                 dependencies.append(project_name)
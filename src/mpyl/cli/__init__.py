@@ -6,6 +6,14 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 CONFIG_PATH_HELP = "Path to the config.yml. Can be set via `MPYL_CONFIG_PATH` env var. "
+NO_CACHE_HELP = (
+    "Find and load projects without using the discovery, project and run plan caches. "
+    "Can be set via `MPYL_NO_CACHE` env var. "
+)
+WORKERS_HELP = (
+    "Number of processes used to load projects. Defaults to the number of CPUs. "
+    "Can be set via `MPYL_WORKERS` env var. "
+)
 
 
 def create_console_logger() -> Console:
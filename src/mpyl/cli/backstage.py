@@ -1,8 +1,12 @@
 """Commands related to Backstage"""
 
+from typing import Optional
+
 import click
 
+from . import NO_CACHE_HELP, WORKERS_HELP
 from ..backstage.backstage import generate_components
+from ..projects.cache import ProjectCache
 
 
 @click.group("backstage")
@@ -32,5 +36,21 @@ def backstage():
     type=str,
     help="The repository name",
 )
-def generate(output: str, url: str, repository: str):
-    generate_components(output, url, repository)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    envvar="MPYL_WORKERS",
+    help=WORKERS_HELP,
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    envvar="MPYL_NO_CACHE",
+    help=NO_CACHE_HELP,
+)
+def generate(
+    output: str, url: str, repository: str, workers: Optional[int], no_cache: bool
+):
+    generate_components(
+        output, url, repository, workers, None if no_cache else ProjectCache()
+    )
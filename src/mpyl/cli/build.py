@@ -10,7 +10,6 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from jsonschema import ValidationError
 from rich.console import Console
 from rich.markdown import Markdown
 
@@ -24,12 +23,16 @@ from ..constants import (
     RUN_RESULT_FILE_GLOB,
 )
 from ..project import load_project, Target
-from ..plan.discovery import find_projects
+from ..plan.discovery import DiscoveryConfig, find_projects
+from ..plan.partitions import record_duration
 from ..run_plan import RunPlan
 from ..steps.models import RunProperties
 from ..steps.run import RunResult
+from ..utilities.lazy_import import lazy_import
 from ..utilities.pyaml_env import parse_config
 
+jsonschema = lazy_import("jsonschema")
+
 
 @dataclass(frozen=True)
 class Context:
@@ -137,7 +140,9 @@ def clean(obj: Context):
 
     found_projects: list[Path] = [
         Path(load_project(project_path, validate_project_yaml=False).target_path)
-        for project_path in find_projects()
+        for project_path in find_projects(
+            DiscoveryConfig.from_config(obj.config, no_cache=True)
+        )
     ]
 
     paths_to_clean = [path for path in found_projects if path.exists()]
@@ -157,7 +162,7 @@ def _run_stage(
     logger = logging.getLogger("mpyl")
     start_time = time.time()
     try:
-        run_plan = RunPlan.load_from_pickle_file()
+        run_plan = RunPlan.load(project_name_to_run)
         console.print(Markdown(run_plan.to_markdown()))
 
         run_result = run_deploy_stage(
@@ -167,13 +172,14 @@ def _run_stage(
             project_name_to_run=project_name_to_run,
         )
 
-        console.log(
-            f"Completed in {datetime.timedelta(seconds=time.time() - start_time)}"
-        )
+        duration = time.time() - start_time
+        console.log(f"Completed in {datetime.timedelta(seconds=duration)}")
+        if run_result.is_success:
+            record_duration(project_name_to_run, duration)
         console.print(Markdown(run_result.to_markdown()))
         return run_result
 
-    except ValidationError as exc:
+    except jsonschema.ValidationError as exc:
         console.log(
             f'Schema validation failed {exc.message} at `{".".join(map(str, exc.path))}`'
         )
@@ -1,12 +1,10 @@
 """Health checks"""
 
 import os
-import pkgutil
 from pathlib import Path
 from typing import Optional
 
 import click
-import jsonschema
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.markdown import Markdown
@@ -15,8 +13,15 @@ from ....constants import (
     DEFAULT_CONFIG_FILE_NAME,
     DEFAULT_RUN_PROPERTIES_FILE_NAME,
 )
+from ....utilities.lazy_import import lazy_import
 from ....utilities.pyaml_env import parse_config
-from ....validation import validate
+from ....validation import (
+    MPYL_CONFIG_SCHEMA,
+    RUN_PROPERTIES_SCHEMA,
+    validate_with_schema,
+)
+
+jsonschema = lazy_import("jsonschema")
 
 
 class HealthConsole:
@@ -51,7 +56,7 @@ def perform_health_checks(bare_console: Console):
         _validate_config(
             console,
             config_file_path=properties_path,
-            schema_path="../../../schema/run_properties.schema.yml",
+            schema_name=RUN_PROPERTIES_SCHEMA,
         )
 
     console.title("MPyL configuration")
@@ -64,7 +69,7 @@ def perform_health_checks(bare_console: Console):
         _validate_config(
             console,
             config_file_path=config_path,
-            schema_path="../../../schema/mpyl_config.schema.yml",
+            schema_name=MPYL_CONFIG_SCHEMA,
         )
 
     if console.failure:
@@ -95,19 +100,17 @@ def __validate_config_path(
 def _validate_config(
     console: HealthConsole,
     config_file_path: Path,
-    schema_path: str,
+    schema_name: str,
 ):
     if load_dotenv(Path(".env")):
         console.check("Set env variables via .env file", success=True)
 
     parsed = parse_config(config_file_path)
-    schema_dict = pkgutil.get_data(__name__, schema_path)
-    if schema_dict:
-        try:
-            validate(parsed, schema_dict.decode("utf-8"))
-            console.check(f"{config_file_path} is valid", success=True)
-        except jsonschema.exceptions.ValidationError as exc:
-            console.check(
-                f"{config_file_path} is invalid: {exc.message} at '{'.'.join(map(str, exc.path))}'",
-                success=False,
-            )
+    try:
+        validate_with_schema(parsed, schema_name)
+        console.check(f"{config_file_path} is valid", success=True)
+    except jsonschema.exceptions.ValidationError as exc:
+        console.check(
+            f"{config_file_path} is invalid: {exc.message} at '{'.'.join(map(str, exc.path))}'",
+            success=False,
+        )
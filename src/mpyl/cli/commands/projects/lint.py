@@ -4,40 +4,34 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import jsonschema
 from rich.console import Console
 
-from ....project import Project, load_project
-
-
-def __load_project(
-    console: Optional[Console],
-    project_path: Path,
-) -> Optional[Project]:
-    try:
-        project = load_project(project_path, validate_project_yaml=True, log=False)
-    except jsonschema.exceptions.ValidationError as exc:
-        if console:
-            console.print(f"❌ {project_path}: {exc.message}")
-        return None
-    except Exception as exc:  # pylint: disable=broad-except
-        if console:
-            console.print(f"❌ {project_path}: {exc}")
-        return None
-    if console:
-        console.print(f"✅ {project_path}")
-    return project
+from ....project import Project
+from ....projects.cache import ProjectCache
+from ....projects.loader import load_projects
 
 
 def _check_and_load_projects(
-    console: Optional[Console], project_paths: list[Path]
+    console: Optional[Console],
+    project_paths: list[Path],
+    workers: Optional[int] = None,
+    cache: Optional[ProjectCache] = None,
 ) -> list[Project]:
-    projects = [__load_project(console, project_path) for project_path in project_paths]
-    valid_projects = [project for project in projects if project]
-    num_invalid = len(projects) - len(valid_projects)
+    result = load_projects(
+        project_paths, validate_project_yaml=True, workers=workers, cache=cache
+    )
+    if console:
+        failures = {failure.path: failure.message for failure in result.failures}
+        for project_path in project_paths:
+            if project_path in failures:
+                console.print(f"❌ {project_path}: {failures[project_path]}")
+            else:
+                console.print(f"✅ {project_path}")
+    valid_projects = result.loaded
+    num_invalid = len(result.failures)
     if console:
         console.print(
-            f"Validated {len(projects)} projects. {len(valid_projects)} valid, {num_invalid} invalid"
+            f"Validated {len(project_paths)} projects. {len(valid_projects)} valid, {num_invalid} invalid"
         )
     if num_invalid > 0:
         click.get_current_context().exit(1)
@@ -9,16 +9,30 @@ import click
 from rich.console import Console
 from rich.markdown import Markdown
 
-from . import CONFIG_PATH_HELP
+from . import CONFIG_PATH_HELP, NO_CACHE_HELP, WORKERS_HELP
 from . import create_console_logger
 from ..constants import (
     DEFAULT_CONFIG_FILE_NAME,
     DEFAULT_RUN_PROPERTIES_FILE_NAME,
 )
-from ..project import Stage
+from ..plan.discovery import DiscoveryConfig
+from ..project import KeyValueProperty, Stage
+from ..plan.partitions import (
+    DURATIONS_FILE,
+    MAX_MATRIX_JOBS,
+    RUN_PLAN_PARTITIONS_FILE,
+    estimate_costs,
+    merge_durations,
+    partition,
+    write_matrix,
+)
+from ..plan.result_cache import LocalPlanCacheBackend
+from ..projects.cache import ProjectCache
 from ..run_plan import discover_run_plan, RunPlan
+from ..steps import deploy
 from ..steps.models import RunProperties
 from ..utilities.pyaml_env import parse_config
+from ..utilities.repo import Changeset
 
 
 @dataclass(frozen=True)
@@ -71,36 +85,151 @@ def plan(ctx, config: Path, properties: Path):
     required=False,
     help="Limit the run plan to only this project",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    envvar="MPYL_NO_CACHE",
+    help=NO_CACHE_HELP,
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Update the projects found by the previous discovery with the added, deleted and renamed files in the "
+    "changeset, instead of searching the whole repository. Only when the changeset is read from git with --base and "
+    "the previous incremental discovery was done at the commit that the changes were made on top of",
+)
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Fail if the result of an incremental discovery differs from a full discovery",
+)
+@click.option(
+    "--base",
+    type=click.STRING,
+    required=False,
+    help="Read the changeset from git, as the changes on --head since it diverged from this branch or commit, "
+    "instead of from the changed files in vcs.changedFilesPath",
+)
+@click.option(
+    "--head",
+    type=click.STRING,
+    default="HEAD",
+    show_default=True,
+    help="The branch or commit that contains the changes, only used together with --base",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    envvar="MPYL_WORKERS",
+    help=WORKERS_HELP,
+)
+@click.option(
+    "--shard-output",
+    is_flag=True,
+    help="Also store the plan of every planned project in a separate file, so that `build run --project` only "
+    "needs to read the plan of that project",
+)
+@click.option(
+    "--partitions",
+    type=click.IntRange(min=1, max=MAX_MATRIX_JOBS),
+    help="Split the projects to deploy into this many partitions of roughly equal estimated duration, and store "
+    f"them as a GitHub Actions matrix in {RUN_PLAN_PARTITIONS_FILE}",
+)
+@click.option(
+    "--durations",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    multiple=True,
+    help=f"A {DURATIONS_FILE.name} that was recorded by `build run` in another workspace, like an artifact of a "
+    f"job of the previous matrix. It is merged into {DURATIONS_FILE}, which the partitions are estimated with. "
+    "Can be given more than once",
+)
 @click.pass_obj
-def discover_plan(ctx: Context, project: Optional[str]):
-    changed_files_path = Path(ctx.config["vcs"]["changedFilesPath"])
-    if not changed_files_path.is_dir():
-        raise ValueError(
-            f"Unable to calculate run plan because {changed_files_path} is not a directory"
-        )
-
+def discover_plan(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    ctx: Context,
+    project: Optional[str],
+    no_cache: bool,
+    incremental: bool,
+    verify: bool,
+    base: Optional[str],
+    head: str,
+    workers: Optional[int],
+    shard_output: bool,
+    partitions: Optional[int],
+    durations: tuple[Path, ...],
+):
     logger = logging.getLogger("mpyl")
+    changeset = _read_changeset(ctx, logger, base, head)
+
     run_plan = discover_run_plan(
         logger=logger,
         all_stages=[
             Stage(stage["name"], stage["icon"])
             for stage in ctx.run_properties["stages"]
         ],
-        changed_files_path=changed_files_path,
+        changeset=changeset,
+        discovery_config=DiscoveryConfig.from_config(ctx.config, no_cache=no_cache),
+        incremental=incremental,
+        verify=verify,
+        workers=workers,
+        project_cache=None if no_cache else ProjectCache(),
+        plan_cache=None if no_cache else LocalPlanCacheBackend(),
     )
 
     if project and project != "":
         run_plan = run_plan.select_project(project)
         logger.info(f"Selected project: {project}")
 
-    run_plan.write_to_pickle_file()
+    run_plan.write_to_file()
+    if shard_output:
+        deployment_defaults = ctx.config.get("project", {}).get("deployment") or {}
+        run_plan.write_shards(
+            [
+                KeyValueProperty.from_config(env)
+                for env in deployment_defaults.get("env", [])
+            ]
+        )
     run_plan.write_to_json_file()
+    if partitions:
+        _write_partitions(logger, run_plan, partitions, merge_durations(durations))
+    elif durations:
+        merge_durations(durations)
     run_plan.write_to_summary_file()
     ctx.console.print(Markdown(run_plan.to_markdown()))
 
 
+def _read_changeset(
+    ctx: Context, logger: logging.Logger, base: Optional[str], head: str
+) -> Changeset:
+    if base:
+        return Changeset.from_git(logger=logger, base=base, head=head)
+
+    changed_files_path = Path(ctx.config["vcs"]["changedFilesPath"])
+    if not changed_files_path.is_dir():
+        raise ValueError(
+            f"Unable to calculate run plan because {changed_files_path} is not a directory"
+        )
+    return Changeset.from_files(logger=logger, changed_files_path=changed_files_path)
+
+
+def _write_partitions(
+    logger: logging.Logger,
+    run_plan: RunPlan,
+    count: int,
+    durations: dict[str, float],
+):
+    to_deploy = sorted(
+        run_plan.get_projects_for_stage_name(deploy.STAGE_NAME),
+        key=lambda project: project.name,
+    )
+    matrix = partition(estimate_costs(to_deploy, durations), count)
+    write_matrix(matrix)
+    logger.info(
+        f"Split {len(to_deploy)} projects to deploy into {len(matrix)} partitions: {RUN_PLAN_PARTITIONS_FILE}"
+    )
+
+
 @plan.command("print")
 @click.pass_obj
 def print_plan(ctx: Context):
-    run_plan = RunPlan.load_from_pickle_file()
+    run_plan = RunPlan.load()
     ctx.console.print(Markdown(run_plan.to_markdown()))
@@ -3,6 +3,7 @@
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.console import Console
@@ -11,6 +12,8 @@ from rich.prompt import Confirm
 
 from . import (
     CONFIG_PATH_HELP,
+    NO_CACHE_HELP,
+    WORKERS_HELP,
     create_console_logger,
 )
 from ..cli.commands.projects.lint import (
@@ -19,19 +22,28 @@ from ..cli.commands.projects.lint import (
     _assert_no_self_dependencies,
     _find_project_names_with_underscores,
 )
-from ..cli.commands.projects.upgrade import check_upgrade
 from ..constants import DEFAULT_CONFIG_FILE_NAME
-from ..plan.discovery import find_projects
-from ..project import load_project
-from ..projects.versioning import check_upgrades_needed, upgrade_file
+from ..plan.discovery import DiscoveryConfig, find_projects
+from ..projects.cache import ProjectCache
+from ..projects.loader import load_project_headers
 from ..utilities.pyaml_env import parse_config
 
 
 @dataclass(frozen=True)
 class Context:
     config: dict
+    no_cache: bool = False
+    workers: Optional[int] = None
     console: Console = create_console_logger()
 
+    @property
+    def discovery_config(self) -> DiscoveryConfig:
+        return DiscoveryConfig.from_config(self.config, no_cache=self.no_cache)
+
+    @property
+    def project_cache(self) -> Optional[ProjectCache]:
+        return None if self.no_cache else ProjectCache()
+
 
 @click.group("projects")
 @click.option(
@@ -43,30 +55,47 @@ class Context:
     envvar="MPYL_CONFIG_PATH",
     default=DEFAULT_CONFIG_FILE_NAME,
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    envvar="MPYL_NO_CACHE",
+    help=NO_CACHE_HELP,
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    envvar="MPYL_WORKERS",
+    help=WORKERS_HELP,
+)
 @click.pass_context
-def projects(ctx, config: Path):
+def projects(ctx, config: Path, no_cache: bool, workers: Optional[int]):
     """Commands related to MPyL project configurations (project.yml)"""
-    ctx.obj = Context(parse_config(config))
+    ctx.obj = Context(parse_config(config), no_cache=no_cache, workers=workers)
 
 
 @projects.command(name="list", help="List found projects")
 @click.pass_obj
 def list_projects(ctx: Context):
-    found_projects = find_projects()
+    found_projects = load_project_headers(
+        find_projects(ctx.discovery_config),
+        workers=ctx.workers,
+        cache=ctx.project_cache,
+    ).raise_on_failure()
 
-    for proj in found_projects:
-        project = load_project(proj, validate_project_yaml=False, log=False)
-        ctx.console.print(Markdown(f"{proj} `{project.name}`"))
+    for project in found_projects:
+        ctx.console.print(Markdown(f"{project.path} `{project.name}`"))
 
 
 @projects.command(name="names", help="List found project names")
 @click.pass_obj
 def list_project_names(ctx: Context):
     names = sorted(
-        [
-            load_project(project, validate_project_yaml=False, log=False).name
-            for project in (find_projects())
-        ]
+        project.name
+        for project in load_project_headers(
+            find_projects(ctx.discovery_config),
+            workers=ctx.workers,
+            cache=ctx.project_cache,
+        ).raise_on_failure()
     )
 
     for name in names:
@@ -78,7 +107,10 @@ def list_project_names(ctx: Context):
 # pylint: disable=too-many-branches,too-many-statements
 def lint(ctx: Context):
     all_projects = _check_and_load_projects(
-        console=ctx.console, project_paths=find_projects()
+        console=ctx.console,
+        project_paths=find_projects(ctx.discovery_config),
+        workers=ctx.workers,
+        cache=ctx.project_cache,
     )
 
     console = ctx.console
@@ -128,8 +160,13 @@ def lint(ctx: Context):
     help="Apply upgrade operations to the project files",
 )
 @click.pass_obj
-def upgrade(ctx: Context, apply: bool):
-    paths = find_projects()
+def upgrade(ctx: Context, apply: bool):  # pylint: disable=too-many-locals
+    # pylint: disable=import-outside-toplevel
+    # the upgrades depend on deepdiff, which the other commands do not need
+    from ..cli.commands.projects.upgrade import check_upgrade
+    from ..projects.versioning import check_upgrades_needed, upgrade_file
+
+    paths = find_projects(ctx.discovery_config)
     candidates = check_upgrades_needed(paths)
     console = ctx.console
     if not apply:
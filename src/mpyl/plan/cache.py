@@ -0,0 +1,123 @@
+"""Persistent cache for the results of walking the repository in search of projects.
+
+For every directory that was visited, the cache stores its modification time, its subdirectories and whether it
+contains a project file. Adding, removing or renaming an entry in a directory updates that directory's mtime, so on
+subsequent runs a directory only needs to be listed again when its mtime has changed. All other directories cost a
+single `stat`.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .walker import DirectoryListing, IgnoreRules, Lister, list_directory, walk
+from ..constants import RUN_ARTIFACTS_FOLDER
+
+DISCOVERY_CACHE_FILE = Path(RUN_ARTIFACTS_FOLDER) / "discovery_cache.json"
+CACHE_FORMAT_VERSION = 1
+
+# File systems with a coarse timestamp resolution can't distinguish between a listing and a modification that
+# happened within the same tick. Directories that were modified this recently are never trusted.
+RACY_INTERVAL_NS = 2_000_000_000
+
+CachedDirectory = tuple[int, tuple[str, ...], bool]
+
+
+class DiscoveryCache:
+    def __init__(self, root: Path, ignore: IgnoreRules, cache_file: Path) -> None:
+        self._root = str(root)
+        self._ignore = ignore
+        self._cache_file = cache_file
+        self._cached: dict[str, CachedDirectory] = {}
+        self._visited: dict[str, CachedDirectory] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def _key(self) -> dict:
+        return {
+            "version": CACHE_FORMAT_VERSION,
+            "ignore": sorted(self._ignore.names) + list(self._ignore.patterns),
+        }
+
+    def load(self) -> "DiscoveryCache":
+        try:
+            with open(self._cache_file, encoding="utf-8") as file:
+                contents = json.load(file)
+        except (OSError, ValueError):
+            return self
+        if contents.get("key") != self._key:
+            return self
+        self._cached = {
+            directory: (mtime, tuple(subdirectories), has_project_file)
+            for directory, (mtime, subdirectories, has_project_file) in contents[
+                "directories"
+            ].items()
+        }
+        return self
+
+    def lister(self, racy_after_ns: int) -> Lister:
+        def list_cached_directory(relative_path: str) -> Optional[DirectoryListing]:
+            absolute_path = (
+                os.path.join(self._root, relative_path) if relative_path else self._root
+            )
+            try:
+                mtime = os.stat(absolute_path).st_mtime_ns
+            except OSError:
+                return None
+
+            cached = self._cached.get(relative_path)
+            if cached and cached[0] == mtime:
+                with self._lock:
+                    self.hits += 1
+                self._visited[relative_path] = cached
+                return DirectoryListing(cached[1], cached[2])
+
+            listing = list_directory(self._root, relative_path, self._ignore)
+            with self._lock:
+                self.misses += 1
+            if listing:
+                trusted_mtime = mtime if mtime < racy_after_ns else -1
+                self._visited[relative_path] = (
+                    trusted_mtime,
+                    listing.subdirectories,
+                    listing.has_project_file,
+                )
+            return listing
+
+        return list_cached_directory
+
+    def save(self) -> None:
+        os.makedirs(self._cache_file.parent, exist_ok=True)
+        temporary_file = self._cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            json.dump({"key": self._key, "directories": self._visited}, file)
+        os.replace(temporary_file, self._cache_file)
+
+
+def walk_with_cache(
+    root: Path, ignore: IgnoreRules, cache_file: Path = DISCOVERY_CACHE_FILE
+) -> list[Path]:
+    """Walks `root` like `mpyl.plan.walker.walk`, but only lists directories that changed since the previous walk"""
+    logger = logging.getLogger("mpyl")
+    start = time.time()
+    cache = DiscoveryCache(root, ignore, root / cache_file).load()
+    projects = walk(
+        root, ignore, lister=cache.lister(time.time_ns() - RACY_INTERVAL_NS)
+    )
+    try:
+        cache.save()
+    except OSError as exc:
+        logger.debug(f"Unable to store the discovery cache: {exc}")
+
+    outcome = "hit" if cache.misses == 0 else "miss"
+    logger.info(
+        f"Discovery cache {outcome}: reused {cache.hits} and rescanned {cache.misses} directories "
+        f"in {(time.time() - start) * 1000:.0f} ms"
+    )
+    return projects
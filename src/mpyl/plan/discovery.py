@@ -2,37 +2,206 @@
 discovered projects have to be run due to changes in the source code since the last build of the project's
 output."""
 
+import json
 import logging
-import subprocess
+import os
+from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Generic, Iterable, Optional, TypeVar
 
-from ..project import Project
+from .cache import walk_with_cache
+from .git_index import list_tracked_projects
+from .walker import IgnoreRules, is_project_file, walk
+from ..constants import RUN_ARTIFACTS_FOLDER
+from ..project import ProjectHeader
 from ..utilities.repo import Changeset
 
+DISCOVERED_PROJECTS_FILE = Path(RUN_ARTIFACTS_FOLDER) / "discovered_projects.json"
+
+P = TypeVar("P", bound=ProjectHeader)
+
+
+class DiscoveryMode(Enum):
+    FILESYSTEM = "filesystem"
+    """Walk the working tree"""
+    GIT = "git"
+    """List the project files from the git index, falls back to `FILESYSTEM` outside of a git checkout"""
+
+
+@dataclass(frozen=True)
+class DiscoveryConfig:
+    ignore: IgnoreRules = field(default_factory=IgnoreRules)
+    mode: DiscoveryMode = DiscoveryMode.FILESYSTEM
+    cache: bool = False
+    """Whether the results of walking the file system are persisted and revalidated on the next run"""
+
+    @staticmethod
+    def from_config(config: dict, no_cache: bool = False) -> "DiscoveryConfig":
+        discovery = config.get("discovery") or {}
+        return DiscoveryConfig(
+            ignore=IgnoreRules.from_patterns(discovery.get("ignore") or []),
+            mode=DiscoveryMode(discovery.get("mode") or DiscoveryMode.FILESYSTEM.value),
+            cache=discovery.get("cache", DiscoveryConfig.cache) and not no_cache,
+        )
+
+
+def find_projects(config: Optional[DiscoveryConfig] = None) -> list[Path]:
+    # Globbing with `root.rglob("deployment/project.yml")` takes literally minutes on a monorepo, and shelling out to
+    # `find` adds an OS dependency. Instead, we walk the top level subtrees in parallel and prune every directory that
+    # can't contain projects, like build output and `node_modules`.
+    discovery_config = config or DiscoveryConfig()
+    root = Path(".")
+    if discovery_config.mode == DiscoveryMode.GIT:
+        tracked = list_tracked_projects(root, discovery_config.ignore)
+        if tracked is not None:
+            return tracked
+        logging.getLogger("mpyl").debug(
+            "Falling back to walking the file system to find projects"
+        )
+    if discovery_config.cache:
+        return walk_with_cache(root, discovery_config.ignore)
+    return walk(root, discovery_config.ignore)
+
+
+@dataclass(frozen=True)
+class DiscoveredProjects:
+    projects: list[Path]
+    commit: str
+    """The head commit of the changeset that the projects were found for"""
+    config: dict
+    """The parts of the `DiscoveryConfig` that determine which projects are found, see `_discovery_settings`"""
+
+
+def _discovery_settings(config: DiscoveryConfig) -> dict:
+    return {
+        "ignore": sorted(config.ignore.names) + list(config.ignore.patterns),
+        "mode": config.mode.value,
+    }
+
+
+def read_discovered_projects(
+    path: Path = DISCOVERED_PROJECTS_FILE,
+) -> Optional[DiscoveredProjects]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            discovered = json.load(file)
+        return DiscoveredProjects(
+            projects=[Path(project) for project in discovered["projects"]],
+            commit=discovered["commit"],
+            config=discovered["config"],
+        )
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
 
-def find_projects() -> list[Path]:
-    # Ideally we'd use globbing here, as it's super easy to read:
-    #   projects = root.rglob(f"deployment/project.yml")
-    #
-    # However, because monorepo, this takes literally minutes to scan the entire repository, which we can't afford to
-    # do every time we run a command on mpyl. For this reason, I decided to go with an optimized find command, which
-    # is a bit harder to read but completes in a couple of seconds.
-    # If you find a faster way to list all files, please raise a PR.
-
-    command = (
-        f"find {Path('.')}"
-        " -type d ( -name target -o -name .git ) -prune"
-        f" -o ( -path **/deployment/{Project.project_yaml_file_name()} )"
-        " -print"
-    )
-    files = subprocess.run(
-        command.split(" "), capture_output=True, text=True, check=True, shell=False
-    ).stdout.splitlines()
-    return list(map(Path, sorted(files)))
 
+def write_discovered_projects(
+    projects: list[Path],
+    config: DiscoveryConfig,
+    commit: str,
+    path: Path = DISCOVERED_PROJECTS_FILE,
+) -> None:
+    """Stores the projects along with the commit and configuration they were found with, see
+    `find_projects_incrementally`"""
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "commit": commit,
+                "config": _discovery_settings(config),
+                "projects": [str(project) for project in projects],
+            },
+            file,
+        )
+
+
+def update_projects(
+    previous: list[Path], changeset: Changeset, ignore: IgnoreRules
+) -> list[Path]:
+    """
+    Brings the result of a previous discovery up to date by only looking at the project files that were added, copied,
+    deleted or renamed in the changeset.
+    :param previous: the projects that were found by an earlier discovery
+    :param changeset: the changes since that discovery
+    :param ignore: the rules that determine which directories are pruned
+    :return: the same list of projects that `find_projects` would return
+    """
+    projects = {str(project) for project in previous}
+    renamed = changeset.files_touched({"R"})
+    sources = [changeset.renamed_from(path) for path in renamed]
+    for path in (
+        changeset.files_touched({"A", "C", "D"})
+        | renamed
+        | {source for source in sources if source}
+    ):
+        if not is_project_file(path) or ignore.is_file_ignored(path):
+            continue
+        if os.path.isfile(path):
+            projects.add(path)
+        else:
+            projects.discard(path)
+
+    # Unless the changeset was read from git, a renamed file is only listed by its new path. A project that was moved
+    # away from its previous location can then only be detected by checking whether the known projects still exist.
+    if None in sources:
+        projects = {project for project in projects if os.path.isfile(project)}
 
-def is_file_in_project(logger: logging.Logger, project: Project, path: str) -> bool:
+    return [Path(project) for project in sorted(projects)]
+
+
+def find_projects_incrementally(
+    config: DiscoveryConfig, changeset: Changeset, verify: bool = False
+) -> list[Path]:
+    """
+    Find projects starting from the result of the previous discovery, which is stored in `DISCOVERED_PROJECTS_FILE`.
+    The previous result is only used when it was found at the commit that the changes were made on top of, with the
+    same configuration. Falls back to `find_projects` otherwise, and when the changeset was not read from git. The
+    result is stored for the next discovery, unless the changeset was not read from git.
+    :param config: the discovery configuration
+    :param changeset: the changes since the previous discovery
+    :param verify: compare the result against a full discovery
+    :raises ValueError: when `verify` is set and the results differ
+    """
+    logger = logging.getLogger("mpyl")
+    previous = read_discovered_projects()
+    if previous is None:
+        logger.info("No previous discovery result found, finding all projects")
+        projects = find_projects(config)
+    elif changeset.base_commit is None or previous.commit != changeset.base_commit:
+        logger.info(
+            f"The previous discovery result was found at commit {previous.commit}, not at the base of the "
+            f"changeset {changeset.base_commit}, finding all projects"
+        )
+        projects = find_projects(config)
+    elif previous.config != _discovery_settings(config):
+        logger.info(
+            "The previous discovery result was found with another configuration, finding all projects"
+        )
+        projects = find_projects(config)
+    else:
+        projects = update_projects(previous.projects, changeset, config.ignore)
+        logger.info(
+            f"Updated {len(previous.projects)} previously discovered projects to {len(projects)} based on the "
+            f"changeset"
+        )
+        if verify:
+            full = find_projects(config)
+            if full != projects:
+                missing = sorted(set(map(str, full)) - set(map(str, projects)))
+                superfluous = sorted(set(map(str, projects)) - set(map(str, full)))
+                raise ValueError(
+                    "Incremental discovery does not match a full discovery. "
+                    f"Missing: {missing}, superfluous: {superfluous}"
+                )
+
+    if changeset.head_commit is not None:
+        write_discovered_projects(projects, config, changeset.head_commit)
+    return projects
+
+
+def is_file_in_project(
+    logger: logging.Logger, project: ProjectHeader, path: str
+) -> bool:
     if path.startswith(str(project.root_path) + "/"):
         logger.debug(
             f"Project {project.name} added to the run plan because project file was modified: {path}"
@@ -41,9 +210,97 @@ def is_file_in_project(logger: logging.Logger, project: Project, path: str) -> b
     return False
 
 
+class _TrieNode(Generic[P]):
+    __slots__ = ("children", "projects")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode[P]] = {}
+        self.projects: list[P] = []
+
+
+class ProjectTrie(Generic[P]):
+    """Path component trie over the `Project.root_path` of all projects. Resolves a file to the projects that contain
+    it in O(path depth), regardless of the number of projects."""
+
+    def __init__(self, projects: Iterable[P]) -> None:
+        self._root: _TrieNode[P] = _TrieNode()
+        for project in projects:
+            node = self._root
+            for part in str(project.root_path).split("/"):
+                node = node.children.setdefault(part, _TrieNode())
+            node.projects.append(project)
+
+    def projects_containing(self, path: str) -> list[P]:
+        """All projects with a root path of which `path` is a descendant, equivalent to `is_file_in_project`"""
+        found: list[P] = []
+        node = self._root
+        for part in path.split("/")[:-1]:
+            child = node.children.get(part)
+            if child is None:
+                break
+            found.extend(child.projects)
+            node = child
+        return found
+
+
+class DependencyIndex(Generic[P]):
+    """The dependencies of all projects, for all stages, compiled into a single prefix index. Dependencies are grouped
+    by length, so finding all dependencies that are a prefix of a path costs one dictionary lookup per distinct
+    dependency length, instead of a comparison with every dependency of every project.
+    """
+
+    def __init__(self, projects: Iterable[P]) -> None:
+        by_length: dict[int, dict[str, list[tuple[P, str]]]] = {}
+        for project in projects:
+            if not project.dependencies:
+                continue
+            for stage, dependencies in project.dependencies.all().items():
+                for dependency in set(dependencies):
+                    by_length.setdefault(len(dependency), {}).setdefault(
+                        dependency, []
+                    ).append((project, stage))
+        self._by_length = sorted(by_length.items())
+
+    def dependents(self, path: str) -> list[tuple[P, str]]:
+        """All (project, stage) pairs with a dependency that `path` starts with, equivalent to
+        `is_file_a_dependency`"""
+        found: list[tuple[P, str]] = []
+        for length, dependencies in self._by_length:
+            if length > len(path):
+                break
+            found.extend(dependencies.get(path[:length], ()))
+        return found
+
+
+@dataclass(frozen=True)
+class ChangedProjects(Generic[P]):
+    """The projects that are affected by a changeset, found in a single pass over the touched files"""
+
+    by_content: dict[P, str]
+    """Projects that contain a touched file, mapped to the first of those files"""
+    by_dependency: dict[str, dict[P, str]]
+    """Per stage, the projects with a touched dependency in that stage, mapped to the first touched file"""
+
+    @staticmethod
+    def from_changeset(
+        all_projects: Iterable[P], changeset: Changeset
+    ) -> "ChangedProjects[P]":
+        projects = list(all_projects)
+        trie = ProjectTrie(projects)
+        dependency_index = DependencyIndex(projects)
+        by_content: dict[P, str] = {}
+        by_dependency: dict[str, dict[P, str]] = {}
+        for changed_file in changeset.sorted_files:
+            for project in trie.projects_containing(changed_file):
+                by_content.setdefault(project, changed_file)
+            for project, stage in dependency_index.dependents(changed_file):
+                by_dependency.setdefault(stage, {}).setdefault(project, changed_file)
+        return ChangedProjects(by_content=by_content, by_dependency=by_dependency)
+
+
 def is_file_a_dependency(
     logger: logging.Logger,
-    project: Project,
+    project: ProjectHeader,
     stage: str,
     path: str,
 ) -> bool:
@@ -68,40 +325,45 @@ def is_file_a_dependency(
 
 def find_projects_to_execute(
     logger: logging.Logger,
-    all_projects: set[Project],
+    all_projects: AbstractSet[P],
     stage: str,
     changeset: Changeset,
-) -> set[Project]:
-    def find_projects_that_should_execute(project: Project) -> Optional[Project]:
-        if project.stages.for_stage(stage) is None:
-            return None
-
-        is_any_dependency_modified = any(
-            is_file_a_dependency(logger, project, stage, changed_file)
-            for changed_file in changeset.files_touched()
-        )
-        is_project_modified = any(
-            is_file_in_project(logger, project, changed_file)
-            for changed_file in changeset.files_touched()
-        )
+    changed_projects: Optional[ChangedProjects[P]] = None,
+) -> set[P]:
+    """
+    :param changed_projects: the result of `ChangedProjects.from_changeset`. Computing it once and passing it for
+    every stage avoids matching the changeset against all projects again
+    """
+    changed = changed_projects or ChangedProjects.from_changeset(
+        all_projects, changeset
+    )
+    dependency_changes = changed.by_dependency.get(stage, {})
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-        if is_any_dependency_modified:
-            logger.debug(
-                f"Project {project.name} will execute stage {stage} because (at least) one of its dependencies was "
-                f"modified"
-            )
-            return project
+    def should_execute(project: P) -> bool:
+        if project not in all_projects or project.stages.for_stage(stage) is None:
+            return False
 
-        if is_project_modified:
-            logger.debug(
-                f"Project {project} will execute stage {stage} because its content changed since the previous run"
-            )
-            return project
+        if project in dependency_changes:
+            if debug:
+                logger.debug(
+                    f"Project {project.name} will execute stage {stage} because (at least) one of its dependencies "
+                    f"was modified: {dependency_changes[project]}"
+                )
+            return True
 
-        return None
+        if project in changed.by_content:
+            if debug:
+                logger.debug(
+                    f"Project {project.name} will execute stage {stage} because its content changed since the "
+                    f"previous run: {changed.by_content[project]}"
+                )
+            return True
+
+        return False
 
     return {
         project
-        for project in map(find_projects_that_should_execute, all_projects)
-        if project is not None
+        for project in dependency_changes.keys() | changed.by_content.keys()
+        if should_execute(project)
     }
@@ -0,0 +1,53 @@
+"""Lists the `deployment/project.yml` files that are tracked in the git index, without walking the working tree.
+
+The cost of a lookup grows with the number of tracked paths instead of with the size of the directory tree, and it
+never descends into untracked build output.
+"""
+
+import logging
+import os
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from .walker import DEPLOYMENT_FOLDER_NAME, PROJECT_FILE_NAME, IgnoreRules
+
+PROJECT_FILE_PATHSPEC = f":(glob)**/{DEPLOYMENT_FOLDER_NAME}/{PROJECT_FILE_NAME}"
+
+
+def is_git_checkout(root: Path) -> bool:
+    return (root / ".git").exists()
+
+
+def list_tracked_projects(root: Path, ignore: IgnoreRules) -> Optional[list[Path]]:
+    """
+    :param root: the root of the git checkout
+    :param ignore: the rules that determine which directories are pruned, to stay consistent with the file walker
+    :return: the tracked project files that still exist in the working tree, sorted by path. `None` when `root` is
+    not a git checkout or the index can not be read
+    """
+    logger = logging.getLogger("mpyl")
+    if not is_git_checkout(root):
+        logger.debug(f"{root} is not a git checkout, unable to use the git index")
+        return None
+
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--", PROJECT_FILE_PATHSPEC],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        logger.debug(f"Unable to list project files from the git index: {exc}")
+        return None
+
+    files = [
+        file
+        for file in os.fsdecode(result.stdout).split("\0")
+        if file
+        and not ignore.is_file_ignored(file)
+        and os.path.isfile(os.path.join(root, file))
+    ]
+    prefix = "" if str(root) in ("", ".") else str(root)
+    return [Path(prefix, file) for file in sorted(files)]
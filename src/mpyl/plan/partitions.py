@@ -0,0 +1,151 @@
+"""Splits the projects of a stage into partitions of roughly equal cost, to run each partition in a single job.
+
+The cost of a project is the duration of its last successful `build run`, as recorded by `record_duration`.
+Projects that were never run are estimated by their number of deployments, times the average duration of a
+deployment among the projects that were.
+
+Every job of a matrix records the durations of its own projects in its own workspace. To estimate the next plan with
+them, upload `DURATIONS_FILE` as an artifact from each job and pass the downloaded files to
+`mpyl plan discover --durations`, which merges them into the `DURATIONS_FILE` of its workspace. Caching that file
+between workflow runs keeps the durations of projects that were not run recently.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Sequence
+
+from ..constants import RUN_ARTIFACTS_FOLDER
+from ..project import Project
+
+DURATIONS_FILE = Path(RUN_ARTIFACTS_FOLDER) / "cache" / "durations.json"
+RUN_PLAN_PARTITIONS_FILE = Path(RUN_ARTIFACTS_FOLDER) / "run_plan_partitions.json"
+MAX_MATRIX_JOBS = 256
+"""The maximum number of jobs that a GitHub Actions matrix can generate"""
+DEFAULT_DEPLOYMENT_SECONDS = 60.0
+
+
+@dataclass
+class Partition:
+    projects: list[str] = field(default_factory=list)
+    cost: float = 0.0
+
+
+def _is_duration(seconds) -> bool:
+    return (
+        isinstance(seconds, (int, float))
+        and not isinstance(seconds, bool)
+        and math.isfinite(seconds)
+        and seconds >= 0
+    )
+
+
+def load_durations(path: Path = DURATIONS_FILE) -> dict[str, float]:
+    """:return: the recorded durations by project name. Entries that are not a number of seconds are left out"""
+    try:
+        with open(path, encoding="utf-8") as file:
+            durations = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(durations, dict):
+        return {}
+    return {
+        name: float(seconds)
+        for name, seconds in durations.items()
+        if _is_duration(seconds)
+    }
+
+
+def _store_durations(durations: dict[str, float], path: Path):
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        temporary_file = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_file, "w", encoding="utf-8") as file:
+            json.dump(durations, file, sort_keys=True)
+        os.replace(temporary_file, path)
+    except OSError as exc:
+        logging.getLogger("mpyl").debug(f"Unable to store durations in {path}: {exc}")
+
+
+def record_duration(project_name: str, seconds: float, path: Path = DURATIONS_FILE):
+    """Stores the duration of a run of the project, replacing the duration of its previous run"""
+    _store_durations(load_durations(path) | {project_name: round(seconds, 3)}, path)
+
+
+def merge_durations(
+    sources: Sequence[Path], path: Path = DURATIONS_FILE
+) -> dict[str, float]:
+    """Adds the durations that were recorded in other workspaces, like in the jobs of a matrix, to those at `path`.
+    A duration from `sources` replaces the one at `path`, later sources take precedence over earlier ones.
+
+    :return: the merged durations
+    """
+    durations = load_durations(path)
+    for source in sources:
+        durations |= load_durations(source)
+    if sources:
+        _store_durations(durations, path)
+    return durations
+
+
+def estimate_costs(
+    projects: Sequence[Project], durations: dict[str, float]
+) -> dict[str, float]:
+    """:return: the estimated duration of each project, by name"""
+    measured = [project for project in projects if project.name in durations]
+    deployments_measured = sum(max(len(project.deployments), 1) for project in measured)
+    seconds_per_deployment = (
+        sum(durations[project.name] for project in measured) / deployments_measured
+        if deployments_measured
+        else DEFAULT_DEPLOYMENT_SECONDS
+    )
+    return {
+        project.name: durations.get(
+            project.name, max(len(project.deployments), 1) * seconds_per_deployment
+        )
+        for project in projects
+    }
+
+
+def partition(costs: dict[str, float], count: int) -> list[Partition]:
+    """Assigns the most expensive project that is left to the partition with the lowest cost, until all projects are
+    assigned. The number of partitions is limited by the number of projects and by `MAX_MATRIX_JOBS`.
+
+    :param costs: the estimated cost of each project, by name
+    :return: the non empty partitions, most expensive first
+    """
+    partitions = [Partition() for _ in range(min(count, len(costs), MAX_MATRIX_JOBS))]
+    if not partitions:
+        return []
+
+    cheapest_first = [(0.0, index) for index in range(len(partitions))]
+    for name, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        total, index = heapq.heappop(cheapest_first)
+        partitions[index].projects.append(name)
+        partitions[index].cost += cost
+        heapq.heappush(cheapest_first, (total + cost, index))
+
+    return sorted(partitions, key=lambda part: -part.cost)
+
+
+def write_matrix(partitions: list[Partition], path: Path = RUN_PLAN_PARTITIONS_FILE):
+    """Stores the partitions as a matrix for GitHub Actions, to be used as `strategy.matrix: ${{ fromJSON(...) }}`.
+    Every job of the matrix gets the `partition` number, the `projects` to run and their estimated `cost`.
+    """
+    matrix = {
+        "include": [
+            {
+                "partition": index,
+                "projects": part.projects,
+                "cost": round(part.cost, 1),
+            }
+            for index, part in enumerate(partitions)
+        ]
+    }
+    os.makedirs(path.parent, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(matrix, file, separators=(",", ":"))
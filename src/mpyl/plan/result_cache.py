@@ -0,0 +1,177 @@
+"""Cache of discovered run plans.
+
+A plan is determined by the changeset, the contents of the project files, the stages in the run properties, the
+version of MPyL and the fields of its project data classes. A hash of these is the key under which the plan file is
+stored, so that reruns and retries of the same workflow read the plan back instead of discovering it again. Where the
+plan files are kept is up to a `PlanCacheBackend`, `LocalPlanCacheBackend` keeps them in a directory.
+
+Plan files hold pickled projects, so an entry is only loaded when it is signed with the secret of the cache, see
+`plan_cache_secret`. Whoever can write to a backend can not make MPyL unpickle something it did not store itself.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Sequence
+
+from ..constants import RUN_ARTIFACTS_FOLDER
+from ..project import Stage, traefik_companions
+from ..projects.cache import mpyl_version, project_layout
+from ..utilities.repo import Changeset
+
+PLAN_CACHE_FOLDER = Path(RUN_ARTIFACTS_FOLDER) / "cache" / "plans"
+PLAN_CACHE_FORMAT_VERSION = 2
+MAX_CACHED_PLANS = 16
+PLAN_CACHE_SECRET_ENV = "MPYL_PLAN_CACHE_SECRET"
+PLAN_CACHE_SECRET_FILE = Path(RUN_ARTIFACTS_FOLDER) / "cache" / "plan_cache_secret"
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+class PlanCacheBackend(ABC):
+    """Stores plan files by key"""
+
+    @abstractmethod
+    def fetch(self, key: str, destination: Path) -> bool:
+        """
+        :param destination: where to write the plan file that was stored under `key`
+        :return: whether a plan file was stored under `key`
+        """
+
+    @abstractmethod
+    def store(self, key: str, source: Path) -> None:
+        """Stores the plan file at `source` under `key`"""
+
+
+class LocalPlanCacheBackend(PlanCacheBackend):
+    """Keeps the plan files in a directory. Only the most recently used `max_entries` plans are kept."""
+
+    def __init__(
+        self, folder: Path = PLAN_CACHE_FOLDER, max_entries: int = MAX_CACHED_PLANS
+    ) -> None:
+        self._folder = folder
+        self._max_entries = max_entries
+
+    def _entry(self, key: str) -> Path:
+        return self._folder / f"{key}.bin"
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, destination)
+            os.utime(entry)  # marks the entry as recently used
+        except OSError:
+            return False
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        entry = self._entry(key)
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            temporary_file = entry.with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(source, temporary_file)
+            os.replace(temporary_file, entry)
+            self._prune()
+        except OSError as exc:
+            logging.getLogger("mpyl").debug(f"Unable to cache run plan {key}: {exc}")
+
+    def _prune(self):
+        entries = sorted(
+            self._folder.glob("*.bin"),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self._max_entries :]:
+            stale.unlink(missing_ok=True)
+
+
+def plan_cache_key(
+    changeset: Changeset, project_paths: Sequence[Path], stages: Sequence[Stage]
+) -> Optional[str]:
+    """
+    :param project_paths: the `project.yml` files that the plan is discovered from
+    :return: the key of the plan, or `None` when the project files can not be read
+    """
+    digest = hashlib.sha256(
+        "\0".join(
+            [str(PLAN_CACHE_FORMAT_VERSION), mpyl_version(), project_layout()]
+            + [f"{stage.name}\0{stage.icon}" for stage in stages]
+        ).encode()
+    )
+    for file in changeset.sorted_files:
+        digest.update(
+            f"\0{file}\0{changeset.status_of(file)}\0{changeset.renamed_from(file)}".encode()
+        )
+    try:
+        for project_path in sorted(project_paths):
+            digest.update(f"\0{project_path}\0".encode())
+            digest.update(project_path.read_bytes())
+            for companion in traefik_companions(project_path.parent):
+                digest.update(b"\0" + companion.name.encode() + b"\0")
+                digest.update(companion.read_bytes())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def plan_cache_secret(path: Path = PLAN_CACHE_SECRET_FILE) -> bytes:
+    """
+    :return: the secret that entries are signed with. It is read from `MPYL_PLAN_CACHE_SECRET`, which needs to be the
+    same on all machines that share a backend. Without it, a random secret is generated and kept at `path`, so that
+    only the entries that were stored on this machine are loaded
+    """
+    secret = os.environ.get(PLAN_CACHE_SECRET_ENV)
+    if secret:
+        return secret.encode()
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    generated = secrets.token_bytes(32)
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        with os.fdopen(
+            os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb"
+        ) as file:
+            file.write(generated)
+    except FileExistsError:
+        return path.read_bytes()
+    except OSError as exc:
+        logging.getLogger("mpyl").debug(f"Unable to store the plan cache secret: {exc}")
+    return generated
+
+
+def store_plan(
+    plan_cache: PlanCacheBackend, key: str, plan_file: Path, secret: bytes
+) -> None:
+    """Stores the plan file under `key`, preceded by a signature of its contents"""
+    contents = plan_file.read_bytes()
+    entry = plan_file.with_name(f"{plan_file.name}.entry")
+    entry.write_bytes(hmac.digest(secret, contents, "sha256") + contents)
+    plan_cache.store(key, entry)
+
+
+def fetch_plan(
+    plan_cache: PlanCacheBackend, key: str, plan_file: Path, secret: bytes
+) -> bool:
+    """
+    :param plan_file: where to write the plan file that was stored under `key`
+    :return: whether a plan file with a valid signature was stored under `key`
+    """
+    entry = plan_file.with_name(f"{plan_file.name}.entry")
+    if not plan_cache.fetch(key, entry):
+        return False
+    contents = entry.read_bytes()
+    signature, plan = contents[:_SIGNATURE_SIZE], contents[_SIGNATURE_SIZE:]
+    if not hmac.compare_digest(signature, hmac.digest(secret, plan, "sha256")):
+        logging.getLogger("mpyl").warning(
+            f"Ignoring cached run plan {key}, because it is not signed with the secret of this plan cache"
+        )
+        return False
+    plan_file.write_bytes(plan)
+    return True
@@ -0,0 +1,95 @@
+"""The on-disk format of a run plan.
+
+A plan file starts with a fixed size header: a magic number, the version of the format and the length of the table of
+contents that follows it. The table of contents is JSON. Next to the values that the writer put in it, it holds the
+offset and length of every object that was stored in the file. The objects are pickled one by one after the table of
+contents, so a reader that memory maps the file only unpickles the objects that it asks for, no matter how many
+there are.
+"""
+
+import json
+import mmap
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+PLAN_FILE_MAGIC = b"MPYLPLAN"
+PLAN_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHI")
+
+
+def is_plan_file(path: Path) -> bool:
+    """:return: whether the file at `path` is in the format of this module, as opposed to, for example, a pickle"""
+    with open(path, "rb") as file:
+        return file.read(len(PLAN_FILE_MAGIC)) == PLAN_FILE_MAGIC
+
+
+def write_plan_file(path: Path, table: dict, objects: Sequence[Optional[Any]]):
+    """
+    :param table: the table of contents, which must be serializable to JSON
+    :param objects: the objects to store, which are retrieved by their position in this sequence. Positions that are
+    `None` are not stored
+    """
+    pickled = [
+        None if value is None else pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        for value in objects
+    ]
+    offsets: list[Optional[tuple[int, int]]] = []
+    position = 0
+    for data in pickled:
+        if data is None:
+            offsets.append(None)
+        else:
+            offsets.append((position, len(data)))
+            position += len(data)
+
+    contents = json.dumps(table | {"offsets": offsets}, separators=(",", ":")).encode()
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(PLAN_FILE_MAGIC, PLAN_FORMAT_VERSION, len(contents)))
+        file.write(contents)
+        for data in pickled:
+            if data is not None:
+                file.write(data)
+
+
+class PlanFile:
+    """A plan file that is opened for reading. The file is memory mapped, so only the parts that are read are loaded
+    from disk. Use it as a context manager, to release the mapping when done."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as file:
+            self._mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, length = _HEADER.unpack_from(self._mapped)
+            if magic != PLAN_FILE_MAGIC:
+                raise ValueError(f"{path} is not a run plan file")
+            if version != PLAN_FORMAT_VERSION:
+                raise ValueError(
+                    f"Run plan {path} has format version {version}, while this version of MPyL reads version "
+                    f"{PLAN_FORMAT_VERSION}. Discover the run plan again with this version of MPyL"
+                )
+            contents_end = _HEADER.size + length
+            self.table: dict = json.loads(self._mapped[_HEADER.size : contents_end])
+        except (struct.error, ValueError):
+            self._mapped.close()
+            raise
+        self._objects_start = contents_end
+
+    def load(self, position: int) -> Any:
+        """:return: the object that was stored at `position`"""
+        offset = self.table["offsets"][position]
+        if offset is None:
+            raise KeyError(f"No object was stored at position {position}")
+        start = self._objects_start + offset[0]
+        return pickle.loads(self._mapped[start : start + offset[1]])
+
+    def close(self):
+        self._mapped.close()
+
+    def __enter__(self) -> "PlanFile":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,152 @@
+"""In-process, parallel walk over the repository to find all `deployment/project.yml` files.
+
+Top level subtrees are scanned concurrently on a thread pool. `os.scandir` releases the GIL while it waits for the
+file system, so the threads overlap their IO even though the matching itself is pure Python.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+DEPLOYMENT_FOLDER_NAME = "deployment"
+PROJECT_FILE_NAME = "project.yml"
+
+DEFAULT_IGNORED_DIRECTORIES = frozenset(
+    {".git", ".mpyl", "node_modules", "target", "__pycache__"}
+)
+"""Directories that never contain projects: VCS metadata, MPyL run artifacts and build output"""
+
+
+@dataclass(frozen=True)
+class IgnoreRules:
+    names: frozenset[str] = DEFAULT_IGNORED_DIRECTORIES
+    """Directory names that are pruned wherever they occur"""
+    patterns: tuple[str, ...] = ()
+    """Glob patterns, matched against both the directory name and its path relative to the root"""
+
+    @staticmethod
+    def from_patterns(patterns: Iterable[str]) -> "IgnoreRules":
+        literal = set(DEFAULT_IGNORED_DIRECTORIES)
+        globs = []
+        for pattern in patterns:
+            pattern = pattern.strip().rstrip("/")
+            if not pattern:
+                continue
+            if any(char in pattern for char in "*?[") or "/" in pattern:
+                globs.append(pattern)
+            else:
+                literal.add(pattern)
+        return IgnoreRules(names=frozenset(literal), patterns=tuple(globs))
+
+    def is_ignored(self, name: str, relative_path: str) -> bool:
+        if name in self.names:
+            return True
+        return any(
+            fnmatchcase(name, pattern) or fnmatchcase(relative_path, pattern)
+            for pattern in self.patterns
+        )
+
+    def is_file_ignored(self, relative_path: str) -> bool:
+        """Whether any of the directories leading up to the file at `relative_path` is ignored"""
+        directories = relative_path.split("/")[:-1]
+        return any(
+            self.is_ignored(name, "/".join(directories[: index + 1]))
+            for index, name in enumerate(directories)
+        )
+
+
+def is_project_file(relative_path: str) -> bool:
+    return relative_path == f"{DEPLOYMENT_FOLDER_NAME}/{PROJECT_FILE_NAME}" or (
+        relative_path.endswith(f"/{DEPLOYMENT_FOLDER_NAME}/{PROJECT_FILE_NAME}")
+    )
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    subdirectories: tuple[str, ...]
+    """Relative paths of the subdirectories that are not ignored"""
+    has_project_file: bool
+    """Whether this is a `deployment` folder that contains a `project.yml`"""
+
+
+Lister = Callable[[str], Optional[DirectoryListing]]
+
+
+def list_directory(
+    root: str, relative_path: str, ignore: IgnoreRules
+) -> Optional[DirectoryListing]:
+    """Lists a single directory. Returns `None` when the directory can not be read."""
+    absolute_path = os.path.join(root, relative_path) if relative_path else root
+    is_deployment_folder = (
+        os.path.basename(relative_path) == DEPLOYMENT_FOLDER_NAME
+        if relative_path
+        else os.path.basename(os.path.abspath(root)) == DEPLOYMENT_FOLDER_NAME
+    )
+    subdirectories = []
+    has_project_file = False
+    try:
+        with os.scandir(absolute_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    path = (
+                        f"{relative_path}/{entry.name}" if relative_path else entry.name
+                    )
+                    if not ignore.is_ignored(entry.name, path):
+                        subdirectories.append(path)
+                elif is_deployment_folder and entry.name == PROJECT_FILE_NAME:
+                    has_project_file = True
+    except OSError:
+        return None
+    return DirectoryListing(tuple(subdirectories), has_project_file)
+
+
+def walk_subtree(start: str, lister: Lister) -> list[str]:
+    """Depth first walk from `start`. Returns the relative paths of all project files below it."""
+    found = []
+    stack = [start]
+    while stack:
+        current = stack.pop()
+        listing = lister(current)
+        if listing is None:
+            continue
+        if listing.has_project_file:
+            found.append(f"{current}/{PROJECT_FILE_NAME}")
+        stack.extend(listing.subdirectories)
+    return found
+
+
+def walk(
+    root: Path,
+    ignore: IgnoreRules,
+    lister: Optional[Lister] = None,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """
+    Find all `deployment/project.yml` files below `root`
+    :param root: the directory to start from
+    :param ignore: the rules that determine which directories are pruned
+    :param lister: lists a single directory, given its path relative to `root`. Defaults to `list_directory`
+    :param max_workers: the number of threads used to scan the top level subtrees
+    :return: the project files, sorted by path. Relative to `root` when `root` is the working directory
+    """
+    root_path = str(root)
+    directory_lister: Lister = lister or (
+        lambda relative_path: list_directory(root_path, relative_path, ignore)
+    )
+    top_level = directory_lister("")
+    if top_level is None:
+        return []
+
+    found = [PROJECT_FILE_NAME] if top_level.has_project_file else []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for files in executor.map(
+            lambda subtree: walk_subtree(subtree, directory_lister),
+            top_level.subdirectories,
+        ):
+            found.extend(files)
+
+    prefix = "" if root_path in ("", ".") else root_path
+    return [Path(prefix, file) for file in sorted(found)]
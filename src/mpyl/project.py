@@ -11,31 +11,92 @@ in the `deployment/project.yml`. It defines how the source code to which it rela
 </details>
 
 .. include:: ../../README-dev.md
-"""
+"""  # pylint: disable=too-many-lines
 
 import logging
-import pkgutil
+import os
+import pickle
+import sys
 import time
 import traceback
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Optional, TypeVar, Any, List
-
-import jsonschema
-from mypy.checker import Generic
-from ruamel.yaml import YAML
+from typing import Optional, TypeVar, Any, Generic, List
 
 from .constants import RUN_ARTIFACTS_FOLDER
-from .validation import validate
+from .utilities.lazy_import import lazy_import
+from .utilities.yaml import load_read_only
+from .validation import PROJECT_SCHEMA, validate_with_schema
+
+# only needed when a project does not comply with the schema
+jsonschema = lazy_import("jsonschema")
 
 T = TypeVar("T")
+TRAEFIK_COMPANION_SUFFIX = "-traefik.yml"
 
 
 def without_keys(dictionary: dict, keys: set[str]):
     return {k: dictionary[k] for k in dictionary.keys() - keys}
 
 
+def intern_value(value):
+    """Interns plain strings, so that values that recur in many projects, like stage and maintainer names, are held
+    in memory and pickled only once. Other values, including `str` subclasses, are returned as is.
+    """
+    # pylint: disable-next=unidiomatic-typecheck
+    return sys.intern(value) if type(value) is str else value
+
+
+def _values_of_attributes(cls: type, attributes: dict) -> list:
+    """:return: the values of the fields of `cls` in the attribute dictionary of an instance that was pickled before
+    the class had slots. Attributes that were renamed or added since are filled in by `_upgrade_attributes`, when the
+    class has it, and by the defaults of the fields"""
+    upgrade = getattr(cls, "_upgrade_attributes", None)
+    remaining = dict(upgrade(attributes) if upgrade else attributes)
+    values = []
+    for class_field in fields(cls):
+        if class_field.name in remaining:
+            values.append(remaining.pop(class_field.name))
+        elif class_field.default is not MISSING:
+            values.append(class_field.default)
+        elif class_field.default_factory is not MISSING:
+            values.append(class_field.default_factory())
+        else:
+            raise pickle.UnpicklingError(
+                f"Pickled {cls.__name__} has no value for {class_field.name}, it was pickled by another version of "
+                f"MPyL"
+            )
+    if remaining:
+        raise pickle.UnpicklingError(
+            f"Pickled {cls.__name__} has unknown attributes {sorted(remaining)}, it was pickled by another version of "
+            f"MPyL"
+        )
+    return values
+
+
+def _set_fields(self, state) -> None:
+    class_fields = fields(self)
+    if isinstance(state, dict):
+        state = _values_of_attributes(type(self), state)
+    if not isinstance(state, (list, tuple)) or len(state) != len(class_fields):
+        raise pickle.UnpicklingError(
+            f"Pickled {type(self).__name__} does not match its fields, it was pickled by another version of MPyL"
+        )
+    for class_field, value in zip(class_fields, state):
+        object.__setattr__(self, class_field.name, value)
+
+
+def _checked_pickle(cls):
+    """Makes unpickling a frozen, slotted data class fail when the pickle does not hold a value for each of its fields.
+    The generated `__setstate__` assigns whatever it is given to the fields in order, so a pickle of an earlier layout
+    of the class would otherwise load with its values in the wrong fields. The attribute dictionaries that were pickled
+    before the classes had slots are assigned by name instead, see `_values_of_attributes`.
+    """
+    cls.__setstate__ = _set_fields
+    return cls
+
+
 @dataclass(frozen=True)
 class Target(Enum):
     def __eq__(self, other):
@@ -63,7 +124,8 @@ class Target(Enum):
     PRODUCTION = "Production"
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Stage:
     name: str
     icon: str
@@ -72,7 +134,8 @@ class Stage:
         return f"{self.icon} {self.name.capitalize()}"
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class TargetProperty(Generic[T]):
     pr: Optional[T]  # pylint: disable=invalid-name
     test: Optional[T]
@@ -98,31 +161,33 @@ class TargetProperty(Generic[T]):
         if not values:
             return None
         return TargetProperty(
-            pr=values.get("pr"),
-            test=values.get("test"),
-            acceptance=values.get("acceptance"),
-            production=values.get("production"),
-            all=values.get("all"),
+            pr=intern_value(values.get("pr")),
+            test=intern_value(values.get("test")),
+            acceptance=intern_value(values.get("acceptance")),
+            production=intern_value(values.get("production")),
+            all=intern_value(values.get("all")),
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class KeyValueProperty(TargetProperty[str]):
     key: str
 
     @staticmethod
     def from_config(values: dict):
         return KeyValueProperty(
-            key=values["key"],
-            pr=values.get("pr"),
-            test=values.get("test"),
-            acceptance=values.get("acceptance"),
-            production=values.get("production"),
-            all=values.get("all"),
+            key=intern_value(values["key"]),
+            pr=intern_value(values.get("pr")),
+            test=intern_value(values.get("test")),
+            acceptance=intern_value(values.get("acceptance")),
+            production=intern_value(values.get("production")),
+            all=intern_value(values.get("all")),
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class KeyValueRef:
     key: str
     value_from: dict
@@ -138,7 +203,8 @@ class KeyValueRef:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class EnvCredential:
     key: str
     secret_id: str
@@ -152,7 +218,8 @@ class EnvCredential:
         return EnvCredential(key, secret_id)
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class StageSpecificProperty(Generic[T]):
     stages: dict[str, Optional[T]]
 
@@ -162,17 +229,23 @@ class StageSpecificProperty(Generic[T]):
         return self.stages[stage]
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Stages(StageSpecificProperty[str]):
     def all(self) -> dict[str, Optional[str]]:
         return self.stages
 
     @staticmethod
     def from_config(values: dict):
-        return Stages(values)
+        if not values:
+            return Stages(values)
+        return Stages(
+            {intern_value(stage): intern_value(step) for stage, step in values.items()}
+        )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Dependencies(StageSpecificProperty[set[str]]):
     def set_for_stage(self, stage: str) -> set[str]:
         deps_for_stage = self.for_stage(stage)
@@ -183,17 +256,27 @@ class Dependencies(StageSpecificProperty[set[str]]):
 
     @staticmethod
     def from_config(values: dict):
-        return Dependencies(values)
+        stages: dict = {
+            intern_value(stage): (
+                [intern_value(path) for path in paths]
+                if isinstance(paths, list)
+                else paths
+            )
+            for stage, paths in values.items()
+        }
+        return Dependencies(stages)
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Env:
     @staticmethod
     def from_config(values: list[dict]):
         return list(map(KeyValueProperty.from_config, values))
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Properties:
     env: list[KeyValueProperty]
     sealed_secrets: list[KeyValueProperty]
@@ -210,7 +293,8 @@ class Properties:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Probe:
     path: TargetProperty[str]
     values: dict
@@ -222,7 +306,8 @@ class Probe:
         return Probe(path=TargetProperty.from_config(values["path"]), values=values)
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Alert:
     name: str
     expr: str
@@ -244,7 +329,8 @@ class Alert:
         return Alert(name, expr, for_duration, description, severity)
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Metrics:
     path: str
     port: Optional[str]
@@ -263,7 +349,8 @@ class Metrics:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class ResourceSpecification:
     cpus: Optional[TargetProperty[float]]
     mem: Optional[TargetProperty[int]]
@@ -278,7 +365,8 @@ class ResourceSpecification:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Resources:
     instances: Optional[TargetProperty[int]]
     limit: Optional[ResourceSpecification]
@@ -293,7 +381,8 @@ class Resources:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Job:
     cron: TargetProperty[dict]
     job: dict
@@ -308,7 +397,8 @@ class Job:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Kubernetes:
     port_mappings: dict[int, int]
     liveness_probe: Optional[Probe]
@@ -341,7 +431,8 @@ class Kubernetes:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class KubernetesCommon:
     namespace: TargetProperty[str]
 
@@ -352,7 +443,8 @@ class KubernetesCommon:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class TraefikAdditionalRoute:
     name: str
     middlewares: list[str]
@@ -369,7 +461,8 @@ class TraefikAdditionalRoute:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class TraefikHost:
     host: TargetProperty[str]
     service_port: Optional[int]
@@ -396,7 +489,8 @@ class TraefikHost:
         )
 
 
-@dataclass
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class DagsterSecret:
     name: str
 
@@ -405,7 +499,8 @@ class DagsterSecret:
         return DagsterSecret(name=values.get("name", ""))
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Dagster:
     repo: str
     secrets: List[DagsterSecret]
@@ -420,7 +515,8 @@ class Dagster:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Traefik:
     hosts: list[TraefikHost]
     ingress_routes: Optional[TargetProperty[dict]]
@@ -436,15 +532,23 @@ class Traefik:
         )
 
 
-@dataclass(frozen=True)
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
 class Deployment:
     name: str
     properties: Optional[Properties]
     _kubernetes: Optional[Kubernetes]
-    traefik: Optional[Traefik]
+    _traefik: Optional[Traefik]
+    _traefik_file: Optional[Path] = None
+    """A `<deployment>-traefik.yml` companion that replaces the traefik configuration of the `project.yml`. It is only
+    parsed when `traefik` is first accessed, because planning a run never needs it."""
+    _companion: list[Optional[Traefik]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    """The parsed traefik configuration of the companion, empty until it is parsed"""
 
     @staticmethod
-    def from_config(values: dict):
+    def from_config(values: dict, traefik_file: Optional[Path] = None):
         props = values.get("properties")
         kubernetes = values.get("kubernetes")
         traefik = values.get("traefik")
@@ -453,9 +557,38 @@ class Deployment:
             name=values["name"].lower(),
             properties=Properties.from_config(props) if props else None,
             _kubernetes=Kubernetes.from_config(kubernetes) if kubernetes else None,
-            traefik=Traefik.from_config(traefik) if traefik else None,
+            _traefik=Traefik.from_config(traefik) if traefik else None,
+            _traefik_file=traefik_file,
         )
 
+    @staticmethod
+    def _upgrade_attributes(attributes: dict) -> dict:
+        # before the traefik companions were parsed on access, the traefik configuration was a plain attribute
+        return without_keys(attributes, {"traefik"}) | {
+            "_traefik": attributes.get("traefik")
+        }
+
+    @property
+    def traefik(self) -> Optional[Traefik]:
+        """:raises ValueError: when the companion file can not be read or does not hold a traefik configuration"""
+        if self._traefik_file is None:
+            return self._traefik
+        if not self._companion:
+            try:
+                # unlike `load_traefik_config`, a companion that was removed since the project was loaded is an error
+                with open(self._traefik_file, "rb") as file:
+                    traefik_config = load_read_only(file)
+                traefik = self._traefik
+                if traefik_config:
+                    values = traefik_config["traefik"]
+                    traefik = Traefik.from_config(values) if values else None
+            except Exception as exc:
+                raise ValueError(
+                    f"Failed to load {self._traefik_file} of deployment {self.name}"
+                ) from exc
+            self._companion.append(traefik)
+        return self._companion[0]
+
     def has_kubernetes(self) -> bool:
         return self._kubernetes is not None
 
@@ -469,18 +602,33 @@ class Deployment:
         return self._kubernetes
 
 
-@dataclass(frozen=True)
-class Project:
+def _maintainers(values: dict) -> list[str]:
+    maintainers = values.get("maintainer", [])
+    if not isinstance(maintainers, list):
+        return maintainers
+    return [intern_value(maintainer) for maintainer in maintainers]
+
+
+def _deployment_values(values: dict) -> list[dict]:
+    deployment_old = values.get("deployment")  # deprecated, can be removed in a month
+    return [deployment_old] if deployment_old else values.get("deployments", [])
+
+
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
+class ProjectHeader:
+    """The parts of a `Project` that are needed to plan a run. Loading a header skips the deployments and their
+    traefik configuration. Use `ProjectHeader.load` to upgrade it to the full `Project`.
+    """
+
     name: str
-    description: str
     path: str
     pipeline: Optional[str]
     stages: Stages
     maintainer: list[str]
-    deployments: list[Deployment]
     dependencies: Optional[Dependencies]
     kubernetes: Optional[KubernetesCommon]
-    _dagster: Optional[Dagster]
+    _deployment_names: tuple[str, ...] = field(default=(), kw_only=True)
 
     def __lt__(self, other):
         return self.path < other.path
@@ -499,18 +647,8 @@ class Project:
         )
 
     @property
-    def dagster(self) -> Dagster:
-        if self._dagster is None:
-            raise KeyError(f"Project '{self.name}' does not have dagster configuration")
-        return self._dagster
-
-    @staticmethod
-    def project_yaml_file_name() -> str:
-        return "project.yml"
-
-    @staticmethod
-    def traefik_yaml_file_name(deployment_name: str) -> str:
-        return f"{deployment_name}-traefik.yml"
+    def deployment_names(self) -> list[str]:
+        return list(self._deployment_names)
 
     @property
     def root_path(self) -> Path:
@@ -528,8 +666,125 @@ class Project:
     def test_report_path(self) -> Path:
         return Path(self.root_path) / "target/test-reports"
 
+    def load(self, validate_project_yaml: bool = False, log: bool = True) -> "Project":
+        return load_project(Path(self.path), validate_project_yaml, log)
+
     @staticmethod
     def from_config(values: dict, project_path: Path):
+        kubernetes_values = values.get("kubernetes", {})
+        deployment_old = values.get("deployment", {})
+        if deployment_old and deployment_old.get("namespace"):
+            kubernetes_values = kubernetes_values | {
+                "namespace": {"all": deployment_old["namespace"]}
+            }
+        dependencies = values.get("dependencies")
+
+        return ProjectHeader(
+            name=values["name"],
+            path=str(project_path),
+            pipeline=intern_value(values.get("pipeline")),
+            stages=Stages.from_config(values.get("stages", {})),
+            maintainer=_maintainers(values),
+            dependencies=(
+                Dependencies.from_config(dependencies) if dependencies else None
+            ),
+            kubernetes=KubernetesCommon.from_config(kubernetes_values),
+            _deployment_names=tuple(
+                (deployment.get("name") or values["name"]).lower()
+                for deployment in _deployment_values(values)
+            ),
+        )
+
+
+@_checked_pickle
+@dataclass(frozen=True, eq=False, slots=True)
+class Project(ProjectHeader):
+    description: str
+    deployments: list[Deployment]
+    _dagster: Optional[Dagster]
+    _resolved: dict[Target, "ResolvedProject"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self):
+        # the resolved views are derived from the other fields, so they are not pickled
+        return [
+            (
+                {}
+                if project_field.name == "_resolved"
+                else getattr(self, project_field.name)
+            )
+            for project_field in fields(self)
+        ]
+
+    @staticmethod
+    def _upgrade_attributes(attributes: dict) -> dict:
+        # before there were project headers, the names of the deployments were not stored separately
+        return attributes | {
+            "_deployment_names": tuple(
+                deployment.name for deployment in attributes.get("deployments", [])
+            )
+        }
+
+    def resolve(self, target: Target) -> "ResolvedProject":
+        """
+        :return: the values of this project for `target`. They are resolved on the first call and cached for the
+        lifetime of the project
+        """
+        resolved = self._resolved.get(target)
+        if resolved is None:
+            resolved = ResolvedProject(
+                target=target,
+                namespace=self.namespace(target),
+                deployments=tuple(
+                    ResolvedDeployment.from_deployment(deployment, target)
+                    for deployment in self.deployments
+                ),
+            )
+            self._resolved[target] = resolved
+        return resolved
+
+    @property
+    def deployment_names(self) -> list[str]:
+        return [deployment.name for deployment in self.deployments]
+
+    @property
+    def header(self) -> ProjectHeader:
+        return ProjectHeader(
+            name=self.name,
+            path=self.path,
+            pipeline=self.pipeline,
+            stages=self.stages,
+            maintainer=self.maintainer,
+            dependencies=self.dependencies,
+            kubernetes=self.kubernetes,
+            _deployment_names=tuple(self.deployment_names),
+        )
+
+    @property
+    def dagster(self) -> Dagster:
+        if self._dagster is None:
+            raise KeyError(f"Project '{self.name}' does not have dagster configuration")
+        return self._dagster
+
+    @staticmethod
+    def project_yaml_file_name() -> str:
+        return "project.yml"
+
+    @staticmethod
+    def traefik_yaml_file_name(deployment_name: str) -> str:
+        return f"{deployment_name}{TRAEFIK_COMPANION_SUFFIX}"
+
+    @staticmethod
+    def from_config(
+        values: dict,
+        project_path: Path,
+        traefik_files: Optional[dict[str, Path]] = None,
+    ):
+        """
+        :param traefik_files: the traefik companions of the deployments, by deployment name, which are parsed when
+        their traefik configuration is first accessed
+        """
         kubernetes_values = values.get("kubernetes", {})
         dagster = values.get("dagster")
         deployment_old = values.get("deployment", {})
@@ -550,7 +805,13 @@ class Project:
         else:
             deployment_list = values.get("deployments", [])
         deployments = [
-            Deployment.from_config(deployment) for deployment in deployment_list
+            Deployment.from_config(
+                deployment,
+                (traefik_files or {}).get(
+                    deployment.get("name") or values.get("name", "")
+                ),
+            )
+            for deployment in deployment_list
         ]
         dependencies = values.get("dependencies")
 
@@ -558,9 +819,9 @@ class Project:
             name=values["name"],
             description=values["description"],
             path=str(project_path),
-            pipeline=values.get("pipeline"),
+            pipeline=intern_value(values.get("pipeline")),
             stages=Stages.from_config(values.get("stages", {})),
-            maintainer=values.get("maintainer", []),
+            maintainer=_maintainers(values),
             deployments=deployments,
             dependencies=(
                 Dependencies.from_config(dependencies) if dependencies else None
@@ -570,26 +831,182 @@ class Project:
         )
 
 
+def _resolve(
+    target_property: Optional[TargetProperty[T]], target: Target
+) -> Optional[T]:
+    return target_property.get_value(target) if target_property else None
+
+
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
+class ResolvedTraefikHost:
+    """A `TraefikHost` with its values for a single target"""
+
+    host: Optional[str]
+    service_port: Optional[int]
+    has_swagger: bool
+    tls: Optional[str]
+    whitelists: Optional[list[str]]
+    priority: Optional[int]
+    has_priority: bool
+    """Whether a priority is configured, even if it has no value for the target"""
+    insecure: bool
+    additional_route: Optional[str]
+    syntax: Optional[str]
+
+    @staticmethod
+    def from_host(host: TraefikHost, target: Target) -> "ResolvedTraefikHost":
+        return ResolvedTraefikHost(
+            host=_resolve(host.host, target),
+            service_port=host.service_port,
+            has_swagger=host.has_swagger,
+            tls=_resolve(host.tls, target),
+            whitelists=_resolve(host.whitelists, target),
+            priority=_resolve(host.priority, target),
+            has_priority=host.priority is not None,
+            insecure=host.insecure,
+            additional_route=host.additional_route,
+            syntax=_resolve(host.syntax, target),
+        )
+
+
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
+class ResolvedDeployment:
+    """A `Deployment` with its values for a single target"""
+
+    deployment: Deployment
+    env: tuple[tuple[str, Optional[str]], ...]
+    """The environment variables in the order in which they are declared, including those without a value"""
+    sealed_secrets: tuple[tuple[str, Optional[str]], ...]
+    """The sealed secrets in the order in which they are declared, including those without a value"""
+    command: Optional[str]
+    args: Optional[str]
+    cron: Optional[dict]
+    hosts: tuple[ResolvedTraefikHost, ...]
+    ingress_routes: Optional[dict]
+    middlewares: Optional[list[dict]]
+
+    @property
+    def name(self) -> str:
+        return self.deployment.name
+
+    @staticmethod
+    def from_deployment(deployment: Deployment, target: Target) -> "ResolvedDeployment":
+        properties = deployment.properties
+        kubernetes = deployment.kubernetes if deployment.has_kubernetes() else None
+        traefik = deployment.traefik
+        return ResolvedDeployment(
+            deployment=deployment,
+            env=tuple(
+                (env.key, env.get_value(target))
+                for env in (properties.env if properties else [])
+            ),
+            sealed_secrets=tuple(
+                (secret.key, secret.get_value(target))
+                for secret in (properties.sealed_secrets if properties else [])
+            ),
+            command=_resolve(kubernetes.command, target) if kubernetes else None,
+            args=_resolve(kubernetes.args, target) if kubernetes else None,
+            cron=(
+                _resolve(kubernetes.job.cron, target)
+                if kubernetes and kubernetes.job
+                else None
+            ),
+            hosts=tuple(
+                ResolvedTraefikHost.from_host(host, target)
+                for host in (traefik.hosts if traefik else [])
+            ),
+            ingress_routes=(
+                _resolve(traefik.ingress_routes, target) if traefik else None
+            ),
+            middlewares=_resolve(traefik.middlewares, target) if traefik else None,
+        )
+
+
+@_checked_pickle
+@dataclass(frozen=True, slots=True)
+class ResolvedProject:
+    """The values of a `Project` for a single target, as returned by `Project.resolve`"""
+
+    target: Target
+    namespace: str
+    deployments: tuple[ResolvedDeployment, ...]
+
+    def for_deployment(self, deployment: Deployment) -> ResolvedDeployment:
+        return next(
+            (
+                resolved
+                for resolved in self.deployments
+                if resolved.deployment is deployment
+            ),
+            None,
+        ) or ResolvedDeployment.from_deployment(deployment, self.target)
+
+
 def validate_project(yaml_values: dict) -> dict:
     """
     :type yaml_values: the yaml dictionary to validate
     :return: the validated schema
     :raises `jsonschema.exceptions.ValidationError` when validation fails
     """
-    template = pkgutil.get_data(__name__, "schema/project.schema.yml")
-    if not template:
-        raise ValueError("Schema project.schema.yml not found in package")
-    validate(yaml_values, template.decode("utf-8"))
+    validate_with_schema(yaml_values, PROJECT_SCHEMA)
 
     return yaml_values
 
 
-def load_traefik_config(traefik_path: Path, loader: YAML) -> Optional[dict]:
+def load_traefik_config(traefik_path: Path) -> Optional[dict]:
     if not traefik_path.exists():
         return None
 
-    with open(traefik_path, encoding="utf-8") as file:
-        return loader.load(file)
+    with open(traefik_path, "rb") as file:
+        return load_read_only(file)
+
+
+def traefik_companions(deployment_path: Path) -> tuple[Path, ...]:
+    """
+    :param deployment_path: the folder of a `project.yml`
+    :return: the `*-traefik.yml` companions in the folder, which is listed once, instead of looking for the companion
+    of every deployment separately. The folder is listed again on every call, so that the keys of the caches that are
+    derived from the companions see the companions that were added since
+    """
+    try:
+        with os.scandir(deployment_path) as entries:
+            return tuple(
+                sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(TRAEFIK_COMPANION_SUFFIX) and entry.is_file()
+                )
+            )
+    except OSError:
+        return ()
+
+
+def _traefik_files(project_path: Path, yaml_values: dict) -> dict[str, Path]:
+    companions = {
+        companion.name: companion
+        for companion in traefik_companions(project_path.parent)
+    }
+    traefik_files = {}
+    for deployment in _deployment_values(yaml_values):
+        deployment_name = deployment.get("name") or yaml_values.get("name", "")
+        companion = companions.get(Project.traefik_yaml_file_name(deployment_name))
+        if companion:
+            traefik_files[deployment_name] = companion
+    return traefik_files
+
+
+def _merge_traefik_files(yaml_values: dict, traefik_files: dict[str, Path]) -> None:
+    for deployment in _deployment_values(yaml_values):
+        deployment_name = deployment.get("name") or yaml_values.get("name", "")
+        traefik_config = (
+            load_traefik_config(traefik_files[deployment_name])
+            if deployment_name in traefik_files
+            else None
+        )
+        if traefik_config:
+            deployment["traefik"] = traefik_config["traefik"]
 
 
 def load_project(  # pylint: disable=too-many-locals
@@ -605,32 +1022,18 @@ def load_project(  # pylint: disable=too-many-locals
     :return: `Project` data class
     """
     log_level = logging.WARNING if log else logging.DEBUG
-    with open(project_path, encoding="utf-8") as file:
+    with open(project_path, "rb") as file:
         try:
             start = time.time()
-            loader: YAML = YAML()
-            yaml_values: dict = loader.load(file)
-
-            deployment_old = yaml_values.get(
-                "deployment"
-            )  # deprecated, can be removed in a month
-            deployments = (
-                [deployment_old]
-                if deployment_old
-                else yaml_values.get("deployments", [])
-            )
-            for deployment in deployments:
-                deployment_name = deployment.get("name") or yaml_values.get("name", "")
-                traefik_config = load_traefik_config(
-                    project_path.parent
-                    / Project.traefik_yaml_file_name(deployment_name),
-                    loader,
-                )
-                if traefik_config:
-                    deployment["traefik"] = traefik_config["traefik"]
+            yaml_values: dict = load_read_only(file)
+
+            traefik_files = _traefik_files(project_path, yaml_values)
             if validate_project_yaml:
+                # the schema covers the traefik configuration, so the companions are validated along with the project
+                _merge_traefik_files(yaml_values, traefik_files)
+                traefik_files = {}
                 validate_project(yaml_values)
-            project = Project.from_config(yaml_values, project_path)
+            project = Project.from_config(yaml_values, project_path, traefik_files)
             logging.debug(
                 f"Loaded project {project.path} in {(time.time() - start) * 1000} ms"
             )
@@ -647,3 +1050,20 @@ def load_project(  # pylint: disable=too-many-locals
         except Exception:
             logging.log(log_level, f"Failed to load {project_path}", exc_info=True)
             raise
+
+
+def load_project_header(project_path: Path, log: bool = True) -> ProjectHeader:
+    """
+    Load the parts of a `project.yml` that are needed to plan a run, without validating it against the schema and
+    without reading the traefik configuration of its deployments
+    :param project_path: path to the `project.yml`
+    :param log: indicates whether problems should be logged as warning
+    :return: `ProjectHeader` data class
+    """
+    log_level = logging.WARNING if log else logging.DEBUG
+    with open(project_path, "rb") as file:
+        try:
+            return ProjectHeader.from_config(load_read_only(file), project_path)
+        except Exception:
+            logging.log(log_level, f"Failed to load {project_path}", exc_info=True)
+            raise
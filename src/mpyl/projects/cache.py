@@ -0,0 +1,151 @@
+"""Content addressed, on disk cache of loaded projects.
+
+An entry is keyed by a hash of everything that determines the outcome of loading a project: the bytes of its
+`project.yml` and `*-traefik.yml` companions, the schemas that are bundled with MPyL, the MPyL version and the fields
+of the project data classes. The fields are part of the key because the version does not change in a development
+install, while a pickle of classes with other fields can not be loaded. Unchanged
+projects are read back from a pickle, which skips parsing, schema validation and building the data classes.
+Entries are evicted in least recently used order once the cache outgrows its size limit.
+"""
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import pickle
+import pkgutil
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from .. import project
+from ..constants import RUN_ARTIFACTS_FOLDER
+from ..project import traefik_companions
+
+PROJECT_CACHE_FOLDER = Path(RUN_ARTIFACTS_FOLDER) / "cache" / "projects"
+CACHE_FORMAT_VERSION = 3
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+_SCHEMA_FOLDER = Path(__file__).parent.parent / "schema"
+
+
+@lru_cache(maxsize=1)
+def mpyl_version() -> str:
+    try:
+        return importlib.metadata.version("mpyl")
+    except importlib.metadata.PackageNotFoundError:
+        releases = pkgutil.get_data(__name__, "releases/releases.txt") or b""
+        lines = releases.decode("utf-8").split()
+        return lines[-1] if lines else "unknown"
+
+
+@lru_cache(maxsize=1)
+def _schemas_digest() -> str:
+    digest = hashlib.sha256()
+    for schema in sorted(_SCHEMA_FOLDER.glob("*.schema.yml")):
+        digest.update(schema.name.encode())
+        digest.update(schema.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def project_layout() -> str:
+    """:return: a digest of the names of the data classes in `mpyl.project` and of their fields, in order"""
+    digest = hashlib.sha256()
+    for name, value in sorted(vars(project).items()):
+        if isinstance(value, type) and is_dataclass(value):
+            digest.update(f"{name}({','.join(f.name for f in fields(value))})".encode())
+    return digest.hexdigest()
+
+
+class ProjectCache:
+    def __init__(
+        self, folder: Path = PROJECT_CACHE_FOLDER, max_bytes: int = MAX_CACHE_BYTES
+    ) -> None:
+        self._folder = folder
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, project_path: Path, variant: str) -> Optional[str]:
+        """
+        :param project_path: path to the `project.yml`
+        :param variant: distinguishes the ways a project can be loaded, like with or without schema validation
+        :return: the key of the cache entry, or `None` when the project files can not be read
+        """
+        digest = hashlib.sha256(
+            "\0".join(
+                [
+                    str(CACHE_FORMAT_VERSION),
+                    mpyl_version(),
+                    project_layout(),
+                    _schemas_digest(),
+                    variant,
+                    str(project_path),
+                ]
+            ).encode()
+        )
+        try:
+            digest.update(project_path.read_bytes())
+            for companion in traefik_companions(project_path.parent):
+                digest.update(b"\0" + companion.name.encode() + b"\0")
+                digest.update(companion.read_bytes())
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self._folder / f"{key}.pickle"
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entry(key)
+        try:
+            with open(entry, "rb") as file:
+                value = pickle.load(file)
+            os.utime(entry)  # marks the entry as recently used
+        except Exception:  # pylint: disable=broad-except
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        entry = self._entry(key)
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            temporary_file = entry.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_file, "wb") as file:
+                pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_file, entry)
+        except (OSError, pickle.PicklingError) as exc:
+            logging.getLogger("mpyl").debug(f"Unable to cache {key}: {exc}")
+
+    def prune(self) -> int:
+        """Removes the least recently used entries until the cache fits within its size limit
+        :return: the number of removed entries"""
+        try:
+            with os.scandir(self._folder) as entries:
+                files = [
+                    (stat.st_mtime_ns, stat.st_size, entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".pickle")
+                    for stat in [entry.stat()]
+                ]
+        except OSError:
+            return 0
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self._max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def log_stats(self, logger: logging.Logger) -> None:
+        logger.info(f"Project cache: {self.hits} hits, {self.misses} misses")
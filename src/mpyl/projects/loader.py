@@ -0,0 +1,165 @@
+"""Loads the project files of a repository in parallel.
+
+Parsing YAML is CPU bound, so the project files are divided into chunks that are loaded on a process pool. Results
+are returned in the order of the paths that were passed in, regardless of the order in which the chunks complete, and
+every file that fails to load is reported, instead of only the first one.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Generic, Optional, Sequence, TypeVar, Union
+
+from .cache import ProjectCache
+from ..project import Project, ProjectHeader, load_project, load_project_header
+from ..utilities.lazy_import import lazy_import
+
+jsonschema = lazy_import("jsonschema")
+
+WORKERS_ENV_VAR = "MPYL_WORKERS"
+CHUNK_SIZE = 25
+"""The number of project files that a worker loads at once, to amortize the cost of sending work to a process"""
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class LoadFailure:
+    path: Path
+    message: str
+
+
+@dataclass(frozen=True)
+class LoadResult(Generic[T]):
+    loaded: list[T]
+    """The successfully loaded projects, in the order of the paths they were loaded from"""
+    failures: list[LoadFailure]
+    """The paths that could not be loaded, in the order they were passed in"""
+
+    def raise_on_failure(self) -> list[T]:
+        """
+        :return: the loaded projects
+        :raises ValueError: listing every project that failed to load
+        """
+        if self.failures:
+            details = "\n".join(
+                f"  {failure.path}: {failure.message}" for failure in self.failures
+            )
+            raise ValueError(
+                f"Failed to load {len(self.failures)} project(s):\n{details}"
+            )
+        return self.loaded
+
+
+def workers_from_environment() -> Optional[int]:
+    value = os.environ.get(WORKERS_ENV_VAR)
+    return int(value) if value else None
+
+
+def _load_chunk(
+    load: Callable[[Path], T], paths: Sequence[Path]
+) -> list[Union[T, LoadFailure]]:
+    results: list[Union[T, LoadFailure]] = []
+    for path in paths:
+        try:
+            results.append(load(path))
+        except jsonschema.exceptions.ValidationError as exc:
+            results.append(LoadFailure(path, exc.message))
+        except Exception as exc:  # pylint: disable=broad-except
+            results.append(LoadFailure(path, str(exc)))
+    return results
+
+
+def _load_uncached(
+    paths: Sequence[Path], load: Callable[[Path], T], max_workers: int
+) -> list[Union[T, LoadFailure]]:
+    chunks = [
+        paths[index : index + CHUNK_SIZE] for index in range(0, len(paths), CHUNK_SIZE)
+    ]
+    if max_workers <= 1 or len(chunks) <= 1:
+        return _load_chunk(load, paths)
+
+    logging.getLogger("mpyl").debug(
+        f"Loading {len(paths)} projects in {len(chunks)} chunks on {max_workers} processes"
+    )
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        return [
+            result
+            for chunk_results in executor.map(partial(_load_chunk, load), chunks)
+            for result in chunk_results
+        ]
+
+
+def load_in_parallel(
+    paths: Sequence[Path],
+    load: Callable[[Path], T],
+    workers: Optional[int] = None,
+    cache: Optional[ProjectCache] = None,
+    variant: str = "",
+) -> LoadResult[T]:
+    """
+    :param paths: the project files to load
+    :param load: loads a single project file. Has to be picklable, like a module level function or a `partial` of one
+    :param workers: the number of processes. Defaults to `MPYL_WORKERS` or the number of CPUs. With a single worker,
+    or when there is only a single chunk of work, the projects are loaded in this process
+    :param cache: when set, only the projects that are not in the cache are loaded
+    :param variant: identifies `load` in the cache keys, so that different ways of loading don't share entries
+    """
+    max_workers = workers or workers_from_environment() or os.cpu_count() or 1
+    results: list[Union[T, LoadFailure, None]] = [None] * len(paths)
+    keys: list[Optional[str]] = [None] * len(paths)
+    if cache:
+        for index, path in enumerate(paths):
+            keys[index] = cache.key(path, variant)
+            key = keys[index]
+            results[index] = cache.get(key) if key else None
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    loaded = _load_uncached([paths[index] for index in missing], load, max_workers)
+    for index, result in zip(missing, loaded):
+        results[index] = result
+        key = keys[index]
+        if cache and key and not isinstance(result, LoadFailure):
+            cache.put(key, result)
+
+    if cache:
+        if missing:
+            cache.prune()
+        cache.log_stats(logging.getLogger("mpyl"))
+
+    return LoadResult(
+        loaded=[
+            result
+            for result in results
+            if result is not None and not isinstance(result, LoadFailure)
+        ],
+        failures=[result for result in results if isinstance(result, LoadFailure)],
+    )
+
+
+def load_projects(
+    paths: Sequence[Path],
+    validate_project_yaml: bool,
+    workers: Optional[int] = None,
+    cache: Optional[ProjectCache] = None,
+) -> LoadResult[Project]:
+    return load_in_parallel(
+        paths,
+        partial(load_project, validate_project_yaml=validate_project_yaml, log=False),
+        workers,
+        cache,
+        variant="validated-project" if validate_project_yaml else "project",
+    )
+
+
+def load_project_headers(
+    paths: Sequence[Path],
+    workers: Optional[int] = None,
+    cache: Optional[ProjectCache] = None,
+) -> LoadResult[ProjectHeader]:
+    return load_in_parallel(
+        paths, partial(load_project_header, log=False), workers, cache, "header"
+    )
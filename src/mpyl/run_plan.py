@@ -2,27 +2,128 @@
 
 import json
 import logging
-import operator
 import os
 import pickle
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-
-from .constants import RUN_ARTIFACTS_FOLDER
-from .project import Project, Stage, load_project
-from .plan.discovery import find_projects_to_execute, find_projects
+from tempfile import TemporaryDirectory
+from typing import AbstractSet, Iterable, Optional, Sequence
+
+from .constants import NAMESPACE_PLACEHOLDER, RUN_ARTIFACTS_FOLDER
+from .project import (
+    KeyValueProperty,
+    KubernetesCommon,
+    Project,
+    ProjectHeader,
+    Stage,
+    Stages,
+    TargetProperty,
+)
+from .plan.discovery import (
+    DiscoveryConfig,
+    find_projects,
+    find_projects_incrementally,
+    ChangedProjects,
+    find_projects_to_execute,
+)
+from .plan.result_cache import (
+    PlanCacheBackend,
+    fetch_plan,
+    plan_cache_key,
+    plan_cache_secret,
+    store_plan,
+)
+from .plan.storage import PlanFile, is_plan_file, write_plan_file
+from .projects.cache import ProjectCache
+from .projects.loader import load_project_headers, load_projects
 from .utilities.repo import Changeset
 
+RUN_PLAN_FILE = Path(RUN_ARTIFACTS_FOLDER) / "run_plan.bin"
 RUN_PLAN_PICKLE_FILE = Path(RUN_ARTIFACTS_FOLDER) / "run_plan.pickle"
+"""Where versions of MPyL before the introduction of `RUN_PLAN_FILE` stored the plan"""
+RUN_PLAN_SHARDS_FOLDER = Path(RUN_ARTIFACTS_FOLDER) / "run_plan"
+"""Where `RunPlan.write_shards` stores a plan file per planned project, named after the project"""
 RUN_PLAN_JSON_FILE = Path(RUN_ARTIFACTS_FOLDER) / "run_plan.json"
 RUN_PLAN_SUMMARY_FILE = Path(RUN_ARTIFACTS_FOLDER) / "run_plan_summary.md"
 
 
+@dataclass(frozen=True)
+class _PlanIndex:
+    """Lookups into a plan, built in one pass over it, so that selecting from and rendering a plan take time linear in
+    the size of the plan"""
+
+    stages: dict[str, Stage]
+    projects: dict[str, Project]
+    """The projects in the plan by name. When names are not unique, the first project with the name is kept."""
+    projects_by_stage: dict[str, dict[str, Project]]
+    stages_of_projects: list[tuple[Project, list[Stage]]]
+    """Every project in the plan, sorted by name, with the stages that it is planned for"""
+
+    @staticmethod
+    def of(plan: dict[Stage, set[Project]]) -> "_PlanIndex":
+        stages: dict[str, Stage] = {}
+        projects: dict[str, Project] = {}
+        projects_by_stage: dict[str, dict[str, Project]] = {}
+        stages_of_project: dict[Project, list[Stage]] = {}
+        for stage, projects_in_stage in plan.items():
+            stages.setdefault(stage.name, stage)
+            in_stage = projects_by_stage.setdefault(stage.name, {})
+            for project in projects_in_stage:
+                projects.setdefault(project.name, project)
+                in_stage.setdefault(project.name, project)
+                stages_of_project.setdefault(project, []).append(stage)
+
+        return _PlanIndex(
+            stages=stages,
+            projects=projects,
+            projects_by_stage=projects_by_stage,
+            stages_of_projects=sorted(
+                stages_of_project.items(), key=lambda item: item[0].name
+            ),
+        )
+
+
 @dataclass(frozen=True)
 class RunPlan:
-    all_known_projects: set[Project]
+    all_known_projects: set[ProjectHeader]
     _full_plan: dict[Stage, set[Project]]
     _selected_plan: dict[Stage, set[Project]]
+    _unloaded: dict[Stage, set[ProjectHeader]] = field(default_factory=dict)
+    """The projects of the full plan that were not loaded from the plan file, by stage. See `RunPlan.load`."""
+    _full_index: _PlanIndex = field(init=False, repr=False, compare=False)
+    _selected_index: _PlanIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._build_indexes()
+
+    def _build_indexes(self):
+        full_index = _PlanIndex.of(self._full_plan)
+        object.__setattr__(self, "_full_index", full_index)
+        object.__setattr__(
+            self,
+            "_selected_index",
+            (
+                full_index
+                if self._selected_plan is self._full_plan
+                else _PlanIndex.of(self._selected_plan)
+            ),
+        )
+
+    def __getstate__(self):
+        # the indexes are derived from the plans, so they are rebuilt when unpickling instead of stored
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in ("_full_index", "_selected_index")
+        }
+
+    def __setstate__(self, state: dict):
+        # plans that were pickled by earlier versions of MPyL have no unloaded projects
+        self.__dict__.update({"_unloaded": {}} | state)
+        self._build_indexes()
+
+    def _index(self, use_full_plan: bool = False) -> _PlanIndex:
+        return self._full_index if use_full_plan else self._selected_index
 
     @classmethod
     def empty(cls) -> "RunPlan":
@@ -30,32 +131,28 @@ class RunPlan:
 
     @classmethod
     def create(
-        cls, all_known_projects: set[Project], plan: dict[Stage, set[Project]]
+        cls,
+        all_known_projects: AbstractSet[ProjectHeader],
+        plan: dict[Stage, set[Project]],
     ) -> "RunPlan":
         return cls(
-            all_known_projects=all_known_projects, _full_plan=plan, _selected_plan=plan
+            all_known_projects=set(all_known_projects),
+            _full_plan=plan,
+            _selected_plan=plan,
         )
 
     def select_project(self, project_name: str) -> "RunPlan":
-        selected_project = None
-        for project in self._get_all_projects():
-            if project.name == project_name:
-                selected_project = project
-                break
-        if not selected_project:
+        index = self._index()
+        if project_name not in index.projects:
             raise ValueError(
                 f"Unable to select project outside of the run plan: '{project_name}'"
             )
 
-        selected_plan = {}
-        for stage in self._get_all_stages():
-            filtered = {
-                project
-                for project in self._get_projects_for_stage(stage)
-                if project.name == project_name
-            }
-            if filtered:
-                selected_plan[stage] = filtered
+        selected_plan = {
+            stage: {index.projects_by_stage[stage.name][project_name]}
+            for stage in self._selected_plan
+            if project_name in index.projects_by_stage[stage.name]
+        }
 
         return RunPlan(
             all_known_projects=self.all_known_projects,
@@ -86,72 +183,176 @@ class RunPlan:
     def get_projects_for_stage_name(
         self, stage_name: str, use_full_plan: bool = False
     ) -> set[Project]:
-        def find_stage(plan: dict[Stage, set[Project]]):
-            iterator = (
-                projects for stage, projects in plan.items() if stage.name == stage_name
-            )
-            return next(iterator, set())
+        stage = self._index(use_full_plan).stages.get(stage_name)
+        return self._get_projects_for_stage(stage, use_full_plan) if stage else set()
 
+    def get_headers_for_stage_name(
+        self, stage_name: str, use_full_plan: bool = False
+    ) -> set[ProjectHeader]:
+        """:return: the projects in the stage, including the projects that were not loaded from the plan file"""
+        projects: set[ProjectHeader] = set(
+            self.get_projects_for_stage_name(stage_name, use_full_plan)
+        )
         if use_full_plan:
-            return find_stage(self._full_plan)
-        return find_stage(self._selected_plan)
+            stage = self._index(use_full_plan).stages.get(stage_name)
+            projects.update(self._unloaded.get(stage, set()) if stage else set())
+        return projects
 
     def get_project_to_execute(self, stage_name: str, project_name: str) -> Project:
-        selected_stage = None
-        selected_project = None
-        for stage in self._get_all_stages():
-            if stage.name == stage_name:
-                selected_stage = stage
-                for project in self._get_projects_for_stage(stage):
-                    if project.name == project_name:
-                        selected_project = project
-                        break
-                break
-        if not selected_stage:
+        index = self._index()
+        if stage_name not in index.stages:
             raise ValueError(
                 f"Unable to select stage outside of the run plan: '{stage_name}'"
             )
+        selected_project = index.projects_by_stage[stage_name].get(project_name)
         if not selected_project:
             raise ValueError(
                 f"Unable to select project outside of the run plan: '{project_name}'"
             )
         return selected_project
 
-    def write_to_pickle_file(self):
+    def write_to_file(self, path: Path = RUN_PLAN_FILE, log: bool = True):
+        """Stores the plan in the format of `mpyl.plan.storage`. Every planned project is stored separately, next to
+        a table with the stages, the name, path, namespace and deployments of all known projects and which of them
+        are planned for each stage. See `RunPlan.load`. The traefik companions of the planned projects are parsed
+        and stored with them, so that a plan file does not depend on the working tree it is loaded in.
+
+        Storing the plan at `RUN_PLAN_FILE` removes the shards of the previous plan, see `RunPlan.write_shards`,
+        because `RunPlan.load` would read those instead."""
+        rows: dict[ProjectHeader, int] = {}
+        planned = [project for project, _ in self._full_index.stages_of_projects]
+        unloaded = set().union(*self._unloaded.values())
+        for project in [*planned, *sorted(unloaded), *sorted(self.all_known_projects)]:
+            rows.setdefault(project, len(rows))
+
+        def stage_rows(projects: AbstractSet[ProjectHeader]) -> list[int]:
+            return sorted(rows[project] for project in projects)
+
+        table = {
+            "projects": [
+                [
+                    project.name,
+                    project.path,
+                    _namespace_values(project),
+                    project.deployment_names,
+                    project in self.all_known_projects,
+                ]
+                for project in rows
+            ],
+            "stages": [
+                {
+                    "name": stage.name,
+                    "icon": stage.icon,
+                    "full": stage_rows(projects | self._unloaded.get(stage, set())),
+                    "selected": (
+                        stage_rows(self._selected_plan[stage])
+                        if stage in self._selected_plan
+                        else None
+                    ),
+                }
+                for stage, projects in self._full_plan.items()
+            ],
+        }
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if log:
+            logging.getLogger("mpyl").info(f"Storing run plan in: {path}")
+        if path == RUN_PLAN_FILE:
+            _remove_shards(RUN_PLAN_SHARDS_FOLDER)
+        for project in planned:
+            for deployment in project.deployments:
+                _ = deployment.traefik
+        write_plan_file(path, table, planned + [None] * (len(rows) - len(planned)))
+
+    def write_shards(
+        self,
+        default_env: Sequence[KeyValueProperty] = (),
+        folder: Path = RUN_PLAN_SHARDS_FOLDER,
+    ):
+        """Stores a plan file for every selected project, that `RunPlan.load` reads instead of the complete plan
+        when it is asked for that project. Next to the project, the file only holds the known and planned projects
+        whose namespace is referenced by the environment variables of the project, which is all that
+        `substitute_namespaces` needs.
+
+        :param default_env: the environment variables that the configuration adds to every deployment
+        """
         logger = logging.getLogger("mpyl")
-        os.makedirs(os.path.dirname(RUN_PLAN_PICKLE_FILE), exist_ok=True)
-        with open(RUN_PLAN_PICKLE_FILE, "wb") as file:
-            logger.info(f"Storing run plan in: {RUN_PLAN_PICKLE_FILE}")
-            pickle.dump(self, file, pickle.HIGHEST_PROTOCOL)
+        os.makedirs(folder, exist_ok=True)
+        _remove_shards(folder)
+
+        candidates: dict[str, list[ProjectHeader]] = {}
+        for candidate in set(self.all_known_projects).union(
+            *self._full_plan.values(), *self._unloaded.values()
+        ):
+            for reference in _namespace_references(candidate):
+                candidates.setdefault(reference, []).append(candidate)
+
+        default_values = [value for env in default_env for value in _values(env)]
+        for project, _ in self._index().stages_of_projects:
+            referenced = {project} | _referenced_projects(
+                [
+                    *default_values,
+                    *(
+                        value
+                        for deployment in project.deployments
+                        if deployment.properties
+                        for env in deployment.properties.env
+                        for value in _values(env)
+                    ),
+                ],
+                candidates,
+            )
+            shard = RunPlan(
+                all_known_projects={
+                    known for known in self.all_known_projects if known in referenced
+                },
+                _full_plan={
+                    stage: {project} & projects
+                    for stage, projects in self._full_plan.items()
+                },
+                _selected_plan={
+                    stage: {project}
+                    for stage, projects in self._selected_plan.items()
+                    if project in projects
+                },
+                _unloaded={
+                    stage: others
+                    for stage, projects in self._full_plan.items()
+                    if (
+                        others := {
+                            planned
+                            for planned in projects | self._unloaded.get(stage, set())
+                            if planned in referenced and planned != project
+                        }
+                    )
+                },
+            )
+            shard.write_to_file(
+                folder / f"{project.name}{RUN_PLAN_FILE.suffix}", log=False
+            )
+        logger.info(f"Stored run plans per project in: {folder}")
 
     def write_to_summary_file(self):
+        index = self._index()
+
+        def is_project_in_stage(project: Project, stage_name: str):
+            return project.name in index.projects_by_stage.get(stage_name, {})
+
         def get_icon(project: Project, stage_name: str):
             if project.pipeline == "docker":
                 return "🐳"
-            if project.pipeline == "sbt":
-                projects_for_stage = self.get_projects_for_stage_name(stage_name)
-                project_for_stage = next(
-                    (p for p in projects_for_stage if p.name == project.name),
-                    None,
-                )
-                if project_for_stage:
-                    return "☕️"
+            if project.pipeline == "sbt" and is_project_in_stage(project, stage_name):
+                return "☕️"
             return ""
 
-        def is_project_in_stage(project: Project, stage_name: str):
-            return any(
-                project.name == project_for_stage.name
-                for project_for_stage in self.get_projects_for_stage_name(stage_name)
-            )
-
-        summary = "| 👷 Project | 🏗 Build | 🧪 Test | 🚀 Deploy | 🦺 Post-deploy |\n"
-        summary += "| ---------- | :------: | :-----: | :-------: | :------------: |\n"
-
-        all_projects = self._get_all_projects()
-        if len(all_projects) == 0:
-            summary = "Nothing to do 🤷\n"
+        lines = [
+            "| 👷 Project | 🏗 Build | 🧪 Test | 🚀 Deploy | 🦺 Post-deploy |\n",
+            "| ---------- | :------: | :-----: | :-------: | :------------: |\n",
+        ]
+        if not index.stages_of_projects:
+            lines = ["Nothing to do 🤷\n"]
 
-        for project in sorted(all_projects, key=operator.attrgetter("name")):
+        for project, _ in index.stages_of_projects:
             build_plan = get_icon(project, "build")
             test_plan = get_icon(project, "test")
             deploy_plan = "🚀" if is_project_in_stage(project, "deploy") else ""
@@ -159,7 +360,10 @@ class RunPlan:
                 "🦺" if is_project_in_stage(project, "post-deploy") else ""
             )
 
-            summary += f"| {project.name} | {build_plan} | {test_plan} | {deploy_plan} | {postdeploy_plan} |\n"
+            lines.append(
+                f"| {project.name} | {build_plan} | {test_plan} | {deploy_plan} | {postdeploy_plan} |\n"
+            )
+        summary = "".join(lines)
 
         logger = logging.getLogger("mpyl")
         os.makedirs(os.path.dirname(RUN_PLAN_SUMMARY_FILE), exist_ok=True)
@@ -169,99 +373,332 @@ class RunPlan:
 
     def write_to_json_file(self):
         run_plan: dict = {}
-
-        for projects in self._selected_plan.values():
-            for project in projects:
-                stages = {
-                    stage.name: project in self._get_projects_for_stage(stage)
-                    for stage in self._selected_plan.keys()
-                }
-                run_plan.update(
-                    {
-                        project.name: {
-                            "service": project.name,
-                            "path": project.path,
-                            "artifacts_path": str(project.target_path),
-                            "base_path": str(project.root_path),
-                            "maintainers": project.maintainer,
-                            "pipeline": project.pipeline,
-                        }
-                        | stages
+        all_stages = {stage.name: False for stage in self._selected_plan}
+
+        for project, project_stages in self._index().stages_of_projects:
+            stages = all_stages | {stage.name: True for stage in project_stages}
+            run_plan.update(
+                {
+                    project.name: {
+                        "service": project.name,
+                        "path": project.path,
+                        "artifacts_path": str(project.target_path),
+                        "base_path": str(project.root_path),
+                        "maintainers": project.maintainer,
+                        "pipeline": project.pipeline,
                     }
-                )
+                    | stages
+                }
+            )
 
         os.makedirs(os.path.dirname(RUN_PLAN_JSON_FILE), exist_ok=True)
         with open(RUN_PLAN_JSON_FILE, "w", encoding="utf-8") as file:
             json.dump(list(run_plan.values()), file)
 
     @staticmethod
-    def load_from_pickle_file():
+    def load(project_name: Optional[str] = None, path: Optional[Path] = None):
+        """
+        Loads a plan that was stored by `RunPlan.write_to_file`. Only the planned projects are loaded completely.
+        The other known projects are represented by headers with just their name, path, namespace and deployments.
+        A plan that was pickled to `RUN_PLAN_PICKLE_FILE` by an earlier version of MPyL is loaded as a whole, including
+        plans that were pickled before the project classes had slots.
+
+        :param project_name: when given, only this project is loaded and selected. The other projects of the full
+        plan are only known by their headers, see `RunPlan.get_headers_for_stage_name`. Loading a project therefore
+        takes the same time, no matter the size of the plan
+        :param path: the plan file. Defaults to the shard of the project that was stored by `RunPlan.write_shards`
+        if there is one, and to `RUN_PLAN_FILE` otherwise
+        :raises ValueError: when there is no plan, when the pickled plan does not match the project classes, or when
+        the project is not part of the plan
+        """
         logger = logging.getLogger("mpyl")
-
-        if RUN_PLAN_PICKLE_FILE.is_file():
-            logger.info(f"Loading existing run plan: {RUN_PLAN_PICKLE_FILE}")
-            with open(RUN_PLAN_PICKLE_FILE, "rb") as file:
-                run_plan: RunPlan = pickle.load(file)
-                logger.debug(f"Run plan: {run_plan}")
-                return run_plan
-
-        else:
-            raise ValueError(
-                f"Unable to find existing run plan at path {RUN_PLAN_PICKLE_FILE}"
-            )
+        if path is None:
+            shard = RUN_PLAN_SHARDS_FOLDER / f"{project_name}{RUN_PLAN_FILE.suffix}"
+            path = shard if project_name and shard.is_file() else RUN_PLAN_FILE
+        if not path.is_file() and RUN_PLAN_PICKLE_FILE.is_file():
+            path = RUN_PLAN_PICKLE_FILE
+        if not path.is_file():
+            raise ValueError(f"Unable to find existing run plan at path {path}")
+
+        logger.info(f"Loading existing run plan: {path}")
+        if not is_plan_file(path):
+            try:
+                with open(path, "rb") as file:
+                    pickled: RunPlan = pickle.load(file)
+            except pickle.UnpicklingError as exc:
+                raise ValueError(
+                    f"Unable to load run plan {path}, it was stored by another version of MPyL: {exc}. "
+                    f"Discover the run plan again with this version"
+                ) from exc
+            return pickled.select_project(project_name) if project_name else pickled
+
+        with PlanFile(path) as plan_file:
+            run_plan = _plan_from_file(plan_file, project_name)
+        # formatted lazily, the representation of a large plan takes longer to build than the plan itself
+        logger.debug("Run plan: %s", run_plan)
+        return run_plan
 
     def to_markdown(self) -> str:
+        index = self._index()
         lines = ["**Execution plan:**"]
-        if len(self._get_all_projects()) > 0:
-            for stage in self._get_all_stages():
+        if index.stages_of_projects:
+            project_names: dict[Stage, list[str]] = {
+                stage: [] for stage in self._selected_plan
+            }
+            for project, stages in index.stages_of_projects:
+                for stage in stages:
+                    project_names[stage].append(project.name)
+
+            for stage, names in project_names.items():
                 lines.append(f"{stage.to_markdown()}:")
-                if projects := self._get_projects_for_stage(stage):
-                    project_names = [
-                        project.name
-                        for project in sorted(projects, key=operator.attrgetter("name"))
-                    ]
-                    lines.append(", ".join(project_names))
-                else:
-                    lines.append("")
+                lines.append(", ".join(names))
 
             return "  \n".join(lines)
 
         return "No changes detected, nothing to do."
 
 
-def discover_run_plan(
-    logger: logging.Logger,
-    all_stages: list[Stage],
-    changed_files_path: Path,
-) -> RunPlan:
-    logger.info("Discovering run plan...")
-
-    all_projects = set(
-        map(
-            lambda p: load_project(
-                project_path=p, validate_project_yaml=False, log=True
-            ),
-            find_projects(),
+def _namespace_values(project: ProjectHeader) -> Optional[dict[str, str]]:
+    namespace = project.kubernetes.namespace if project.kubernetes else None
+    if not namespace:
+        return None
+    return {
+        target: value
+        for target, value in (
+            ("pr", namespace.pr),
+            ("test", namespace.test),
+            ("acceptance", namespace.acceptance),
+            ("production", namespace.production),
+            ("all", namespace.all),
         )
+        if value is not None
+    }
+
+
+def _remove_shards(folder: Path):
+    for stale in folder.glob(f"*{RUN_PLAN_FILE.suffix}"):
+        stale.unlink(missing_ok=True)
+
+
+def _values(env: KeyValueProperty) -> list[str]:
+    return [
+        value
+        for value in (env.pr, env.test, env.acceptance, env.production, env.all)
+        if value
+    ]
+
+
+def _namespace_references(project: ProjectHeader) -> list[str]:
+    """:return: the names by which environment variables refer to the services of the project, see
+    `substitute_namespaces`"""
+    return [project.name] + [
+        f"{project.name}-{deployment_name}"
+        for deployment_name in project.deployment_names
+    ]
+
+
+def _referenced_projects(
+    values: Iterable[str], candidates: dict[str, list[ProjectHeader]]
+) -> set[ProjectHeader]:
+    """
+    :param candidates: the projects by the names returned by `_namespace_references`
+    :return: the candidates that are referenced by name, followed by the namespace placeholder, in any of the values
+    """
+    referenced: set[ProjectHeader] = set()
+    placeholder = f".{NAMESPACE_PLACEHOLDER}"
+    for value in values:
+        end = value.find(placeholder)
+        while end >= 0:
+            # the placeholder is substituted for every service name that it follows, including partial ones
+            for start in range(end):
+                referenced.update(candidates.get(value[start:end], ()))
+            end = value.find(placeholder, end + 1)
+    return referenced
+
+
+def _header_from_row(row: list, no_stages: Stages) -> ProjectHeader:
+    name, path, namespace, deployment_names, _ = row
+    return ProjectHeader(
+        name=name,
+        path=path,
+        pipeline=None,
+        stages=no_stages,
+        maintainer=[],
+        dependencies=None,
+        kubernetes=(
+            KubernetesCommon(namespace=TargetProperty.from_config(namespace))
+            if namespace
+            else None
+        ),
+        _deployment_names=tuple(deployment_names),
     )
 
-    changeset = Changeset.from_files(
-        logger=logger, changed_files_path=changed_files_path
+
+def _positions_to_load(table: dict, project_name: Optional[str]) -> set[int]:
+    stored = {position for position, offset in enumerate(table["offsets"]) if offset}
+    if project_name is None:
+        return stored
+
+    selected = {
+        position
+        for stage in table["stages"]
+        for position in stage["selected"] or []
+        if position in stored and table["projects"][position][0] == project_name
+    }
+    if not selected:
+        raise ValueError(
+            f"Unable to select project outside of the run plan: '{project_name}'"
+        )
+    return {min(selected)}
+
+
+def _plan_from_file(plan_file: PlanFile, project_name: Optional[str]) -> RunPlan:
+    table = plan_file.table
+    rows: list[list] = table["projects"]
+    to_load = _positions_to_load(table, project_name)
+    no_stages = Stages.from_config({})
+    headers = [_header_from_row(row, no_stages) for row in rows]
+    projects: dict[int, ProjectHeader] = {
+        position: plan_file.load(position) if position in to_load else header
+        for position, header in enumerate(headers)
+    }
+    full_plan: dict[Stage, set[Project]] = {}
+    selected_plan: dict[Stage, set[Project]] = {}
+    unloaded: dict[Stage, set[ProjectHeader]] = {}
+    for values in table["stages"]:
+        stage = Stage(values["name"], values["icon"])
+        full_plan[stage] = {
+            project
+            for position in values["full"]
+            if isinstance(project := projects[position], Project)
+        }
+        unloaded[stage] = {
+            projects[position] for position in values["full"] if position not in to_load
+        }
+        if values["selected"] is not None:
+            in_selection = {
+                project
+                for position in values["selected"]
+                if isinstance(project := projects[position], Project)
+            }
+            if project_name is None or in_selection:
+                selected_plan[stage] = in_selection
+
+    return RunPlan(
+        all_known_projects={header for header, row in zip(headers, rows) if row[4]},
+        _full_plan=full_plan,
+        _selected_plan=selected_plan,
+        _unloaded={stage: known for stage, known in unloaded.items() if known},
     )
 
-    plan = {}
+
+def _load_planned_projects(
+    planned: dict[Stage, set[ProjectHeader]],
+    workers: Optional[int],
+    cache: Optional[ProjectCache],
+) -> dict[Stage, set[Project]]:
+    paths = sorted({Path(header.path) for header in set().union(*planned.values())})
+    loaded: dict[ProjectHeader, Project] = {
+        project: project
+        for project in load_projects(
+            paths, validate_project_yaml=False, workers=workers, cache=cache
+        ).raise_on_failure()
+    }
+    return {
+        stage: {loaded[header] for header in headers}
+        for stage, headers in planned.items()
+    }
+
+
+def _plan_stages(
+    logger: logging.Logger,
+    all_stages: list[Stage],
+    changeset: Changeset,
+    all_projects: set[ProjectHeader],
+) -> dict[Stage, set[ProjectHeader]]:
+    changed_projects = ChangedProjects.from_changeset(all_projects, changeset)
+
+    planned: dict[Stage, set[ProjectHeader]] = {}
     for stage in all_stages:
         projects = find_projects_to_execute(
             logger=logger,
             all_projects=all_projects,
             stage=stage.name,
             changeset=changeset,
+            changed_projects=changed_projects,
         )
 
         if projects:
             logger.debug(
                 f"Will execute projects for stage {stage.name}: {[p.name for p in projects]}"
             )
-            plan.update({stage: projects})
+            planned.update({stage: projects})
+
+    return planned
 
-    return RunPlan.create(all_projects, plan)
+
+def _cached_run_plan(plan_cache: PlanCacheBackend, key: str) -> Optional[RunPlan]:
+    with TemporaryDirectory() as folder:
+        cached_file = Path(folder) / RUN_PLAN_FILE.name
+        return (
+            RunPlan.load(path=cached_file)
+            if fetch_plan(plan_cache, key, cached_file, plan_cache_secret())
+            else None
+        )
+
+
+def _cache_run_plan(plan_cache: PlanCacheBackend, key: str, run_plan: RunPlan):
+    with TemporaryDirectory() as folder:
+        run_plan.write_to_file(Path(folder) / RUN_PLAN_FILE.name, log=False)
+        store_plan(
+            plan_cache, key, Path(folder) / RUN_PLAN_FILE.name, plan_cache_secret()
+        )
+
+
+def discover_run_plan(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    logger: logging.Logger,
+    all_stages: list[Stage],
+    changeset: Changeset,
+    discovery_config: DiscoveryConfig,
+    incremental: bool = False,
+    verify: bool = False,
+    workers: Optional[int] = None,
+    project_cache: Optional[ProjectCache] = None,
+    plan_cache: Optional[PlanCacheBackend] = None,
+) -> RunPlan:
+    """
+    :param plan_cache: where plans are stored by `mpyl.plan.result_cache.plan_cache_key`. When it holds the plan
+    for the changeset, projects and stages, that plan is returned instead of discovering it again. Like any plan that
+    is read by `RunPlan.load`, its known projects only have a name, path, namespace and deployments, while the known
+    projects of a discovered plan are complete headers. Both are stored the same by `RunPlan.write_to_file`
+    """
+    logger.info("Discovering run plan...")
+
+    if incremental:
+        project_paths = find_projects_incrementally(
+            discovery_config, changeset, verify=verify
+        )
+    else:
+        project_paths = find_projects(discovery_config)
+
+    key = plan_cache_key(changeset, project_paths, all_stages) if plan_cache else None
+    if plan_cache and key:
+        cached = _cached_run_plan(plan_cache, key)
+        if cached:
+            logger.info(f"Run plan cache hit, using the plan stored under {key}")
+            return cached
+
+    # Planning only needs the project headers, only the projects in the plan are loaded completely
+    all_projects = set(
+        load_project_headers(
+            project_paths, workers=workers, cache=project_cache
+        ).raise_on_failure()
+    )
+
+    planned = _plan_stages(logger, all_stages, changeset, all_projects)
+    run_plan = RunPlan.create(
+        all_projects, _load_planned_projects(planned, workers, project_cache)
+    )
+    if plan_cache and key:
+        _cache_run_plan(plan_cache, key, run_plan)
+    return run_plan
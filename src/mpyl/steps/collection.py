@@ -1,72 +1,75 @@
-"""A collection of all available steps."""
+"""A collection of all available steps.
+
+The steps that are built in to MPyL are listed in `STEPS_MANIFEST`, by stage and name. The module of a built in step
+is only imported when the step is asked for, so running a step doesn't import the dependencies of all the others.
+Steps that are defined elsewhere register themselves by being imported, see `mpyl.steps.step`.
+"""
 
 import importlib
-import importlib.util
-import pkgutil
 from logging import Logger
 from typing import Optional
 
 from .step import Step, IPluginRegistry
 from ..project import Stage
 
+STEPS_MANIFEST: dict[tuple[str, str], str] = {
+    ("deploy", "Echo Deploy"): "deploy.echo:DeployEcho",
+    ("deploy", "Kubernetes Deploy"): "deploy.kubernetes:DeployKubernetes",
+    ("deploy", "Dagster Helm Template"): "deploy.dagster:HelmTemplateDagster",
+}
+"""The built in steps by stage and name, mapped to the module, relative to this package, and class that implement
+them"""
+
 
 class StepsCollection:
-    _steps: set[Step]
+    _steps: dict[tuple[str, str], Step]
 
     def __init__(self, logger: Logger) -> None:
-        self._steps = set()
-        package = "mpyl.steps"
-        local_package = f"src.{package}"
-        default_library_location, alternative_library_location = (
-            (local_package, package)
-            if importlib.util.find_spec("src")
-            else (package, local_package)
-        )
-        location = default_library_location
-
-        self.__load_steps_in_module(logger, ".", location)
-
-        self.__load_steps_in_module(logger, ".", alternative_library_location)
-        location = alternative_library_location
+        self._logger = logger
+        self._steps = {}
 
-        logger.debug(f"Loaded {len(IPluginRegistry.plugins)} steps from {location}")
-        if not IPluginRegistry.plugins:
-            logger.warning(f"No steps found. Check {location} for plugins.")
+    def _built_in_step(self, location: str) -> Step:
+        module_name, class_name = location.split(":")
+        module = importlib.import_module(f".{module_name}", __package__)
+        step_class = getattr(module, class_name)
+        return step_class(self._logger)
 
+    def _registered_steps(self) -> list[Step]:
+        """:return: the steps that registered themselves and are not built in"""
+        built_in = set(STEPS_MANIFEST.values())
+        steps = []
         for plugin in IPluginRegistry.plugins:
-            step_instance: Step = plugin(logger)
-            meta = step_instance.meta
-            logger.debug(
-                f"{meta.name} for stage {meta.stage} registered. Description: {meta.description}"
-            )
-            self._steps.add(step_instance)
+            module_name = plugin.__module__.removeprefix(f"{__package__}.")
+            if f"{module_name}:{plugin.__name__}" not in built_in:
+                steps.append(plugin(self._logger))
+        return steps
 
-    @staticmethod
-    def __load_steps_in_module(
-        logger: Logger, module_root: str, base_path: str
-    ) -> None:
-        try:
-            module = importlib.import_module(module_root, base_path)
-
-            module_names = [
-                modname
-                for _, modname, _ in pkgutil.walk_packages(
-                    path=module.__path__,
-                    prefix=module.__name__ + ".",
-                    onerror=lambda x: None,
-                )
-            ]
+    def _register(self, step: Step) -> Step:
+        meta = step.meta
+        self._logger.debug(
+            f"{meta.name} for stage {meta.stage} registered. Description: {meta.description}"
+        )
+        return self._steps.setdefault((meta.stage, meta.name), step)
 
-            for modname in module_names:
-                importlib.import_module(modname)
-            return None
-        except ModuleNotFoundError as exc:
-            logger.debug(f"Module {module_root} at {base_path} not found {exc}")
-            return None
+    def list_steps(self) -> list[tuple[str, str]]:
+        """:return: the stage and name of the built in steps and of the steps that registered themselves. The modules
+        of the built in steps are not imported"""
+        registered = {
+            (step.meta.stage, step.meta.name) for step in self._registered_steps()
+        }
+        return sorted(registered | set(STEPS_MANIFEST))
 
     def get_step(self, stage: Stage, step_name: str) -> Optional[Step]:
-        steps = filter(
-            lambda e: step_name == e.meta.name and e.meta.stage == stage.name,
-            self._steps,
-        )
-        return next(steps, None)
+        key = (stage.name, step_name)
+        step = self._steps.get(key)
+        if step:
+            return step
+
+        location = STEPS_MANIFEST.get(key)
+        if location:
+            return self._register(self._built_in_step(location))
+
+        for registered in self._registered_steps():
+            if (registered.meta.stage, registered.meta.name) == key:
+                return self._register(registered)
+        return None
@@ -2,14 +2,14 @@
 
 from logging import Logger
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Optional
 
 from .helm import write_helm_chart
 from ...deploy.k8s.resources import CustomResourceDefinition
 from ...input import Input
 from ...output import Output
 from ....constants import NAMESPACE_PLACEHOLDER
-from ....project import Project, Target
+from ....project import Project, ProjectHeader, Target
 from ....utilities import replace_pr_number
 
 
@@ -26,8 +26,8 @@ def generate_helm_charts(
 
 def substitute_namespaces(
     env_vars: dict[str, str],
-    all_projects: set[Project],
-    projects_to_deploy: set[Project],
+    all_projects: AbstractSet[ProjectHeader],
+    projects_to_deploy: AbstractSet[ProjectHeader],
     target: Target,
     pr_identifier: Optional[int],
 ) -> dict[str, str]:
@@ -57,7 +57,7 @@ def substitute_namespaces(
     """
     env = env_vars.copy()
 
-    def get_namespace_for_linked_project(project: Project) -> str:
+    def get_namespace_for_linked_project(project: ProjectHeader) -> str:
         is_part_of_same_deploy_set = project in projects_to_deploy
         if is_part_of_same_deploy_set and pr_identifier:
             return f"pr-{pr_identifier}"
@@ -82,13 +82,13 @@ def substitute_namespaces(
 
     for project in all_projects:
         linked_project_namespace = get_namespace_for_linked_project(project)
-        for deployment in project.deployments:
+        for deployment_name in project.deployment_names:
             for key, value in env.items():
                 replace_namespace(
                     key_to_replace=key,
                     original_value=value,
                     service_name=project.name,
-                    deployment_name=deployment.name,
+                    deployment_name=deployment_name,
                     namespace=linked_project_namespace,
                 )
 
@@ -5,7 +5,8 @@ More info: https://kubernetes.io/docs/concepts/extend-kubernetes/api-extension/c
 
 import itertools
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from typing import Optional, Sequence
 
 from kubernetes.client import (
     V1Deployment,
@@ -64,11 +65,13 @@ from ....project import (
     Resources,
     Target,
     Traefik,
-    TraefikHost,
     Alert,
     KeyValueRef,
     Metrics,
     TraefikAdditionalRoute,
+    ResolvedDeployment,
+    ResolvedProject,
+    ResolvedTraefikHost,
 )
 from ....utilities import replace_item
 
@@ -208,6 +211,7 @@ class DeploymentDefaults:
 class ChartBuilder:
     step_input: Input
     project: Project
+    resolved: ResolvedProject
     target: Target
     release_name: str
     config_defaults: DeploymentDefaults
@@ -224,13 +228,31 @@ class ChartBuilder:
         if len(self.project.deployments) == 0:
             raise AttributeError("Deployments field should be set")
         self.target = step_input.run_properties.target
+        self.resolved = self.project.resolve(self.target)
         self.release_name = self.project.name.lower()
         self.namespace = (
             step_input.run_properties.versioning.identifier
             if step_input.run_properties.target == Target.PULL_REQUEST
-            else self.project.namespace(step_input.run_properties.target)
+            else self.resolved.namespace
         )
 
+    def _resolved_deployment(self, deployment: Deployment) -> ResolvedDeployment:
+        return self.resolved.for_deployment(deployment)
+
+    @cached_property
+    def _default_hosts(self) -> tuple[ResolvedTraefikHost, ...]:
+        return tuple(
+            ResolvedTraefikHost.from_host(host, self.target)
+            for host in self.config_defaults.traefik_defaults.hosts
+        )
+
+    @cached_property
+    def _whitelist_addresses(self) -> dict[str, list[str]]:
+        return {
+            address.name: address.host.get_value(self.target)
+            for address in self.config_defaults.white_lists.addresses
+        }
+
     def to_labels(self, deployment_name: Optional[str] = None) -> dict:
         run_properties = self.step_input.run_properties
         app_labels = {
@@ -399,6 +421,7 @@ class ChartBuilder:
         )
 
     def to_job(self, deployment: Deployment) -> V1Job:
+        resolved = self._resolved_deployment(deployment)
         job_name = f"{self.release_name}-{deployment.name}"
         job_container = V1Container(
             name=job_name,
@@ -407,15 +430,9 @@ class ChartBuilder:
             image_pull_policy="Always",
             resources=self._get_resources(deployment),
             command=(
-                deployment.kubernetes.command.get_value(self.target).split(" ")
-                if deployment.kubernetes.command
-                else None
-            ),
-            args=(
-                deployment.kubernetes.args.get_value(self.target).split(" ")
-                if deployment.kubernetes.args
-                else None
+                resolved.command.split(" ") if resolved.command is not None else None
             ),
+            args=resolved.args.split(" ") if resolved.args is not None else None,
         )
 
         pod_template = V1PodTemplateSpec(
@@ -454,7 +471,12 @@ class ChartBuilder:
     def to_cron_job(self, deployment: Deployment) -> V1CronJob:
         if deployment.kubernetes.job is None:
             raise ValueError("CronJob deployment must have a job configuration")
-        values = deployment.kubernetes.job.cron.get_value(self.target)
+        cron = self._resolved_deployment(deployment).cron
+        if cron is None:
+            raise ValueError(
+                f"CronJob deployment must have a cron configuration for {self.target}"
+            )
+        values = dict(cron)
         job_template = V1JobTemplateSpec(spec=self.to_job(deployment).spec)
         template_dict = to_dict(job_template)
         values["jobTemplate"] = template_dict
@@ -503,22 +525,13 @@ class ChartBuilder:
         raise KeyError("No default port found. Did you define a port mapping?")
 
     def create_host_wrappers(self, deployment: Deployment) -> list[HostWrapper]:
-        hosts: list[TraefikHost] = (
-            deployment.traefik.hosts
-            if deployment.traefik and deployment.traefik.hosts
-            else self.config_defaults.traefik_defaults.hosts
-        )
-        address_dictionary = {
-            address.name: address.host.get_value(self.target)
-            for address in self.config_defaults.white_lists.addresses
-        }
+        hosts = self._resolved_deployment(deployment).hosts or self._default_hosts
+        address_dictionary = self._whitelist_addresses
 
-        def to_white_list(
-            configured: Optional[TargetProperty[list[str]]],
-        ) -> dict[str, list[str]]:
+        def to_white_list(configured: Optional[list[str]]) -> dict[str, list[str]]:
             white_lists = self.config_defaults.white_lists.default
-            if configured and configured.get_value(self.target):
-                white_lists = white_lists + configured.get_value(self.target)
+            if configured:
+                white_lists = white_lists + configured
 
             return dict(
                 filter(lambda x: x[0] in white_lists, address_dictionary.items())
@@ -537,7 +550,7 @@ class ChartBuilder:
                     )
                 ),
                 white_lists=to_white_list(host.whitelists),
-                tls=host.tls.get_value(self.target) if host.tls else None,
+                tls=host.tls,
                 insecure=host.insecure,
                 additional_route=(
                     next(
@@ -571,11 +584,10 @@ class ChartBuilder:
 
     def to_ingress(self, deployment: Deployment) -> Optional[V1AlphaIngressRoute]:
         """Converts the deployment traefik ingress routes configuration to a V1AlphaIngressRoute object."""
+        ingress_routes = self._resolved_deployment(deployment).ingress_routes
         ingress_route_spec = (
-            self._replace_traefik_placeholders(
-                deployment.traefik.ingress_routes.get_value(self.target)
-            )
-            if deployment.traefik and deployment.traefik.ingress_routes
+            self._replace_traefik_placeholders(ingress_routes)
+            if ingress_routes
             else None
         )
 
@@ -598,7 +610,6 @@ class ChartBuilder:
                     name=f"{host.name.lower()}-{i}", deployment_name=deployment.name
                 ),
                 host=host,
-                target=self.target,
                 release_name=self.release_name,
                 namespace=self.namespace,
                 pr_number=self.step_input.run_properties.versioning.pr_number,
@@ -618,7 +629,6 @@ class ChartBuilder:
                     deployment_name=deployment.name,
                 ),
                 host=host,
-                target=self.target,
                 release_name=self.release_name,
                 namespace=self.namespace,
                 pr_number=self.step_input.run_properties.versioning.pr_number,
@@ -632,11 +642,10 @@ class ChartBuilder:
 
     def to_middlewares(self, deployment: Deployment) -> dict[str, V1AlphaMiddleware]:
         hosts: list[HostWrapper] = self.create_host_wrappers(deployment)
+        configured_middlewares = self._resolved_deployment(deployment).middlewares
         middlewares = (
-            self._replace_traefik_placeholders(
-                deployment.traefik.middlewares.get_value(self.target)
-            )
-            if deployment.traefik and deployment.traefik.middlewares
+            self._replace_traefik_placeholders(configured_middlewares)
+            if configured_middlewares
             else []
         )
         adjusted_middlewares = {
@@ -670,14 +679,14 @@ class ChartBuilder:
             for host in hosts
         } | adjusted_middlewares
 
+    @staticmethod
     def to_sealed_secrets(
-        self, sealed_secrets: list[KeyValueProperty], name: str
+        sealed_secrets: Sequence[tuple[str, Optional[str]]], name: str
     ) -> V1SealedSecret:
-        secrets: dict[str, str] = {}
-        for secret in sealed_secrets:
-            secrets[secret.key] = secret.get_value(self.target)
-
-        return V1SealedSecret(name=name.lower(), secrets=secrets)
+        return V1SealedSecret(
+            name=name.lower(),
+            secrets=dict(sealed_secrets),
+        )
 
     @staticmethod
     def _to_resource_requirements(
@@ -730,18 +739,18 @@ class ChartBuilder:
         return ChartBuilder._to_resource_requirements(resources, defaults, self.target)
 
     def _create_sealed_secret_env_vars(
-        self, secret_list: list[KeyValueProperty], secret_name: str
+        self, keys: list[str], secret_name: str
     ) -> list[V1EnvVar]:
         return [
             V1EnvVar(
-                name=e.key,
+                name=key,
                 value_from=V1EnvVarSource(
                     secret_key_ref=V1SecretKeySelector(
-                        key=e.key, name=secret_name.lower(), optional=False
+                        key=key, name=secret_name.lower(), optional=False
                     )
                 ),
             )
-            for e in secret_list
+            for key in keys
         ]
 
     def _map_key_value_refs(self, ref: KeyValueRef) -> V1EnvVar:
@@ -753,30 +762,21 @@ class ChartBuilder:
         return list(map(self._map_key_value_refs, secret_list))
 
     @staticmethod
-    def extract_raw_env(target: Target, env: list[KeyValueProperty]):
-        raw_env_vars = {
-            e.key: e.get_value(target) for e in env if e.get_value(target) is not None
-        }
-        return raw_env_vars
+    def extract_raw_env(env: Sequence[tuple[str, Optional[str]]]) -> dict[str, str]:
+        return {key: value for key, value in env if value is not None}
 
     def get_sealed_secret_as_env_vars(
         self,
-        sealed_secrets: list[KeyValueProperty],
+        sealed_secrets: Sequence[tuple[str, Optional[str]]],
         secret_name: str,
     ) -> list[V1EnvVar]:
-        sealed_secrets_for_target = list(
-            filter(lambda v: v.get_value(self.target) is not None, sealed_secrets)
-        )
         return self._create_sealed_secret_env_vars(
-            sealed_secrets_for_target, secret_name
+            [key for key, value in sealed_secrets if value is not None], secret_name
         )
 
     def _get_env_vars(self, deployment: Deployment) -> list[V1EnvVar]:
-        raw_env_vars = (
-            self.extract_raw_env(self.target, deployment.properties.env)
-            if deployment.properties
-            else {}
-        )
+        resolved = self._resolved_deployment(deployment)
+        raw_env_vars = self.extract_raw_env(resolved.env)
 
         # this variable is added here explicitly because:
         #   1. the name of this service should not be overriden
@@ -797,7 +797,7 @@ class ChartBuilder:
         processed_env_vars = substitute_namespaces(
             env_vars=raw_env_vars,
             all_projects=self.step_input.run_plan.all_known_projects,
-            projects_to_deploy=self.step_input.run_plan.get_projects_for_stage_name(
+            projects_to_deploy=self.step_input.run_plan.get_headers_for_stage_name(
                 deploy.STAGE_NAME, use_full_plan=True
             ),
             target=self.target,
@@ -812,13 +812,8 @@ class ChartBuilder:
             if deployment.properties
             else []
         )
-        sealed_secrets = (
-            self.get_sealed_secret_as_env_vars(
-                deployment.properties.sealed_secrets,
-                f"{self.release_name}-{deployment.name}",
-            )
-            if deployment.properties
-            else []
+        sealed_secrets = self.get_sealed_secret_as_env_vars(
+            resolved.sealed_secrets, f"{self.release_name}-{deployment.name}"
         )
 
         return env_vars + sealed_secrets + secrets
@@ -833,6 +828,7 @@ class ChartBuilder:
             for idx, key in enumerate(deployment.kubernetes.port_mappings.keys())
         ]
 
+        resolved = self._resolved_deployment(deployment)
         resources = deployment.kubernetes.resources
         defaults = self.config_defaults.resources_defaults
         liveness_probe, startup_probe = self._construct_probes(deployment)
@@ -849,15 +845,9 @@ class ChartBuilder:
             liveness_probe=liveness_probe,
             startup_probe=startup_probe,
             command=(
-                deployment.kubernetes.command.get_value(self.target).split(" ")
-                if deployment.kubernetes.command
-                else None
-            ),
-            args=(
-                deployment.kubernetes.args.get_value(self.target).split(" ")
-                if deployment.kubernetes.args
-                else None
+                resolved.command.split(" ") if resolved.command is not None else None
             ),
+            args=resolved.args.split(" ") if resolved.args is not None else None,
             security_context=deployment.kubernetes.security_context,
         )
 
@@ -923,10 +913,10 @@ class ChartBuilder:
     ) -> dict[str, CustomResourceDefinition]:
         chart = {}
 
-        if deployment.properties and len(deployment.properties.sealed_secrets) > 0:
+        sealed_secrets = self._resolved_deployment(deployment).sealed_secrets
+        if sealed_secrets:
             chart[f"sealed-secrets-{deployment.name}"] = self.to_sealed_secrets(
-                deployment.properties.sealed_secrets,
-                f"{self.release_name}-{deployment.name}",
+                sealed_secrets, f"{self.release_name}-{deployment.name}"
             )
 
         prometheus = _to_prometheus_chart(self, deployment)
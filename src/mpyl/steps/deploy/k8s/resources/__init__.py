@@ -14,6 +14,7 @@ from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
 from .....projects.versioning import yaml_to_string
+from .....utilities.yaml import load_read_only
 
 yaml = YAML()
 
@@ -168,7 +169,7 @@ def to_yaml(resource: object) -> str:
     if hasattr(resource, "schema") and resource.schema:
         template = pkgutil.get_data(__name__, f"schema/{resource.schema}")
         if template:
-            schema = yaml.load(template.decode("utf-8"))
+            schema = load_read_only(template)
             try:
                 jsonschema.validate(yaml_values, schema)
             except ValidationError as err:
@@ -8,7 +8,7 @@ from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
 from . import to_dict
 from ..chart import ChartBuilder
-from .....project import Project, Target, KeyValueProperty, KeyValueRef
+from .....project import Project, Target, KeyValueRef
 from .....steps.models import RunProperties
 from .....utilities.helm import shorten_name
 
@@ -31,11 +31,11 @@ def to_user_code_values(  # pylint: disable=too-many-locals
     if not service_account_override is None:
         global_override = {"global": {"serviceAccountName": service_account_override}}
 
-    combined_sealed_secrets: list[KeyValueProperty] = []
-    for deployment in builder.project.deployments:
-        combined_sealed_secrets = combined_sealed_secrets + (
-            deployment.properties.sealed_secrets if deployment.properties else []
-        )
+    combined_sealed_secrets = [
+        sealed_secret
+        for deployment in builder.resolved.deployments
+        for sealed_secret in deployment.sealed_secrets
+    ]
     sealed_secret_refs = []
     for sealed_secret_env in builder.get_sealed_secret_as_env_vars(
         combined_sealed_secrets, builder.release_name
@@ -92,7 +92,8 @@ def to_user_code_values(  # pylint: disable=too-many-locals
                         project.dagster.repo,
                     ],
                     "env": [
-                        {"name": key, "value": DoubleQuotedScalarString(value)}
+                        # a variable without a value for the target is written as "None"
+                        {"name": key, "value": DoubleQuotedScalarString(str(value))}
                         for key, value in get_env_variables(
                             project, run_properties.target
                         ).items()
@@ -136,12 +137,9 @@ def to_user_code_values(  # pylint: disable=too-many-locals
     )
 
 
-def get_env_variables(project: Project, target: Target) -> dict[str, str]:
-    env_variables: dict[str, str] = {
-        env_variable.key: env_variable.get_value(target)
-        for deployment in project.deployments
-        if deployment.properties
-        for env_variable in deployment.properties.env
+def get_env_variables(project: Project, target: Target) -> dict[str, Optional[str]]:
+    return {
+        key: value
+        for deployment in project.resolve(target).deployments
+        for key, value in deployment.env
     }
-
-    return env_variables
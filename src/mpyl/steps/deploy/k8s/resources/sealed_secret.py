@@ -2,13 +2,15 @@
 This module contains the sealed secret CRD.
 """
 
+from typing import Optional
+
 from kubernetes.client import V1ObjectMeta
 
 from . import CustomResourceDefinition
 
 
 class V1SealedSecret(CustomResourceDefinition):
-    def __init__(self, name: str, secrets: dict[str, str]):
+    def __init__(self, name: str, secrets: dict[str, Optional[str]]):
         super().__init__(
             api_version="bitnami.com/v1alpha1",
             kind="SealedSecret",
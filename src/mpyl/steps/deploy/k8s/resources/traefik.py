@@ -12,13 +12,13 @@ from .....constants import (
     SERVICE_NAME_PLACEHOLDER,
     NAMESPACE_PLACEHOLDER,
 )
-from .....project import TraefikHost, Target, TraefikAdditionalRoute
+from .....project import ResolvedTraefikHost, TraefikAdditionalRoute
 from .....utilities import replace_pr_number
 
 
 @dataclass(frozen=True)
 class HostWrapper:
-    traefik_host: TraefikHost
+    traefik_host: ResolvedTraefikHost
     name: str
     index: int
     service_port: int
@@ -34,7 +34,6 @@ class V1AlphaIngressRoute(CustomResourceDefinition):
         cls,
         metadata: V1ObjectMeta,
         host: HostWrapper,
-        target: Target,
         release_name: str,
         namespace: str,
         pr_number: Optional[int],
@@ -56,20 +55,16 @@ class V1AlphaIngressRoute(CustomResourceDefinition):
 
         route: dict[str, Any] = {
             "kind": "Rule",
-            "match": _interpolate_names(host=host.traefik_host.host.get_value(target)),
+            "match": _interpolate_names(host=host.traefik_host.host or ""),
             "services": [
                 {"name": host.name, "kind": "Service", "port": host.service_port}
             ],
             "middlewares": combined_middlewares,
-            "syntax": (
-                host.traefik_host.syntax.get_value(target)
-                if host.traefik_host.syntax
-                else None
-            ),
+            "syntax": host.traefik_host.syntax,
         }
 
-        if host.traefik_host.priority:
-            route |= {"priority": host.traefik_host.priority.get_value(target)}
+        if host.traefik_host.has_priority:
+            route |= {"priority": host.traefik_host.priority}
 
         tls: dict[str, Union[str, dict]] = {
             "secretName": host.tls if host.tls else default_tls
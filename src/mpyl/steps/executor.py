@@ -2,7 +2,6 @@
 Project and Stage.
 """
 
-import pkgutil
 from dataclasses import dataclass
 from datetime import datetime
 from logging import Logger
@@ -15,7 +14,7 @@ from .output import Output
 from .step import Step
 from ..project import Project, Stage
 from ..run_plan import RunPlan
-from ..validation import validate
+from ..validation import MPYL_CONFIG_SCHEMA, validate_with_schema
 
 
 class ExecutionException(Exception):
@@ -65,10 +64,7 @@ class Executor:
         self._run_plan = run_plan
         self._steps_collection = steps_collection or StepsCollection(logger)
 
-        schema_dict = pkgutil.get_data(__name__, "../schema/mpyl_config.schema.yml")
-
-        if schema_dict:
-            validate(run_properties.config, schema_dict.decode("utf-8"))
+        validate_with_schema(run_properties.config, MPYL_CONFIG_SCHEMA)
 
     def _execute(
         self,
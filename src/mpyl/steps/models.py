@@ -1,13 +1,12 @@
 """ Model representation of run-specific configuration. """
 
-import pkgutil
 from dataclasses import dataclass
 from typing import Optional
 
 from ruamel.yaml import YAML, yaml_object
 
 from ..project import Stage, Target
-from ..validation import validate
+from ..validation import RUN_PROPERTIES_SCHEMA, validate_with_schema
 
 
 @dataclass(frozen=True)
@@ -112,9 +111,7 @@ class RunProperties:
 
     @staticmethod
     def validate(properties: dict):
-        schema = pkgutil.get_data(__name__, "../schema/run_properties.schema.yml")
-        if schema:
-            validate(properties, schema.decode("utf-8"))
+        validate_with_schema(properties, RUN_PROPERTIES_SCHEMA)
 
     def to_stage(self, stage_name: str) -> Stage:
         stage_by_name = next(stage for stage in self.stages if stage.name == stage_name)
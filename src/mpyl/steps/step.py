@@ -47,6 +47,8 @@ remains type safe and mistakes are found as early as possible.
 ##### Registration with the executor
 Importing the module in which your step is defined is enough to register it.
 Steps are automatically registered with the `mpyl.steps.steps.Steps` executor via the `IPluginRegistry` metaclass.
+Steps that are built in to `MPyL` are imported only when they are executed. They need an entry in
+`mpyl.steps.collection.STEPS_MANIFEST` instead.
 
 Example:
 ```python
@@ -2,22 +2,88 @@
 Represents the files modified in this unit of change (pull request, etc).
 """
 
-import json
 import logging
-from dataclasses import dataclass
+import sys
+from bisect import bisect_left
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from .git import MERGE_BASE_CACHE_FILE, diff_name_status, merge_base
+from .json_stream import iter_json_strings
+
 
 @dataclass(frozen=True)
 class Changeset:
-    _files_touched: dict[str, str]
+    """The files touched by a change, mapped to their status. The paths are stored once, interned and sorted, with
+    their statuses alongside. The other views are derived from them when asked for."""
+
+    _files_touched: InitVar[dict[str, str]]
+    _renamed_from: dict[str, str] = field(default_factory=dict)
+    """The original path of every renamed file, keyed by its new path. Only known for changesets read from git"""
+    _base_commit: Optional[str] = None
+    """The commit that the changes were made on top of. Only known for changesets read from git"""
+    _head_commit: Optional[str] = None
+    """The commit that holds the changes. Only known for changesets read from git"""
+    _files: tuple[str, ...] = field(init=False, repr=False)
+    _statuses: tuple[str, ...] = field(init=False, repr=False)
+    """The status of each of `_files`, at the same index"""
+
+    def __post_init__(self, _files_touched: dict[str, str]):
+        files = sorted(_files_touched)
+        # the dataclass is frozen, so the derived fields can only be set via object.__setattr__
+        object.__setattr__(self, "_files", tuple(sys.intern(file) for file in files))
+        object.__setattr__(
+            self,
+            "_statuses",
+            tuple(sys.intern(_files_touched[file]) for file in files),
+        )
+
+    def files_touched(self, status: Optional[set[str]] = None) -> frozenset[str]:
+        if not status:
+            return frozenset(self._files)
+        return frozenset(
+            file
+            for file, file_status in zip(self._files, self._statuses)
+            if file_status in status
+        )
+
+    @property
+    def sorted_files(self) -> tuple[str, ...]:
+        """All touched files, sorted by path"""
+        return self._files
 
-    def files_touched(self, status: Optional[set[str]] = None):
-        if not status or len(status) == 0:
-            return set(self._files_touched.keys())
+    @property
+    def base_commit(self) -> Optional[str]:
+        return self._base_commit
 
-        return {file for file, s in self._files_touched.items() if s in status}
+    @property
+    def head_commit(self) -> Optional[str]:
+        return self._head_commit
+
+    def status_of(self, file: str) -> Optional[str]:
+        index = bisect_left(self._files, file)
+        if index < len(self._files) and self._files[index] == file:
+            return self._statuses[index]
+        return None
+
+    def renamed_from(self, file: str) -> Optional[str]:
+        return self._renamed_from.get(file)
+
+    def files_under(self, directory: str) -> tuple[str, ...]:
+        """
+        The touched files below `directory`, found with a binary search in O(log n + k)
+        :param directory: path relative to the repository root, with or without a trailing slash
+        :return: the touched files below `directory`, sorted by path
+        """
+        if directory.strip("/") in ("", "."):
+            return self._files
+        prefix = directory.rstrip("/") + "/"
+        # every path that starts with "dir/" sorts between "dir/" and "dir0", since "0" follows "/" in ASCII
+        upper_bound = prefix[:-1] + "0"
+        start = bisect_left(self._files, prefix)
+        end = bisect_left(self._files, upper_bound, lo=start)
+        return self._files[start:end]
 
     @staticmethod
     def from_files(logger: logging.Logger, changed_files_path: Path):
@@ -29,10 +95,8 @@ class Changeset:
         def add_changed_files(operation: str, change_type: str):
             path = changed_files_path / f"{operation}_files.json"
             if path.is_file():
-                with open(path, encoding="utf-8") as file:
-                    files = json.load(file)
-                    for changed in files:
-                        changed_files[changed] = change_type
+                for changed in iter_json_strings(path):
+                    changed_files[changed] = change_type
             else:
                 raise ValueError(
                     f"Unable to create Changeset due to missing file {path}"
@@ -45,3 +109,32 @@ class Changeset:
         add_changed_files("renamed", "R")
 
         return Changeset(_files_touched=changed_files)
+
+    @staticmethod
+    def from_git(
+        logger: logging.Logger,
+        base: str,
+        head: str = "HEAD",
+        cache_file: Path = MERGE_BASE_CACHE_FILE,
+    ) -> "Changeset":
+        """
+        Creates a Changeset from the files that changed on `head` since it diverged from `base`
+        :param base: the branch or commit the change will be merged into
+        :param head: the branch or commit that contains the change
+        :param cache_file: where merge bases are cached between calls
+        """
+        logger.debug(f"Creating Changeset based on git diff {base}...{head}")
+        changed_files: dict[str, str] = {}
+        renamed_from: dict[str, str] = {}
+        base_commit, head_commit = merge_base(base, head, cache_file)
+        for entry in diff_name_status(base_commit, head_commit):
+            changed_files[entry.path] = entry.status
+            if entry.status == "R" and entry.source:
+                renamed_from[entry.path] = entry.source
+
+        return Changeset(
+            _files_touched=changed_files,
+            _renamed_from=renamed_from,
+            _base_commit=base_commit,
+            _head_commit=head_commit,
+        )
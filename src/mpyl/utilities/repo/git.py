@@ -0,0 +1,135 @@
+"""Reads the changes between two commits straight from git, without the need for pre-generated changed files.
+
+The output of `git diff --name-status -z` is consumed while git is still producing it, so the full diff is never held
+in memory as a single string.
+"""
+
+import json
+import logging
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from ...constants import RUN_ARTIFACTS_FOLDER
+
+MERGE_BASE_CACHE_FILE = Path(RUN_ARTIFACTS_FOLDER) / "merge_base_cache.json"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Type changes and unmerged paths are treated as modifications, the remaining statuses map onto themselves
+_STATUS_MAPPING = {"A": "A", "C": "C", "D": "D", "M": "M", "R": "R", "T": "M", "U": "M"}
+
+
+@dataclass(frozen=True)
+class DiffEntry:
+    status: str
+    """One of A, C, D, M or R"""
+    path: str
+    source: Optional[str] = None
+    """The path a renamed or copied file originates from"""
+
+
+def _git(*arguments: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *arguments], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) as exc:
+        stderr = getattr(exc, "stderr", None) or exc
+        raise ValueError(f"Unable to run git {' '.join(arguments)}: {stderr}") from exc
+
+
+def _read_cache(cache_file: Path) -> dict[str, str]:
+    try:
+        with open(cache_file, encoding="utf-8") as file:
+            cached = json.load(file)
+            return cached if isinstance(cached, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def merge_base(
+    base: str, head: str, cache_file: Path = MERGE_BASE_CACHE_FILE
+) -> tuple[str, str]:
+    """
+    The best common ancestor of `base` and `head`. Lookups are cached by commit hash in `cache_file`, so only the
+    first lookup in a job has to traverse the history.
+    :return: the common ancestor and the commit of `head`
+    """
+    logger = logging.getLogger("mpyl")
+    base_commit, head_commit = _git(
+        "rev-parse", f"{base}^{{commit}}", f"{head}^{{commit}}"
+    ).splitlines()
+    key = f"{base_commit}...{head_commit}"
+    cached = _read_cache(cache_file)
+    if key in cached:
+        logger.debug(f"Using cached merge base {cached[key]} of {base} and {head}")
+        return cached[key], head_commit
+
+    common_ancestor = _git("merge-base", base_commit, head_commit)
+    cached[key] = common_ancestor
+    try:
+        os.makedirs(cache_file.parent, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(cached, file)
+    except OSError as exc:
+        logger.debug(f"Unable to store the merge base cache: {exc}")
+    return common_ancestor, head_commit
+
+
+def _read_fields(stream) -> Iterator[str]:
+    remainder = b""
+    while chunk := stream.read(STREAM_CHUNK_SIZE):
+        *fields, remainder = (remainder + chunk).split(b"\0")
+        yield from map(os.fsdecode, fields)
+    if remainder:
+        yield os.fsdecode(remainder)
+
+
+def parse_name_status(fields: Iterator[str]) -> Iterator[DiffEntry]:
+    """Parses the NUL separated fields of `git diff --name-status -z`. Renames and copies are followed by a score
+    and two paths, all other statuses by a single path."""
+    logger = logging.getLogger("mpyl")
+    for field in fields:
+        if not field:
+            continue
+        letter = field[0]
+        source = next(fields, None) if letter in ("R", "C") else None
+        path = next(fields, None)
+        if path is None:
+            logger.warning(f"Ignoring truncated git diff output after status {field}")
+            return
+        if source is not None:
+            yield DiffEntry(status=letter, path=path, source=source)
+            continue
+        status = _STATUS_MAPPING.get(letter)
+        if status is None:
+            logger.debug(f"Ignoring {path} with unsupported status {field}")
+            continue
+        yield DiffEntry(status=status, path=path)
+
+
+def diff_name_status(base_commit: str, head_commit: str) -> Iterator[DiffEntry]:
+    """Streams the files that changed between two commits. With the `merge_base` of a base and head as `base_commit`,
+    this is like `git diff base...head`"""
+    command = [
+        "git",
+        "diff",
+        "--name-status",
+        "-z",
+        "-M",
+        base_commit,
+        head_commit,
+    ]
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        if not process.stdout:
+            raise RuntimeError(f"Process {' '.join(command)} does not have an stdout")
+        yield from parse_name_status(_read_fields(process.stdout))
+        stderr = process.stderr.read() if process.stderr else b""
+        if process.wait() != 0:
+            raise ValueError(
+                f"Unable to create Changeset from {base_commit}..{head_commit}: {os.fsdecode(stderr).strip()}"
+            )
@@ -0,0 +1,76 @@
+"""Reads the JSON arrays of file names in the changed files folder one element at a time.
+
+The file is memory mapped and processed in fixed size windows instead of being read into a single string, so apart
+from the decoded paths themselves, the memory that is needed does not depend on the size of the array.
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Iterator
+
+WINDOW_SIZE = 1024 * 1024
+
+
+def _pieces(buffer: mmap.mmap) -> Iterator[bytes]:
+    """Splits the buffer on double quotes, one window at a time. UTF-8 continuation bytes never contain a quote, so
+    the split can happen before decoding."""
+    pending = b""
+    for offset in range(0, len(buffer), WINDOW_SIZE):
+        parts = (pending + buffer[offset : offset + WINDOW_SIZE]).split(b'"')
+        pending = parts.pop()
+        yield from parts
+    yield pending
+
+
+def _decode(raw: bytes) -> str:
+    if b"\\" not in raw:
+        return raw.decode("utf-8")
+    return json.loads(b'"' + raw + b'"')
+
+
+def _is_escaped(piece: bytes) -> bool:
+    """Whether the quote that follows `piece` is escaped, which is the case after an odd number of backslashes"""
+    return (len(piece) - len(piece.rstrip(b"\\"))) % 2 == 1
+
+
+def iter_json_strings(path: Path) -> Iterator[str]:
+    """
+    Yields the elements of a JSON array of strings, without loading the whole file in memory
+    :raises ValueError: when the file does not contain a JSON array of strings
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            raise ValueError(f"Unable to read {path}: the file is empty")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            # outside of strings, only the opening bracket, commas and the closing bracket are allowed
+            expected_separator = b"["
+            inside = False
+            string: list[bytes] = []
+            for piece in _pieces(buffer):
+                if inside:
+                    if piece.endswith(b"\\") and _is_escaped(piece):
+                        string.append(piece + b'"')
+                        continue
+                    if string:
+                        piece = b"".join(string) + piece
+                        string.clear()
+                    yield _decode(piece)
+                    inside = False
+                    expected_separator = b","
+                    continue
+
+                if piece.strip() == expected_separator:
+                    inside = True
+                    continue
+                separator = b"".join(piece.split())
+                if separator == expected_separator:
+                    inside = True
+                elif expected_separator + separator in (b"[[]", b",]"):
+                    return
+                else:
+                    raise ValueError(
+                        f"Unable to read {path}: expected {expected_separator.decode()}, "
+                        f"found {separator[:20]!r}"
+                    )
+            raise ValueError(f"Unable to read {path}: unexpected end of file")
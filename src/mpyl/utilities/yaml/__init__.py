@@ -2,9 +2,20 @@
 
 from io import StringIO
 from pathlib import Path
+from typing import IO, Any, Union
 
+import yaml as pyyaml
 from ruamel.yaml import YAML
 from ruamel.yaml.compat import ordereddict
+from ruamel.yaml.resolver import implicit_resolvers
+from ruamel.yaml.scalarstring import FoldedScalarString, LiteralScalarString
+
+# The C implementation of the safe loader is only available when PyYAML was built against libyaml
+_SafeLoader: type[pyyaml.SafeLoader] = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
+_RESOLVED_TAGS = {
+    f"tag:yaml.org,2002:{tag}"
+    for tag in ("bool", "float", "int", "merge", "null", "timestamp")
+}
 
 
 def yaml_to_string(serializable: object, yaml: YAML) -> str:
@@ -27,3 +38,65 @@ def load_for_roundtrip(project_file: Path) -> tuple[ordereddict, YAML]:
     with project_file.open(encoding="utf-8") as file:
         dictionary = yaml.load(file)
         return dictionary, yaml
+
+
+class ReadOnlyLoader(_SafeLoader):  # pylint: disable=too-many-ancestors
+    """Loads YAML into plain Python objects, for consumers that never write the YAML back.
+
+    PyYAML resolves scalars according to YAML 1.1, where for example `on` is a boolean and `10:30` an integer. The
+    resolvers are replaced by the YAML 1.2 resolvers of ruamel.yaml, so the result is the same as that of a round trip
+    `ruamel.yaml.YAML` instance, without the overhead of keeping track of comments, ordering and formatting.
+    """
+
+    yaml_implicit_resolvers: dict = {}
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, pyyaml.MappingNode):
+            seen = set()
+            for key_node, _ in node.value:
+                if key_node.tag == "tag:yaml.org,2002:merge":
+                    continue
+                if key_node.value in seen:
+                    raise pyyaml.constructor.ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f"found duplicate key {key_node.value!r}",
+                        key_node.start_mark,
+                    )
+                seen.add(key_node.value)
+        return super().construct_mapping(node, deep=deep)
+
+
+def _construct_int(loader: ReadOnlyLoader, node: pyyaml.ScalarNode) -> int:
+    value = str(loader.construct_scalar(node)).replace("_", "")
+    sign = -1 if value.startswith("-") else 1
+    digits = value.lstrip("+-")
+    bases = {"0b": 2, "0o": 8, "0x": 16}
+    if digits[:2].lower() in bases:
+        return sign * int(digits[2:], bases[digits[:2].lower()])
+    # YAML 1.2 reads a leading zero without `o` as a decimal, unlike YAML 1.1
+    return sign * int(digits, 10)
+
+
+def _construct_str(loader: ReadOnlyLoader, node: pyyaml.ScalarNode) -> str:
+    value = loader.construct_scalar(node)
+    # block scalars keep their style, so that they are written the same way to generated charts
+    if node.style == "|":
+        return LiteralScalarString(value)
+    if node.style == ">":
+        return FoldedScalarString(value)
+    return value
+
+
+for _versions, _tag, _regexp, _first in implicit_resolvers:
+    if (1, 2) in _versions and _tag in _RESOLVED_TAGS:
+        ReadOnlyLoader.add_implicit_resolver(_tag, _regexp, _first)
+ReadOnlyLoader.add_constructor("tag:yaml.org,2002:int", _construct_int)
+ReadOnlyLoader.add_constructor("tag:yaml.org,2002:str", _construct_str)
+
+
+def load_read_only(stream: Union[str, bytes, IO]) -> Any:
+    """Load YAML for reading only, with the C accelerated loader of PyYAML if it is available"""
+    return pyyaml.load(
+        stream, Loader=ReadOnlyLoader
+    )  # nosec B506 - derives from the safe loader
@@ -1,50 +1,77 @@
-""" Function used to validate the project.schema.yml against the local schema."""
+"""Validation of YAML values against the schemas of MPyL.
 
+Schemas are looked up by name in a registry. The registry reads the JSON rendition of the schemas that ships with
+MPyL in `validators/schemas.json`, and only falls back to parsing the YAML of a schema that changed after it was
+converted. Validators are built once per schema, when they are first used. Values that pass the compiled validators
+of `mpyl.validators` are not validated by `jsonschema` at all, which is therefore only imported when it is needed.
+"""
+
+import json
 import pkgutil
 from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import jsonschema
-from jsonschema.protocols import Validator
-from jsonschema.validators import Draft202012Validator
+from .utilities.lazy_import import lazy_import
+from .utilities.yaml import load_read_only
+from .validators import compiled_validator, compiled_validator_for_digest, schema_digest
 
-from referencing import Registry, Resource
-from ruamel.yaml import YAML
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
 
-yaml = YAML()
+jsonschema = lazy_import("jsonschema")
+referencing = lazy_import("referencing")
 
+PROJECT_SCHEMA = "project.schema.yml"
+RUN_PROPERTIES_SCHEMA = "run_properties.schema.yml"
+MPYL_CONFIG_SCHEMA = "mpyl_config.schema.yml"
+REFERENCABLE_SCHEMAS = (
+    PROJECT_SCHEMA,
+    "mpyl_stages.schema.yml",
+    "k8s_api_core.schema.yml",
+    "traefik_v2.schema.yml",
+)
 
-def __load_schema_from_local(local_uri: str) -> Resource:
-    project_schema_string = pkgutil.get_data(__name__, f"schema/{local_uri}")
-    if not project_schema_string:
-        raise ImportError(f"'schema/{local_uri}' was not found in bundle")
-    return Resource.from_contents(yaml.load(project_schema_string.decode("utf-8")))
 
+@lru_cache(maxsize=None)
+def _schema_source(name: str) -> bytes:
+    source = pkgutil.get_data(__name__, f"schema/{name}")
+    if not source:
+        raise ImportError(f"'schema/{name}' was not found in bundle")
+    return source
 
-def __load_schemas_from_local(local_uris: list[str]):
-    return {local_uri: __load_schema_from_local(local_uri) for local_uri in local_uris}
 
+@lru_cache(maxsize=None)
+def _schema_digest(name: str) -> str:
+    return schema_digest(_schema_source(name))
 
-@lru_cache(maxsize=10)
-def load_schema(schema_string: str) -> Validator:
-    schema = yaml.load(schema_string)
-
-    local_schema_dictionary = __load_schemas_from_local(
-        [
-            "project.schema.yml",
-            "mpyl_stages.schema.yml",
-            "k8s_api_core.schema.yml",
-            "traefik_v2.schema.yml",
-        ]
-    )
 
-    def load_schema_from_local(uri):
-        return next(
-            (value for key, value in local_schema_dictionary.items() if key in uri), {}
-        )
+@lru_cache(maxsize=1)
+def _converted_schemas() -> dict[str, Any]:
+    converted = pkgutil.get_data(__name__, "validators/schemas.json")
+    return json.loads(converted) if converted else {}
+
 
-    registry: Registry = Registry(retrieve=load_schema_from_local)  # type: ignore[call-arg]
+@lru_cache(maxsize=None)
+def schema_by_name(name: str) -> dict:
+    """
+    :param name: the file name of the schema, like `project.schema.yml`
+    :return: the contents of the schema
+    """
+    converted = _converted_schemas().get(name)
+    if converted and converted["sha256"] == _schema_digest(name):
+        return converted["schema"]
+    return load_read_only(_schema_source(name))
 
-    all_validators = dict(Draft202012Validator.VALIDATORS)
+
+def _retrieve_local_schema(uri: str):
+    name = next((name for name in REFERENCABLE_SCHEMAS if name in uri), None)
+    return referencing.Resource.from_contents(schema_by_name(name)) if name else {}
+
+
+@lru_cache(maxsize=1)
+def _validator_class() -> type["Validator"]:
+    draft_validator = jsonschema.validators.Draft202012Validator
+    all_validators = dict(draft_validator.VALIDATORS)
     existing_validator = all_validators["type"]
 
     def allow_none_validator(validator, types, instance, yaml_schema):
@@ -55,16 +82,46 @@ def load_schema(schema_string: str) -> Validator:
         return existing_validator(validator, types, instance, yaml_schema)
 
     all_validators["type"] = allow_none_validator
-    type_checker = Draft202012Validator.TYPE_CHECKER
+    type_checker = draft_validator.TYPE_CHECKER
 
-    extended_validator = jsonschema.validators.extend(
-        validator=jsonschema.validators.Draft202012Validator,
+    return jsonschema.validators.extend(
+        validator=draft_validator,
         validators=all_validators,
         type_checker=type_checker,
     )
-    return extended_validator(schema=schema, registry=registry)
+
+
+def _create_validator(schema: dict) -> "Validator":
+    registry = referencing.Registry(retrieve=_retrieve_local_schema)
+    return _validator_class()(schema=schema, registry=registry)
+
+
+@lru_cache(maxsize=None)
+def schema_validator(name: str) -> "Validator":
+    """:return: the validator of the schema with this file name, built the first time it is asked for"""
+    return _create_validator(schema_by_name(name))
+
+
+@lru_cache(maxsize=10)
+def load_schema(schema_string: str) -> "Validator":
+    return _create_validator(load_read_only(schema_string))
+
+
+def validate_with_schema(values: dict, name: str):
+    """
+    :param name: the file name of the schema, like `project.schema.yml`
+    :raises `jsonschema.exceptions.ValidationError` when validation fails
+    """
+    compiled = compiled_validator_for_digest(_schema_digest(name))
+    if compiled is not None and compiled(values):
+        return None
+    # invalid values, and schemas that were not compiled, are validated by jsonschema, which explains what is wrong
+    return schema_validator(name).validate(values)
 
 
 def validate(values: dict, schema_string: str):
+    compiled = compiled_validator(schema_string)
+    if compiled is not None and compiled(values):
+        return None
     schema = load_schema(schema_string)
     return schema.validate(values)
@@ -0,0 +1,36 @@
+"""Plain Python validation functions for the schemas of MPyL, generated by `mpyl.validators.compiler`.
+
+They are a fast path in front of `jsonschema`: an instance that a compiled function accepts is valid, an instance that
+it rejects is validated again by `jsonschema`, which produces the error message.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+
+def schema_digest(schema: bytes) -> str:
+    return hashlib.sha256(schema).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def compiled_validator_for_digest(digest: str) -> Optional[Callable[[Any], bool]]:
+    """
+    :param digest: the sha256 digest of the schema
+    :return: the compiled validation function of the schema, or `None` when the schema was not compiled, or changed
+    after it was compiled
+    """
+    from .generated import COMPILED_SCHEMAS  # pylint: disable=import-outside-toplevel
+
+    return next(
+        (
+            function
+            for compiled_digest, function in COMPILED_SCHEMAS.values()
+            if compiled_digest == digest
+        ),
+        None,
+    )
+
+
+def compiled_validator(schema_string: str) -> Optional[Callable[[Any], bool]]:
+    return compiled_validator_for_digest(schema_digest(schema_string.encode("utf-8")))
@@ -0,0 +1,386 @@
+"""Generates `generated.py`, which contains a plain Python validation function for each of the schemas in
+`COMPILED_SCHEMAS`.
+
+A compiled function only answers whether an instance is valid. It never accepts an instance that `jsonschema` would
+reject: keywords that the compiler does not support make the function return `False`, so that the instance is
+validated by `jsonschema` instead, which also produces the error message.
+
+The same command writes `schemas.json`, with every schema of MPyL converted to JSON, which `mpyl.validation` reads
+instead of parsing the YAML of the schemas.
+
+Regenerate both after changing a schema with `pipenv run compile-schemas`.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from jsonschema.validators import Draft202012Validator
+
+from . import schema_digest
+from ..utilities.yaml import load_read_only
+
+SCHEMA_FOLDER = Path(__file__).parent.parent / "schema"
+GENERATED_MODULE = Path(__file__).parent / "generated.py"
+CONVERTED_SCHEMAS = Path(__file__).parent / "schemas.json"
+COMPILED_SCHEMAS = (
+    "project.schema.yml",
+    "run_properties.schema.yml",
+    "mpyl_config.schema.yml",
+)
+REFERENCABLE_SCHEMAS = (
+    "project.schema.yml",
+    "mpyl_stages.schema.yml",
+    "k8s_api_core.schema.yml",
+    "traefik_v2.schema.yml",
+)
+"""The schemas that `mpyl.validation` makes available to references from other schemas"""
+
+_ASSERTED_KEYWORDS = set(Draft202012Validator.VALIDATORS) - {"format"}
+"""Keywords that `jsonschema` validates. Formats are not asserted, because no format checker is configured."""
+
+_TYPE_CHECKS = {
+    "object": "isinstance(instance, dict)",
+    "array": "isinstance(instance, list)",
+    "string": "isinstance(instance, str)",
+    "boolean": "isinstance(instance, bool)",
+    "integer": "(isinstance(instance, int) and not isinstance(instance, bool))",
+    "number": "(isinstance(instance, (int, float)) and not isinstance(instance, bool))",
+    "null": "instance is None",
+}
+
+_HEADER = '''"""Generated by mpyl.validators.compiler from the schemas in mpyl/schema. Do not edit."""
+
+# pylint: skip-file
+import re
+from typing import Any, Callable
+
+
+def _unique(items: list) -> bool:
+    if not all(isinstance(item, str) for item in items):
+        return False  # left to jsonschema, which tells apart values like 1 and True
+    return len(set(items)) == len(items)
+
+'''
+
+
+class UnsupportedSchema(Exception):
+    pass
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _resolve_pointer(document: Any, pointer: str) -> Any:
+    node = document
+    for token in pointer.split("/")[1:] if pointer else []:
+        token = token.replace("~1", "/").replace("~0", "~")
+        try:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        except (KeyError, IndexError, ValueError, TypeError) as exc:
+            raise UnsupportedSchema(f"Unresolvable pointer {pointer}") from exc
+    return node
+
+
+def _literal_check(value: Any) -> str:
+    if value is None or isinstance(value, bool):
+        return f"instance is {value!r}"
+    if isinstance(value, str):
+        return f"(isinstance(instance, str) and instance == {str(value)!r})"
+    raise UnsupportedSchema(f"Unsupported literal {value!r}")
+
+
+class _Compiler:
+    def __init__(self, schema_folder: Path) -> None:
+        self._schema_folder = schema_folder
+        self._documents: dict[str, Any] = {}
+        self._functions: dict[tuple[str, str], str] = {}
+        self._patterns: dict[str, str] = {}
+        self._sources: list[str] = []
+
+    def document(self, name: str) -> Any:
+        if name not in self._documents:
+            self._documents[name] = load_read_only(
+                (self._schema_folder / name).read_bytes()
+            )
+        return self._documents[name]
+
+    def function_for(self, document: str, pointer: str) -> str:
+        key = (document, pointer)
+        if key not in self._functions:
+            name = f"_validate_{len(self._functions)}"
+            # registered before compiling the body, so that recursive references end up here
+            self._functions[key] = name
+            schema = _resolve_pointer(self.document(document), pointer)
+            try:
+                body = self._compile(schema, document, pointer)
+            except UnsupportedSchema as exc:
+                body = [f"return False  # {exc}, validated by jsonschema"]
+            lines = [f"def {name}(instance: Any) -> bool:"]
+            lines += [f"    {line}" for line in body]
+            self._sources.append("\n".join(lines))
+        return self._functions[key]
+
+    def _pattern(self, pattern: str) -> str:
+        if pattern not in self._patterns:
+            self._patterns[pattern] = f"_PATTERN_{len(self._patterns)}"
+        return self._patterns[pattern]
+
+    def _reference(self, reference: str, document: str) -> str:
+        location, _, fragment = reference.partition("#")
+        if fragment and not fragment.startswith("/"):
+            raise UnsupportedSchema(f"Unsupported reference {reference}")
+        name = Path(location).name if location else document
+        if location and name not in REFERENCABLE_SCHEMAS:
+            raise UnsupportedSchema(f"Unresolvable reference {reference}")
+        return self.function_for(name, fragment)
+
+    def _compile(  # pylint: disable=too-many-branches,too-many-statements,too-many-locals
+        self, schema: Any, document: str, pointer: str
+    ) -> list[str]:
+        if schema is True or schema == {}:
+            return ["return True"]
+        if schema is False:
+            return ["return False"]
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Unsupported schema at {pointer}")
+
+        def sub(*path: Any) -> str:
+            return self.function_for(
+                document, pointer + "".join(f"/{_escape(str(p))}" for p in path)
+            )
+
+        unsupported = sorted(
+            set(schema)
+            & _ASSERTED_KEYWORDS
+            - {
+                "$ref",
+                "type",
+                "enum",
+                "const",
+                "properties",
+                "required",
+                "additionalProperties",
+                "propertyNames",
+                "minProperties",
+                "maxProperties",
+                "items",
+                "minItems",
+                "maxItems",
+                "uniqueItems",
+                "minLength",
+                "maxLength",
+                "pattern",
+                "minimum",
+                "maximum",
+                "allOf",
+                "anyOf",
+                "oneOf",
+                "not",
+            }
+        )
+        if unsupported:
+            raise UnsupportedSchema(f"Unsupported keyword {unsupported[0]}")
+
+        lines: list[str] = []
+        if "$ref" in schema:
+            lines.append(
+                f"if not {self._reference(schema['$ref'], document)}(instance):"
+            )
+            lines.append("    return False")
+
+        if "type" in schema:
+            types = (
+                schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            )
+            checks = []
+            for schema_type in types:
+                if schema_type is None:
+                    # the allow-None extension of mpyl.validation raises for the types that follow it
+                    checks.append("instance is None")
+                    break
+                if schema_type not in _TYPE_CHECKS:
+                    raise UnsupportedSchema(f"Unsupported type {schema_type}")
+                checks.append(_TYPE_CHECKS[schema_type])
+            lines.append(f"if not ({' or '.join(checks)}):")
+            lines.append("    return False")
+
+        if "enum" in schema:
+            checks = [_literal_check(value) for value in schema["enum"]]
+            lines.append(f"if not ({' or '.join(checks) or 'False'}):")
+            lines.append("    return False")
+        if "const" in schema:
+            lines.append(f"if not ({_literal_check(schema['const'])}):")
+            lines.append("    return False")
+
+        object_lines: list[str] = []
+        for required in schema.get("required", []):
+            object_lines.append(f"if {str(required)!r} not in instance:")
+            object_lines.append("    return False")
+        if "minProperties" in schema:
+            object_lines.append(f"if len(instance) < {int(schema['minProperties'])}:")
+            object_lines.append("    return False")
+        if "maxProperties" in schema:
+            object_lines.append(f"if len(instance) > {int(schema['maxProperties'])}:")
+            object_lines.append("    return False")
+        properties = schema.get("properties", {})
+        for name in properties:
+            object_lines.append(
+                f"if {str(name)!r} in instance and not "
+                f"{sub('properties', name)}(instance[{str(name)!r}]):"
+            )
+            object_lines.append("    return False")
+        additional = schema.get("additionalProperties", True)
+        if additional is not True and additional != {}:
+            known = ", ".join(repr(str(name)) for name in properties)
+            object_lines.append("for key, value in instance.items():")
+            object_lines.append(
+                f"    if key in ({known}{',' if len(properties) == 1 else ''}):"
+            )
+            object_lines.append("        continue")
+            if additional is False:
+                object_lines.append("    return False")
+            else:
+                object_lines.append(f"    if not {sub('additionalProperties')}(value):")
+                object_lines.append("        return False")
+        if "propertyNames" in schema:
+            object_lines.append("for key in instance:")
+            object_lines.append(f"    if not {sub('propertyNames')}(key):")
+            object_lines.append("        return False")
+        if object_lines:
+            lines.append("if isinstance(instance, dict):")
+            lines += [f"    {line}" for line in object_lines]
+
+        array_lines: list[str] = []
+        if "minItems" in schema:
+            array_lines.append(f"if len(instance) < {int(schema['minItems'])}:")
+            array_lines.append("    return False")
+        if "maxItems" in schema:
+            array_lines.append(f"if len(instance) > {int(schema['maxItems'])}:")
+            array_lines.append("    return False")
+        if schema.get("uniqueItems") is True:
+            array_lines.append("if not _unique(instance):")
+            array_lines.append("    return False")
+        if "items" in schema:
+            array_lines.append("for item in instance:")
+            array_lines.append(f"    if not {sub('items')}(item):")
+            array_lines.append("        return False")
+        if array_lines:
+            lines.append("if isinstance(instance, list):")
+            lines += [f"    {line}" for line in array_lines]
+
+        string_lines: list[str] = []
+        if "minLength" in schema:
+            string_lines.append(f"if len(instance) < {int(schema['minLength'])}:")
+            string_lines.append("    return False")
+        if "maxLength" in schema:
+            string_lines.append(f"if len(instance) > {int(schema['maxLength'])}:")
+            string_lines.append("    return False")
+        if "pattern" in schema:
+            string_lines.append(
+                f"if not {self._pattern(str(schema['pattern']))}.search(instance):"
+            )
+            string_lines.append("    return False")
+        if string_lines:
+            lines.append("if isinstance(instance, str):")
+            lines += [f"    {line}" for line in string_lines]
+
+        number_lines: list[str] = []
+        for keyword, operator in (("minimum", "<"), ("maximum", ">")):
+            if keyword in schema:
+                bound = schema[keyword]
+                if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+                    raise UnsupportedSchema(f"Unsupported {keyword} {bound!r}")
+                number_lines.append(f"if instance {operator} {bound!r}:")
+                number_lines.append("    return False")
+        if number_lines:
+            lines.append(f"if {_TYPE_CHECKS['number']}:")
+            lines += [f"    {line}" for line in number_lines]
+
+        for index in range(len(schema.get("allOf", []))):
+            lines.append(f"if not {sub('allOf', index)}(instance):")
+            lines.append("    return False")
+        if "anyOf" in schema:
+            calls = [
+                f"{sub('anyOf', i)}(instance)" for i in range(len(schema["anyOf"]))
+            ]
+            lines.append(f"if not ({' or '.join(calls) or 'False'}):")
+            lines.append("    return False")
+        if "oneOf" in schema:
+            calls = [
+                f"{sub('oneOf', i)}(instance)" for i in range(len(schema["oneOf"]))
+            ]
+            lines.append(f"if [{', '.join(calls)}].count(True) != 1:")
+            lines.append("    return False")
+        if "not" in schema:
+            lines.append(f"if {sub('not')}(instance):")
+            lines.append("    return False")
+
+        return lines + ["return True"]
+
+    def source(self, entries: dict[str, tuple[str, str]]) -> str:
+        patterns = [
+            f"{name} = re.compile({pattern!r})"
+            for pattern, name in self._patterns.items()
+        ]
+        compiled = [
+            f"    {name!r}: ({digest!r}, {function}),"
+            for name, (digest, function) in entries.items()
+        ]
+        return (
+            _HEADER
+            + "".join(f"{line}\n" for line in patterns)
+            + "\n\n"
+            + "\n\n\n".join(self._sources)
+            + "\n\n\nCOMPILED_SCHEMAS: dict[str, tuple[str, Callable[[Any], bool]]] = {\n"
+            + "\n".join(compiled)
+            + "\n}\n"
+            + '"""The validation function of each schema, by name, with the sha256 digest of the schema it was '
+            + 'compiled from"""\n'
+        )
+
+
+def generate(schema_folder: Path = SCHEMA_FOLDER) -> str:
+    """:return: the source code of the module with the compiled validation functions"""
+    compiler = _Compiler(schema_folder)
+    entries = {
+        name: (
+            schema_digest((schema_folder / name).read_bytes()),
+            compiler.function_for(name, ""),
+        )
+        for name in COMPILED_SCHEMAS
+    }
+    return _format(compiler.source(entries))
+
+
+def _format(source: str) -> str:
+    try:
+        import black  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return source
+    return black.format_str(source, mode=black.Mode())
+
+
+def convert(schema_folder: Path = SCHEMA_FOLDER) -> str:
+    """:return: the schemas in the folder as a JSON document, by name, with the sha256 digest of their YAML"""
+    converted = {}
+    for path in sorted(schema_folder.glob("*.schema.yml")):
+        contents = path.read_bytes()
+        schema = load_read_only(contents)
+        if json.loads(json.dumps(schema)) != schema:
+            print(f"Skipped {path.name}, which can not be represented as JSON")
+            continue
+        converted[path.name] = {"sha256": schema_digest(contents), "schema": schema}
+    return json.dumps(converted, separators=(",", ":")) + "\n"
+
+
+def main() -> None:
+    GENERATED_MODULE.write_text(generate(), encoding="utf-8")
+    print(f"Compiled {', '.join(COMPILED_SCHEMAS)} to {GENERATED_MODULE}")
+    CONVERTED_SCHEMAS.write_text(convert(), encoding="utf-8")
+    print(f"Converted the schemas in {SCHEMA_FOLDER} to {CONVERTED_SCHEMAS}")
+
+
+if __name__ == "__main__":
+    main()
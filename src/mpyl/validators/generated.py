@@ -0,0 +1,1238 @@
+"""Generated by mpyl.validators.compiler from the schemas in mpyl/schema. Do not edit."""
+
+# pylint: skip-file
+import re
+from typing import Any, Callable
+
+
+def _unique(items: list) -> bool:
+    if not all(isinstance(item, str) for item in items):
+        return False  # left to jsonschema, which tells apart values like 1 and True
+    return len(set(items)) == len(items)
+
+
+def _validate_1(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_2(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_3(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_4(instance: Any) -> bool:
+    if not ((isinstance(instance, int) and not isinstance(instance, bool))):
+        return False
+    return True
+
+
+def _validate_6(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_5(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+        if not _unique(instance):
+            return False
+        for item in instance:
+            if not _validate_6(item):
+                return False
+    return True
+
+
+def _validate_7(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_9(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_10(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_11(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_12(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_14(instance: Any) -> bool:
+    if not (
+        (isinstance(instance, str) and instance == "build")
+        or (isinstance(instance, str) and instance == "test")
+        or (isinstance(instance, str) and instance == "deploy")
+        or (isinstance(instance, str) and instance == "postdeploy")
+    ):
+        return False
+    return True
+
+
+def _validate_13(instance: Any) -> bool:
+    if not _validate_14(instance):
+        return False
+    return True
+
+
+def _validate_8(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if len(instance) < 1:
+            return False
+        if "build" in instance and not _validate_9(instance["build"]):
+            return False
+        if "test" in instance and not _validate_10(instance["test"]):
+            return False
+        if "deploy" in instance and not _validate_11(instance["deploy"]):
+            return False
+        if "postdeploy" in instance and not _validate_12(instance["postdeploy"]):
+            return False
+        for key, value in instance.items():
+            if key in ("build", "test", "deploy", "postdeploy"):
+                continue
+            return False
+        for key in instance:
+            if not _validate_13(key):
+                return False
+    return True
+
+
+def _validate_16(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, dict):
+        for key, value in instance.items():
+            if key in ():
+                continue
+            return False
+    return True
+
+
+def _validate_17(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, dict):
+        for key, value in instance.items():
+            if key in ():
+                continue
+            return False
+    return True
+
+
+def _validate_15(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "specs" not in instance:
+            return False
+        if "recordKey" not in instance:
+            return False
+        if "specs" in instance and not _validate_16(instance["specs"]):
+            return False
+        if "recordKey" in instance and not _validate_17(instance["recordKey"]):
+            return False
+        for key, value in instance.items():
+            if key in ("specs", "recordKey"):
+                continue
+            return False
+    return True
+
+
+def _validate_20(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_21(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_22(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_23(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_19(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "build" in instance and not _validate_20(instance["build"]):
+            return False
+        if "test" in instance and not _validate_21(instance["test"]):
+            return False
+        if "deploy" in instance and not _validate_22(instance["deploy"]):
+            return False
+        if "postdeploy" in instance and not _validate_23(instance["postdeploy"]):
+            return False
+        for key, value in instance.items():
+            if key in ("build", "test", "deploy", "postdeploy"):
+                continue
+            return False
+    return True
+
+
+def _validate_18(instance: Any) -> bool:
+    if not _validate_19(instance):
+        return False
+    return True
+
+
+def _validate_24(instance: Any) -> bool:
+    return True
+
+
+def _validate_0(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "name" not in instance:
+            return False
+        if "stages" not in instance:
+            return False
+        if "description" not in instance:
+            return False
+        if "maintainer" not in instance:
+            return False
+        if "name" in instance and not _validate_1(instance["name"]):
+            return False
+        if "description" in instance and not _validate_2(instance["description"]):
+            return False
+        if "mpylVersion" in instance and not _validate_3(instance["mpylVersion"]):
+            return False
+        if "projectYmlVersion" in instance and not _validate_4(
+            instance["projectYmlVersion"]
+        ):
+            return False
+        if "maintainer" in instance and not _validate_5(instance["maintainer"]):
+            return False
+        if "pipeline" in instance and not _validate_7(instance["pipeline"]):
+            return False
+        if "stages" in instance and not _validate_8(instance["stages"]):
+            return False
+        if "postdeploy" in instance and not _validate_15(instance["postdeploy"]):
+            return False
+        if "dependencies" in instance and not _validate_18(instance["dependencies"]):
+            return False
+        for key, value in instance.items():
+            if key in (
+                "name",
+                "description",
+                "mpylVersion",
+                "projectYmlVersion",
+                "maintainer",
+                "pipeline",
+                "stages",
+                "postdeploy",
+                "dependencies",
+            ):
+                continue
+            if not _validate_24(value):
+                return False
+    return True
+
+
+def _validate_26(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_29(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_30(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_31(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_32(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_33(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_34(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_28(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "id" not in instance:
+            return False
+        if "run_url" not in instance:
+            return False
+        if "change_url" not in instance:
+            return False
+        if "tests_url" not in instance:
+            return False
+        if "user" not in instance:
+            return False
+        if "id" in instance and not _validate_29(instance["id"]):
+            return False
+        if "run_url" in instance and not _validate_30(instance["run_url"]):
+            return False
+        if "change_url" in instance and not _validate_31(instance["change_url"]):
+            return False
+        if "tests_url" in instance and not _validate_32(instance["tests_url"]):
+            return False
+        if "user" in instance and not _validate_33(instance["user"]):
+            return False
+        if "user_email" in instance and not _validate_34(instance["user_email"]):
+            return False
+        for key, value in instance.items():
+            if key in (
+                "id",
+                "run_url",
+                "change_url",
+                "tests_url",
+                "user",
+                "user_email",
+            ):
+                continue
+            return False
+    return True
+
+
+def _validate_36(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_37(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_38(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_39(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_35(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "revision" not in instance:
+            return False
+        if "revision" in instance and not _validate_36(instance["revision"]):
+            return False
+        if "branch" in instance and not _validate_37(instance["branch"]):
+            return False
+        if "pr_number" in instance and not _validate_38(instance["pr_number"]):
+            return False
+        if "tag" in instance and not _validate_39(instance["tag"]):
+            return False
+        for key, value in instance.items():
+            if key in ("revision", "branch", "pr_number", "tag"):
+                continue
+            return False
+    return True
+
+
+def _validate_27(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "run" not in instance:
+            return False
+        if "versioning" not in instance:
+            return False
+        if "run" in instance and not _validate_28(instance["run"]):
+            return False
+        if "versioning" in instance and not _validate_35(instance["versioning"]):
+            return False
+    return True
+
+
+def _validate_42(instance: Any) -> bool:
+    if not _validate_14(instance):
+        return False
+    return True
+
+
+def _validate_43(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_41(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "name" in instance and not _validate_42(instance["name"]):
+            return False
+        if "icon" in instance and not _validate_43(instance["icon"]):
+            return False
+        for key, value in instance.items():
+            if key in ("name", "icon"):
+                continue
+            return False
+    return True
+
+
+def _validate_40(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_41(item):
+                return False
+    return True
+
+
+def _validate_25(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "build" not in instance:
+            return False
+        if "stages" not in instance:
+            return False
+        if "mpylVersion" in instance and not _validate_26(instance["mpylVersion"]):
+            return False
+        if "build" in instance and not _validate_27(instance["build"]):
+            return False
+        if "stages" in instance and not _validate_40(instance["stages"]):
+            return False
+        for key, value in instance.items():
+            if key in ("mpylVersion", "build", "stages"):
+                continue
+            return False
+    return True
+
+
+def _validate_46(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_49(instance: Any) -> bool:
+    if not (isinstance(instance, str) or instance is None):
+        return False
+    return True
+
+
+def _validate_48(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "changedFilesPath" in instance and not _validate_49(
+            instance["changedFilesPath"]
+        ):
+            return False
+    return True
+
+
+def _validate_47(instance: Any) -> bool:
+    if not _validate_48(instance):
+        return False
+    return True
+
+
+def _validate_52(instance: Any) -> bool:
+    if not (
+        (isinstance(instance, str) and instance == "filesystem")
+        or (isinstance(instance, str) and instance == "git")
+    ):
+        return False
+    return True
+
+
+def _validate_53(instance: Any) -> bool:
+    if not (isinstance(instance, bool)):
+        return False
+    return True
+
+
+def _validate_55(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_54(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_55(item):
+                return False
+    return True
+
+
+def _validate_51(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "mode" in instance and not _validate_52(instance["mode"]):
+            return False
+        if "cache" in instance and not _validate_53(instance["cache"]):
+            return False
+        if "ignore" in instance and not _validate_54(instance["ignore"]):
+            return False
+        for key, value in instance.items():
+            if key in ("mode", "cache", "ignore"):
+                continue
+            return False
+    return True
+
+
+def _validate_50(instance: Any) -> bool:
+    if not _validate_51(instance):
+        return False
+    return True
+
+
+def _validate_58(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_59(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_60(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_61(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_62(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_63(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_64(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_57(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "baseNamespace" in instance and not _validate_58(instance["baseNamespace"]):
+            return False
+        if "workspaceConfigMap" in instance and not _validate_59(
+            instance["workspaceConfigMap"]
+        ):
+            return False
+        if "workspaceFileKey" in instance and not _validate_60(
+            instance["workspaceFileKey"]
+        ):
+            return False
+        if "daemon" in instance and not _validate_61(instance["daemon"]):
+            return False
+        if "webserver" in instance and not _validate_62(instance["webserver"]):
+            return False
+        if "globalServiceAccountOverride" in instance and not _validate_63(
+            instance["globalServiceAccountOverride"]
+        ):
+            return False
+        if "userCodeHelmChartVersion" in instance and not _validate_64(
+            instance["userCodeHelmChartVersion"]
+        ):
+            return False
+        for key, value in instance.items():
+            if key in (
+                "baseNamespace",
+                "workspaceConfigMap",
+                "workspaceFileKey",
+                "daemon",
+                "webserver",
+                "globalServiceAccountOverride",
+                "userCodeHelmChartVersion",
+            ):
+                continue
+            return False
+    return True
+
+
+def _validate_56(instance: Any) -> bool:
+    if not _validate_57(instance):
+        return False
+    return True
+
+
+def _validate_68(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_67(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_68(item):
+                return False
+    return True
+
+
+def _validate_71(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_73(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_72(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_73(item):
+                return False
+    return True
+
+
+def _validate_75(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_74(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_75(item):
+                return False
+    return True
+
+
+def _validate_77(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_76(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_77(item):
+                return False
+    return True
+
+
+def _validate_79(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_78(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_79(item):
+                return False
+    return True
+
+
+def _validate_81(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+    return True
+
+
+def _validate_80(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_81(item):
+                return False
+    return True
+
+
+def _validate_82(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "pr" not in instance:
+            return False
+        if "test" not in instance:
+            return False
+        if "acceptance" not in instance:
+            return False
+        if "production" not in instance:
+            return False
+    return True
+
+
+def _validate_83(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "all" not in instance:
+            return False
+    return True
+
+
+def _validate_70(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "name" not in instance:
+            return False
+        if "name" in instance and not _validate_71(instance["name"]):
+            return False
+        if "pr" in instance and not _validate_72(instance["pr"]):
+            return False
+        if "test" in instance and not _validate_74(instance["test"]):
+            return False
+        if "acceptance" in instance and not _validate_76(instance["acceptance"]):
+            return False
+        if "production" in instance and not _validate_78(instance["production"]):
+            return False
+        if "all" in instance and not _validate_80(instance["all"]):
+            return False
+        for key, value in instance.items():
+            if key in ("name", "pr", "test", "acceptance", "production", "all"):
+                continue
+            return False
+    if [_validate_82(instance), _validate_83(instance)].count(True) != 1:
+        return False
+    return True
+
+
+def _validate_69(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        if len(instance) < 1:
+            return False
+        for item in instance:
+            if not _validate_70(item):
+                return False
+    return True
+
+
+def _validate_66(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "default" not in instance:
+            return False
+        if "addresses" not in instance:
+            return False
+        if "default" in instance and not _validate_67(instance["default"]):
+            return False
+        if "addresses" in instance and not _validate_69(instance["addresses"]):
+            return False
+    return True
+
+
+def _validate_65(instance: Any) -> bool:
+    if not _validate_66(instance):
+        return False
+    return True
+
+
+def _validate_91(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_90(instance: Any) -> bool:
+    if not _validate_91(instance):
+        return False
+    return True
+
+
+def _validate_92(instance: Any) -> bool:
+    if not _validate_91(instance):
+        return False
+    return True
+
+
+def _validate_89(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "maxSurge" in instance and not _validate_90(instance["maxSurge"]):
+            return False
+        if "maxUnavailable" in instance and not _validate_92(
+            instance["maxUnavailable"]
+        ):
+            return False
+    return True
+
+
+def _validate_88(instance: Any) -> bool:
+    if not _validate_89(instance):
+        return False
+    return True
+
+
+def _validate_93(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    if not (
+        (isinstance(instance, str) and instance == "RollingUpdate")
+        or (isinstance(instance, str) and instance == "Recreate")
+    ):
+        return False
+    return True
+
+
+def _validate_87(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "rollingUpdate" in instance and not _validate_88(instance["rollingUpdate"]):
+            return False
+        if "type" in instance and not _validate_93(instance["type"]):
+            return False
+    return True
+
+
+def _validate_86(instance: Any) -> bool:
+    if not _validate_87(instance):
+        return False
+    return True
+
+
+def _validate_85(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "deploymentStrategy" not in instance:
+            return False
+        if "deploymentStrategy" in instance and not _validate_86(
+            instance["deploymentStrategy"]
+        ):
+            return False
+    return True
+
+
+def _validate_84(instance: Any) -> bool:
+    if not _validate_85(instance):
+        return False
+    return True
+
+
+def _validate_97(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_96(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_97(item):
+                return False
+    return True
+
+
+def _validate_102(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_105(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_106(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_107(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_108(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_109(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_110(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "pr" not in instance:
+            return False
+        if "test" not in instance:
+            return False
+        if "acceptance" not in instance:
+            return False
+        if "production" not in instance:
+            return False
+    return True
+
+
+def _validate_111(instance: Any) -> bool:
+    if isinstance(instance, dict):
+        if "all" not in instance:
+            return False
+    return True
+
+
+def _validate_104(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "pr" in instance and not _validate_105(instance["pr"]):
+            return False
+        if "test" in instance and not _validate_106(instance["test"]):
+            return False
+        if "acceptance" in instance and not _validate_107(instance["acceptance"]):
+            return False
+        if "production" in instance and not _validate_108(instance["production"]):
+            return False
+        if "all" in instance and not _validate_109(instance["all"]):
+            return False
+        for key, value in instance.items():
+            if key in ("pr", "test", "acceptance", "production", "all"):
+                continue
+            return False
+    if [_validate_110(instance), _validate_111(instance)].count(True) != 1:
+        return False
+    return True
+
+
+def _validate_103(instance: Any) -> bool:
+    if not _validate_104(instance):
+        return False
+    return True
+
+
+def _validate_113(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_112(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_113(item):
+                return False
+    return True
+
+
+def _validate_115(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_114(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_115(item):
+                return False
+    return True
+
+
+def _validate_101(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "name" in instance and not _validate_102(instance["name"]):
+            return False
+        if "clusterEnv" in instance and not _validate_103(instance["clusterEnv"]):
+            return False
+        if "middlewares" in instance and not _validate_112(instance["middlewares"]):
+            return False
+        if "entrypoints" in instance and not _validate_114(instance["entrypoints"]):
+            return False
+        for key, value in instance.items():
+            if key in ("name", "clusterEnv", "middlewares", "entrypoints"):
+                continue
+            return False
+    return True
+
+
+def _validate_100(instance: Any) -> bool:
+    if not (isinstance(instance, list)):
+        return False
+    if isinstance(instance, list):
+        for item in instance:
+            if not _validate_101(item):
+                return False
+    return True
+
+
+def _validate_99(instance: Any) -> bool:
+    if not _validate_100(instance):
+        return False
+    return True
+
+
+def _validate_118(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_119(instance: Any) -> bool:
+    if not (isinstance(instance, str)):
+        return False
+    return True
+
+
+def _validate_117(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "httpMiddleware" not in instance:
+            return False
+        if "tls" not in instance:
+            return False
+        if "httpMiddleware" in instance and not _validate_118(
+            instance["httpMiddleware"]
+        ):
+            return False
+        if "tls" in instance and not _validate_119(instance["tls"]):
+            return False
+        for key, value in instance.items():
+            if key in ("httpMiddleware", "tls"):
+                continue
+            return False
+    return True
+
+
+def _validate_116(instance: Any) -> bool:
+    if not _validate_117(instance):
+        return False
+    return True
+
+
+def _validate_120(instance: Any) -> bool:
+    return True
+
+
+def _validate_98(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "additionalTraefikRoutes" in instance and not _validate_99(
+            instance["additionalTraefikRoutes"]
+        ):
+            return False
+        if "traefikDefaults" in instance and not _validate_116(
+            instance["traefikDefaults"]
+        ):
+            return False
+        for key, value in instance.items():
+            if key in ("additionalTraefikRoutes", "traefikDefaults"):
+                continue
+            if not _validate_120(value):
+                return False
+    return True
+
+
+def _validate_95(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "allowedMaintainers" not in instance:
+            return False
+        if "deployment" not in instance:
+            return False
+        if "allowedMaintainers" in instance and not _validate_96(
+            instance["allowedMaintainers"]
+        ):
+            return False
+        if "deployment" in instance and not _validate_98(instance["deployment"]):
+            return False
+        for key, value in instance.items():
+            if key in ("allowedMaintainers", "deployment"):
+                continue
+            return False
+    return True
+
+
+def _validate_94(instance: Any) -> bool:
+    if not _validate_95(instance):
+        return False
+    return True
+
+
+def _validate_45(instance: Any) -> bool:
+    if not (isinstance(instance, dict)):
+        return False
+    if isinstance(instance, dict):
+        if "vcs" not in instance:
+            return False
+        if "mpylVersion" in instance and not _validate_46(instance["mpylVersion"]):
+            return False
+        if "vcs" in instance and not _validate_47(instance["vcs"]):
+            return False
+        if "discovery" in instance and not _validate_50(instance["discovery"]):
+            return False
+        if "dagster" in instance and not _validate_56(instance["dagster"]):
+            return False
+        if "whiteLists" in instance and not _validate_65(instance["whiteLists"]):
+            return False
+        if "kubernetes" in instance and not _validate_84(instance["kubernetes"]):
+            return False
+        if "project" in instance and not _validate_94(instance["project"]):
+            return False
+    return True
+
+
+def _validate_44(instance: Any) -> bool:
+    if not _validate_45(instance):
+        return False
+    return True
+
+
+COMPILED_SCHEMAS: dict[str, tuple[str, Callable[[Any], bool]]] = {
+    "project.schema.yml": (
+        "7e0118a1edfa010973340d40ffe9a6f7054aca8fc9555061d07a7c18ae208993",
+        _validate_0,
+    ),
+    "run_properties.schema.yml": (
+        "01733a8a40ab4bc1ecf9dfc09c67b696ff655e01c89f8f3d177c39fb954e9e87",
+        _validate_25,
+    ),
+    "mpyl_config.schema.yml": (
+        "dbb36c16afea5f4aed1a3f190e1ad8bafc668ba3ba477f3a52a2c57e2847f101",
+        _validate_44,
+    ),
+}
+"""The validation function of each schema, by name, with the sha256 digest of the schema it was compiled from"""
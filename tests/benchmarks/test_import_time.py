@@ -0,0 +1,90 @@
+import subprocess
+import sys
+from functools import lru_cache
+
+import pytest
+
+from tests import root_test_path
+from tests.cli.commands import config_path, run_properties_path
+
+ROUNDS = 3
+HEAVY_DEPENDENCIES = ("kubernetes", "jsonschema", "mypy", "deepdiff")
+"""Dependencies that only some steps and commands need, which must not be imported to start the others"""
+
+INVOKE_CLI = (
+    "import sys; from src.mpyl import add_commands, main_group; "
+    "add_commands(); main_group(sys.argv[1:])"
+)
+
+COMMANDS = {
+    "plan discover": (
+        0.6,
+        ["plan", "-c", str(config_path), "-p", str(run_properties_path), "discover"],
+    ),
+    "health": (0.45, ["health"]),
+    "projects lint": (0.6, ["projects", "-c", str(config_path), "lint"]),
+}
+"""The import time budget of each command, as a fraction of the time it takes to import every command of the CLI.
+Relative budgets hold up on slow or busy machines, where absolute import times vary widely."""
+
+
+def _import_times(*arguments: str) -> tuple[float, list[str]]:
+    """:return: the total import time in milliseconds, and the names of the imported modules"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        cwd=root_test_path.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, modules = 0, []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header
+        modules.append(name.strip())
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1000, modules
+
+
+def _fastest(*arguments: str) -> tuple[float, list[str]]:
+    return min((_import_times(*arguments) for _ in range(ROUNDS)), key=lambda r: r[0])
+
+
+@lru_cache(maxsize=1)
+def _reference() -> tuple[float, float]:
+    """:return: the import time of the interpreter, and of every command of the CLI"""
+    interpreter, _ = _fastest("-c", "pass")
+    everything, _ = _fastest("-c", INVOKE_CLI, "--help")
+    return interpreter, everything
+
+
+class TestImportTime:
+    @pytest.mark.parametrize("command", COMMANDS)
+    def test_command_does_not_import_heavy_dependencies(self, command: str):
+        _, arguments = COMMANDS[command]
+        _, modules = _import_times("-c", INVOKE_CLI, *arguments, "--help")
+        heavy = sorted(
+            {
+                module.split(".")[0]
+                for module in modules
+                if module.split(".")[0] in HEAVY_DEPENDENCIES
+            }
+        )
+        assert not heavy, f"mpyl {command} imports {', '.join(heavy)}"
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("command", COMMANDS)
+    def test_command_stays_within_import_budget(self, command: str):
+        budget, arguments = COMMANDS[command]
+        interpreter, everything = _reference()
+        total, _ = _fastest("-c", INVOKE_CLI, *arguments, "--help")
+        milliseconds = total - interpreter
+        fraction = milliseconds / (everything - interpreter)
+        assert fraction < budget, (
+            f"mpyl {command} imports in {milliseconds:.0f} ms, "
+            f"{fraction:.0%} of the time it takes to import every command"
+        )
@@ -0,0 +1,122 @@
+import gc
+import json
+import pickle
+import tracemalloc
+from pathlib import Path
+from string import Template
+
+import pytest
+
+from src.mpyl.project import Project
+from src.mpyl.utilities.yaml import load_read_only
+
+NUMBER_OF_PROJECTS = 5000
+MAX_BYTES_PER_PROJECT = 5 * 1024
+
+PROJECT_TEMPLATE = """
+name: 'service-$index'
+description: 'Synthetic project $index'
+stages:
+  build: Docker Build
+  test: Docker Test
+  deploy: Kubernetes Deploy
+  postdeploy: Skip Postdeploy
+maintainer: ['Team $team', 'MPyL']
+dependencies:
+  build:
+    - 'libraries/shared-$team/'
+  test:
+    - 'contracts/api/'
+kubernetes:
+  namespace:
+    all: 'namespace-$team'
+deployments:
+  - name: 'service-$index'
+    properties:
+      env:
+        - key: ENVIRONMENT
+          pr: 'pull-request'
+          test: 'test'
+          acceptance: 'acceptance'
+          production: 'production'
+    kubernetes:
+      portMappings:
+        8080: 80
+      livenessProbe:
+        path:
+          all: /health
+      metrics:
+        enabled: true
+      resources:
+        instances:
+          all: 2
+        limit:
+          cpus:
+            all: 0.5
+          mem:
+            all: 1024
+    traefik:
+      hosts:
+        - host:
+            all: "Host(`service-$index.example.com`)"
+          tls:
+            all: 'tls-secret'
+          whitelists:
+            all: ['VPN']
+"""
+
+
+def _synthetic_repository() -> list[str]:
+    """JSON renditions of the project template. Decoding them creates new strings for every project, like parsing the
+    YAML would, in a fraction of the time."""
+    template = Template(json.dumps(load_read_only(PROJECT_TEMPLATE)))
+    return [
+        template.substitute(index=index, team=index % 50)
+        for index in range(NUMBER_OF_PROJECTS)
+    ]
+
+
+def _load(documents: list[str]) -> list[Project]:
+    return [
+        Project.from_config(
+            json.loads(document), Path(f"service-{index}/deployment/project.yml")
+        )
+        for index, document in enumerate(documents)
+    ]
+
+
+class TestProjectMemory:
+    @pytest.mark.benchmark
+    def test_memory_of_synthetic_repository(self):
+        documents = _synthetic_repository()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            projects = _load(documents)
+            gc.collect()
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(projects) == NUMBER_OF_PROJECTS
+        assert retained // NUMBER_OF_PROJECTS < MAX_BYTES_PER_PROJECT, (
+            f"{NUMBER_OF_PROJECTS} projects retain {retained / 1024 / 1024:.1f} MiB "
+            f"({retained // NUMBER_OF_PROJECTS} bytes per project)"
+        )
+
+    def test_projects_are_slotted_and_share_strings(self):
+        first, second = _load(_synthetic_repository()[:2])
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(first.deployments[0].kubernetes.resources, "__dict__")
+        assert first.maintainer[1] is second.maintainer[1]
+        assert list(first.stages.all())[0] is list(second.stages.all())[0]
+
+    def test_pickle_roundtrip_keeps_equality(self):
+        projects = _load(_synthetic_repository()[:10])
+        restored = pickle.loads(pickle.dumps(projects, pickle.HIGHEST_PROTOCOL))
+        assert restored == projects
+        assert {hash(project) for project in restored} == set(map(hash, projects))
+        for original, copy in zip(projects, restored):
+            assert copy.deployments == original.deployments
+            assert copy.header == original.header
+            assert copy.kubernetes == original.kubernetes
@@ -0,0 +1,49 @@
+import pickle
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.mpyl.run_plan import RunPlan
+from tests.benchmarks.test_project_memory import _load, _synthetic_repository
+from tests.test_resources.test_data import TestStage
+
+ROUNDS = 3
+STAGES = [TestStage.build(), TestStage.test(), TestStage.deploy()]
+
+
+def _fastest(load) -> float:
+    fastest = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        load()
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest
+
+
+@pytest.mark.benchmark
+class TestRunPlanLoading:
+    def test_loading_one_project_does_not_load_the_others(self):
+        projects = _load(_synthetic_repository())
+        run_plan = RunPlan.create(
+            {project.header for project in projects},
+            {stage: set(projects) for stage in STAGES},
+        )
+
+        with TemporaryDirectory() as folder:
+            plan_file = Path(folder) / "run_plan.bin"
+            pickle_file = Path(folder) / "run_plan.pickle"
+            run_plan.write_to_file(plan_file)
+            pickle_file.write_bytes(pickle.dumps(run_plan, pickle.HIGHEST_PROTOCOL))
+
+            one_project = _fastest(lambda: RunPlan.load("service-1", plan_file))
+            pickled = _fastest(lambda: RunPlan.load(path=pickle_file))
+            loaded = RunPlan.load("service-1", plan_file)
+
+        assert loaded.get_project_to_execute("deploy", "service-1") == projects[1]
+        assert len(loaded.get_headers_for_stage_name("deploy", True)) == len(projects)
+        assert one_project < pickled / 5, (
+            f"Loading one of {len(projects)} projects: {one_project * 1000:.1f} ms, "
+            f"the whole pickled plan: {pickled * 1000:.1f} ms"
+        )
@@ -0,0 +1,53 @@
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pytest
+
+from src.mpyl.run_plan import RunPlan
+from tests.test_resources.test_data import TestStage
+from tests.test_run_plan import stub_project
+
+ROUNDS = 3
+SMALL_PLAN = 500
+LARGE_PLAN = 5000
+STAGES = [TestStage.build(), TestStage.test(), TestStage.deploy()]
+
+
+def _write(run_plan: RunPlan, folder: Path) -> float:
+    fastest = float("inf")
+    with patch("src.mpyl.run_plan.RUN_PLAN_JSON_FILE", folder / "run_plan.json"):
+        with patch(
+            "src.mpyl.run_plan.RUN_PLAN_SUMMARY_FILE", folder / "run_plan_summary.md"
+        ):
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                run_plan.to_markdown()
+                run_plan.write_to_json_file()
+                run_plan.write_to_summary_file()
+                run_plan.select_project("project-0").get_project_to_execute(
+                    "build", "project-0"
+                )
+                fastest = min(fastest, time.perf_counter() - start)
+    return fastest
+
+
+def _plan(size: int) -> RunPlan:
+    projects = {stub_project(f"project-{index}") for index in range(size)}
+    return RunPlan.create(set(), {stage: projects for stage in STAGES})
+
+
+@pytest.mark.benchmark
+class TestRunPlanWriting:
+    def test_writing_scales_linearly(self):
+        with TemporaryDirectory() as folder:
+            small = _write(_plan(SMALL_PLAN), Path(folder))
+            large = _write(_plan(LARGE_PLAN), Path(folder))
+
+        growth = large / small
+        # ten times as many projects, a quadratic writer would take about a hundred times as long
+        assert growth < 25, (
+            f"{SMALL_PLAN} projects: {small * 1000:.1f} ms, "
+            f"{LARGE_PLAN} projects: {large * 1000:.1f} ms ({growth:.1f}x)"
+        )
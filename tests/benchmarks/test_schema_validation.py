@@ -0,0 +1,76 @@
+import json
+import time
+from typing import Callable
+
+import pytest
+
+from src.mpyl.utilities.yaml import load_read_only
+from src.mpyl.validation import load_schema
+from src.mpyl.validators import compiled_validator
+from src.mpyl.validators.compiler import CONVERTED_SCHEMAS, SCHEMA_FOLDER
+from tests.test_validation import CASES
+
+ROUNDS = 5
+SCHEMA = "project.schema.yml"
+CONVERTED = [
+    "project.schema.yml",
+    "mpyl_stages.schema.yml",
+    "k8s_api_core.schema.yml",
+    "traefik_v2.schema.yml",
+]
+
+
+def _measure(is_valid: Callable[[dict], bool], projects: list[dict]) -> float:
+    fastest = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for project in projects:
+            assert is_valid(project)
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest
+
+
+class TestSchemaValidation:
+    @pytest.mark.benchmark
+    def test_compiled_validation_is_faster_than_jsonschema(self):
+        schema = (SCHEMA_FOLDER / SCHEMA).read_text(encoding="utf-8")
+        projects = [
+            project
+            for project in CASES[SCHEMA]
+            if load_schema(schema).is_valid(project)
+        ]
+        compiled = compiled_validator(schema)
+        assert compiled is not None
+
+        interpreted = _measure(load_schema(schema).is_valid, projects)
+        generated = _measure(compiled, projects)
+        assert generated * 5 < interpreted, (
+            f"{len(projects)} projects, jsonschema: {interpreted * 1000:.2f} ms, "
+            f"compiled: {generated * 1000:.2f} ms ({interpreted / generated:.0f}x)"
+        )
+
+    def test_converted_schemas_match_yaml(self):
+        json_schemas = json.loads(CONVERTED_SCHEMAS.read_bytes())
+        assert [json_schemas[name]["schema"] for name in CONVERTED] == [
+            load_read_only((SCHEMA_FOLDER / name).read_bytes()) for name in CONVERTED
+        ]
+
+    @pytest.mark.benchmark
+    def test_converted_schemas_load_faster_than_yaml(self):
+        sources = [(SCHEMA_FOLDER / name).read_bytes() for name in CONVERTED]
+        converted = CONVERTED_SCHEMAS.read_bytes()
+
+        fastest_yaml = fastest_json = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for source in sources:
+                load_read_only(source)
+            fastest_yaml = min(fastest_yaml, time.perf_counter() - start)
+            start = time.perf_counter()
+            json.loads(converted)
+            fastest_json = min(fastest_json, time.perf_counter() - start)
+
+        assert fastest_json < fastest_yaml, (
+            f"{len(CONVERTED)} schemas, yaml: {fastest_yaml * 1000:.2f} ms, "
+            f"json: {fastest_json * 1000:.2f} ms"
+        )
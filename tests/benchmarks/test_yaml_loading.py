@@ -0,0 +1,56 @@
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from ruamel.yaml import YAML
+
+from src.mpyl.plan.discovery import find_projects
+from src.mpyl.utilities.yaml import load_read_only
+from tests.test_resources.test_data import resource_path
+
+ROUNDS = 5
+
+
+def _corpus() -> list[bytes]:
+    paths = [Path(path) for path in find_projects()]
+    companions = [
+        companion for path in paths for companion in path.parent.glob("*-traefik.yml")
+    ]
+    test_projects_folder = resource_path / "test_projects"
+    test_projects = sorted(
+        [*test_projects_folder.glob("*.yml"), *test_projects_folder.glob("[!.]*/*.yml")]
+    )
+    return [path.read_bytes() for path in paths + companions + test_projects]
+
+
+def _load_roundtrip(contents: bytes) -> Any:
+    return YAML().load(contents)
+
+
+def _measure(load: Callable[[bytes], Any], corpus: list[bytes]) -> float:
+    fastest = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for contents in corpus:
+            load(contents)
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest
+
+
+class TestYamlLoading:
+    corpus = _corpus()
+
+    def test_read_only_loads_the_same_values(self):
+        assert len(self.corpus) > 10
+        for contents in self.corpus:
+            assert load_read_only(contents) == _load_roundtrip(contents)
+
+    @pytest.mark.benchmark
+    def test_read_only_is_faster_than_roundtrip(self):
+        roundtrip = _measure(_load_roundtrip, self.corpus)
+        read_only = _measure(load_read_only, self.corpus)
+        assert read_only < roundtrip, (
+            f"{len(self.corpus)} files, roundtrip: {roundtrip * 1000:.1f} ms, "
+            f"read only: {read_only * 1000:.1f} ms"
+        )
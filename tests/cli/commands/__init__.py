@@ -8,8 +8,8 @@ run_properties_path = root_test_path / "test_resources/run_properties.yml"
 
 
 def invoke(args: list[str], env=None):
-    if env is None:
-        env = {}
+    # the commands run in the root of the repository, where they should not leave caches behind
+    env = {"MPYL_NO_CACHE": "true"} | (env or {})
     runner = CliRunner()
     add_commands()
     return runner.invoke(cli=main_group, args=list(args), env=env)
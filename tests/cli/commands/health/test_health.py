@@ -2,6 +2,7 @@ from rich.console import Console
 from rich.markdown import Markdown
 
 from src.mpyl.cli.commands.health.checks import _validate_config, HealthConsole
+from src.mpyl.validation import RUN_PROPERTIES_SCHEMA
 from tests import root_test_path
 
 
@@ -26,7 +27,7 @@ class TestHealthCommand:
         _validate_config(
             HealthConsole(test_console),
             self.resource_path / "run_properties.yml",
-            "../../../schema/run_properties.schema.yml",
+            RUN_PROPERTIES_SCHEMA,
         )
 
         assert "is valid" in test_console.output()
@@ -36,7 +37,7 @@ class TestHealthCommand:
         _validate_config(
             HealthConsole(test_console),
             self.resource_path / "run_properties_invalid_stage.yml",
-            "../../../schema/run_properties.schema.yml",
+            RUN_PROPERTIES_SCHEMA,
         )
 
         assert (
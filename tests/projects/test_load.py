@@ -1,8 +1,9 @@
 import traceback
+from dataclasses import astuple
 
 import jsonschema
 
-from src.mpyl.project import load_project
+from src.mpyl.project import load_project, load_project_header
 from src.mpyl.projects import ProjectWithDependents
 from src.mpyl.plan.discovery import find_projects
 from tests.projects.find import load_projects, find_dependencies
@@ -26,3 +27,11 @@ class TestProjectLoad:
 
         assert len(deps["job"].dependent_projects) == 1
         assert len(deps["sbtservice"].dependent_projects) == 0
+
+    def test_load_all_project_headers(self):
+        for path in find_projects():
+            header = load_project_header(path)
+            project = load_project(path, validate_project_yaml=False)
+            assert astuple(header) == astuple(project.header)
+            assert header.deployment_names == project.deployment_names
+            assert astuple(header.load()) == astuple(project)
@@ -0,0 +1,86 @@
+import shutil
+from dataclasses import astuple
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.mpyl.plan.discovery import find_projects
+from src.mpyl.projects.cache import ProjectCache
+from src.mpyl.projects.loader import load_project_headers, load_projects
+
+
+class TestProjectLoader:
+    def test_load_in_parallel(self):
+        paths = find_projects() * 10
+        result = load_projects(paths, validate_project_yaml=True, workers=2)
+        assert not result.failures
+        assert [project.path for project in result.loaded] == list(map(str, paths))
+        assert [astuple(project) for project in result.loaded] == [
+            astuple(project)
+            for project in load_projects(
+                paths, validate_project_yaml=True, workers=1
+            ).loaded
+        ]
+
+    def test_aggregates_failures(self, tmp_path):
+        invalid = tmp_path / "invalid" / "deployment" / "project.yml"
+        invalid.parent.mkdir(parents=True)
+        invalid.write_text("name: invalid\n")
+        missing = tmp_path / "missing" / "deployment" / "project.yml"
+        paths = [missing, *find_projects(), invalid]
+
+        result = load_projects(paths, validate_project_yaml=True, workers=1)
+
+        assert len(result.loaded) == len(paths) - 2
+        assert [failure.path for failure in result.failures] == [missing, invalid]
+        assert "is a required property" in result.failures[1].message
+        with pytest.raises(ValueError, match="Failed to load 2 project"):
+            result.raise_on_failure()
+
+    def test_cache(self, tmp_path):
+        shutil.copytree(Path("tests/projects/service"), tmp_path / "service")
+        project_file = tmp_path / "service" / "deployment" / "project.yml"
+        traefik_file = tmp_path / "service" / "deployment" / "http-traefik.yml"
+        cache = ProjectCache(tmp_path / "cache")
+
+        cold = load_projects([project_file], validate_project_yaml=True, cache=cache)
+        warm = load_projects([project_file], validate_project_yaml=True, cache=cache)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert astuple(warm.loaded[0]) == astuple(cold.loaded[0])
+
+        load_projects([project_file], validate_project_yaml=False, cache=cache)
+        load_project_headers([project_file], cache=cache)
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        traefik_file.write_text(traefik_file.read_text() + "\n# changed\n")
+        load_projects([project_file], validate_project_yaml=True, cache=cache)
+        assert (cache.hits, cache.misses) == (1, 4)
+
+        shutil.copy(traefik_file, traefik_file.with_name("added-traefik.yml"))
+        load_projects([project_file], validate_project_yaml=True, cache=cache)
+        assert (cache.hits, cache.misses) == (1, 5)
+
+    def test_cache_key_covers_the_project_classes(self, tmp_path):
+        cache = ProjectCache(tmp_path / "cache")
+        project_file = find_projects()[0]
+        key = cache.key(project_file, "validated")
+        assert cache.key(project_file, "validated") == key
+        with patch(
+            "src.mpyl.projects.cache.project_layout", return_value="other fields"
+        ):
+            assert cache.key(project_file, "validated") != key
+
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        paths = find_projects()
+        cache = ProjectCache(tmp_path / "cache", max_bytes=0)
+        load_project_headers(paths, cache=cache)
+        assert not list((tmp_path / "cache").iterdir())
+
+        cache = ProjectCache(tmp_path / "cache")
+        load_project_headers(paths, cache=cache)
+        entries = sorted((tmp_path / "cache").iterdir())
+        assert len(entries) == len(paths)
+        largest = max(entry.stat().st_size for entry in entries)
+        cache = ProjectCache(tmp_path / "cache", max_bytes=largest)
+        assert cache.prune() == len(paths) - 1
@@ -1,14 +1,44 @@
 import logging
+import os
+import subprocess
+import time
 from pathlib import Path
 
+import pytest
+
 from src.mpyl.plan.discovery import (
+    DiscoveryConfig,
+    DiscoveryMode,
+    ChangedProjects,
+    DependencyIndex,
+    ProjectTrie,
+    find_projects,
+    find_projects_incrementally,
     find_projects_to_execute,
     is_file_a_dependency,
+    read_discovered_projects,
+    is_file_in_project,
+    update_projects,
 )
+from src.mpyl.plan.cache import DiscoveryCache, walk_with_cache
+from src.mpyl.plan.git_index import list_tracked_projects
+from src.mpyl.plan.walker import IgnoreRules, walk
 from src.mpyl.project import load_project
 from src.mpyl.utilities.repo import Changeset
 from tests.projects.find import load_projects
-from tests.test_resources.test_data import TestStage
+from tests.test_resources.test_data import TestStage, get_project_with_stages
+
+
+def create_project_files(root: Path, directories: list[str]):
+    for directory in directories:
+        (root / directory / "deployment").mkdir(parents=True)
+        (root / directory / "deployment" / "project.yml").touch()
+
+
+def backdate_directories(root: Path, seconds: int = 3600):
+    timestamp = time.time() - seconds
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (timestamp, timestamp))
 
 
 class TestDiscovery:
@@ -172,3 +202,259 @@ class TestDiscovery:
             stage=TestStage.build().name,
             path="tests/projects/sbt-service-other/file.py",
         )
+
+    def test_find_projects(self):
+        assert find_projects() == [
+            Path("tests/projects/dagster-user-code/deployment/project.yml"),
+            Path("tests/projects/job/deployment/project.yml"),
+            Path("tests/projects/sbt-service/deployment/project.yml"),
+            Path("tests/projects/service/deployment/project.yml"),
+        ]
+
+    def test_walk_sorts_like_find_and_prunes_build_output(self, tmp_path):
+        create_project_files(
+            tmp_path,
+            [
+                "a",
+                "a-b",
+                "nested/deeper/c",
+                "a/target",
+                "frontend/node_modules/dep",
+                ".mpyl/cached",
+            ],
+        )
+        (tmp_path / "not-a-deployment").mkdir()
+        (tmp_path / "not-a-deployment" / "project.yml").touch()
+
+        assert walk(tmp_path, IgnoreRules()) == [
+            tmp_path / "a-b/deployment/project.yml",
+            tmp_path / "a/deployment/project.yml",
+            tmp_path / "nested/deeper/c/deployment/project.yml",
+        ]
+
+    def test_walk_with_ignore_rules_from_config(self, tmp_path):
+        create_project_files(tmp_path, ["dist/a", "libs/legacy/b", "libs/c", "d"])
+        config = DiscoveryConfig.from_config(
+            {"discovery": {"ignore": ["dist", "libs/legacy"]}}
+        )
+
+        assert walk(tmp_path, config.ignore) == [
+            tmp_path / "d/deployment/project.yml",
+            tmp_path / "libs/c/deployment/project.yml",
+        ]
+
+    def test_find_projects_from_git_index(self):
+        assert find_projects(DiscoveryConfig(mode=DiscoveryMode.GIT)) == find_projects(
+            DiscoveryConfig(mode=DiscoveryMode.FILESYSTEM)
+        )
+
+    def test_list_tracked_projects(self, tmp_path):
+        create_project_files(tmp_path, ["tracked", "untracked", "target/build"])
+        assert list_tracked_projects(tmp_path, IgnoreRules()) is None
+
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(
+            [
+                "git",
+                "add",
+                "tracked/deployment/project.yml",
+                "target/build/deployment/project.yml",
+            ],
+            cwd=tmp_path,
+            check=True,
+        )
+
+        assert list_tracked_projects(tmp_path, IgnoreRules()) == [
+            tmp_path / "tracked/deployment/project.yml"
+        ]
+
+    def test_walk_with_cache(self, tmp_path):
+        cache_file = tmp_path / ".mpyl" / "discovery_cache.json"
+        cache_file.parent.mkdir()
+        create_project_files(tmp_path, ["a", "b/c"])
+        backdate_directories(tmp_path)
+
+        assert walk_with_cache(tmp_path, IgnoreRules(), cache_file) == walk(
+            tmp_path, IgnoreRules()
+        )
+
+        warm_cache = DiscoveryCache(tmp_path, IgnoreRules(), cache_file).load()
+        assert walk(
+            tmp_path, IgnoreRules(), lister=warm_cache.lister(time.time_ns())
+        ) == walk(tmp_path, IgnoreRules())
+        assert warm_cache.misses == 0
+
+        create_project_files(tmp_path, ["b/d"])
+        (tmp_path / "a" / "deployment" / "project.yml").unlink()
+        assert walk_with_cache(tmp_path, IgnoreRules(), cache_file) == [
+            tmp_path / "b/c/deployment/project.yml",
+            tmp_path / "b/d/deployment/project.yml",
+        ]
+
+    def test_walk_with_cache_ignores_cache_for_other_rules(self, tmp_path):
+        cache_file = tmp_path / ".mpyl" / "discovery_cache.json"
+        create_project_files(tmp_path, ["a", "b"])
+        backdate_directories(tmp_path)
+        walk_with_cache(tmp_path, IgnoreRules(), cache_file)
+
+        assert walk_with_cache(
+            tmp_path, IgnoreRules.from_patterns(["b"]), cache_file
+        ) == [tmp_path / "a/deployment/project.yml"]
+
+    def test_update_projects_from_changeset(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        create_project_files(tmp_path, ["a", "b", "c", "target/d"])
+        previous = walk(Path("."), IgnoreRules())
+
+        (tmp_path / "b/deployment/project.yml").unlink()
+        (tmp_path / "c").rename(tmp_path / "e")
+        create_project_files(tmp_path, ["f", "target/g"])
+        changeset = Changeset(
+            {
+                "b/deployment/project.yml": "D",
+                "e/deployment/project.yml": "R",
+                "f/deployment/project.yml": "A",
+                "f/src/main.py": "A",
+                "target/g/deployment/project.yml": "A",
+                "a/deployment/project.yml": "M",
+            }
+        )
+
+        assert update_projects(previous, changeset, IgnoreRules()) == [
+            Path("a/deployment/project.yml"),
+            Path("e/deployment/project.yml"),
+            Path("f/deployment/project.yml"),
+        ]
+        assert update_projects(previous, changeset, IgnoreRules()) == walk(
+            Path("."), IgnoreRules()
+        )
+
+        renamed_with_source = Changeset(
+            {"e/deployment/project.yml": "R"},
+            {"e/deployment/project.yml": "c/deployment/project.yml"},
+        )
+        assert update_projects(previous, renamed_with_source, IgnoreRules()) == [
+            Path("a/deployment/project.yml"),
+            Path("b/deployment/project.yml"),
+            Path("e/deployment/project.yml"),
+        ]
+
+    def test_find_projects_incrementally_with_verify(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        create_project_files(tmp_path, ["a"])
+        config = DiscoveryConfig()
+
+        # without a previous result, all projects are found and stored for the head commit of the changeset
+        assert find_projects_incrementally(
+            config, Changeset({}, {}, "root", "base"), verify=True
+        ) == [Path("a/deployment/project.yml")]
+        stored = read_discovered_projects()
+        assert stored and stored.commit == "base"
+
+        create_project_files(tmp_path, ["b"])
+        changeset = Changeset({"b/deployment/project.yml": "A"}, {}, "base", "base")
+        assert find_projects_incrementally(config, changeset, verify=True) == [
+            Path("a/deployment/project.yml"),
+            Path("b/deployment/project.yml"),
+        ]
+
+        create_project_files(tmp_path, ["c"])
+        with pytest.raises(
+            ValueError, match="Missing: \\['c/deployment/project.yml'\\]"
+        ):
+            find_projects_incrementally(
+                config, Changeset({}, {}, "base", "base"), verify=True
+            )
+
+        # a changeset that was not read from git has no head commit to store the result for
+        stored = read_discovered_projects()
+        find_projects_incrementally(config, Changeset({}))
+        assert read_discovered_projects() == stored
+
+        # a previous result is only updated with changes on top of the commit it was found at, with the same config
+        for name, changeset, other_config in [
+            ("d", Changeset({}), config),
+            ("e", Changeset({}, {}, "other", "base"), config),
+            (
+                "f",
+                Changeset({}, {}, "base", "base"),
+                DiscoveryConfig(mode=DiscoveryMode.GIT),
+            ),
+        ]:
+            create_project_files(tmp_path, [name])
+            assert Path(f"{name}/deployment/project.yml") in (
+                find_projects_incrementally(other_config, changeset)
+            )
+
+    def test_project_trie_matches_is_file_in_project(self):
+        projects = [
+            get_project_with_stages({}, path=path)
+            for path in [
+                "services/api/deployment/project.yml",
+                "services/api/worker/deployment/project.yml",
+                "services/api-gateway/deployment/project.yml",
+                "deployment/project.yml",
+            ]
+        ]
+        trie = ProjectTrie(projects)
+
+        for path in [
+            "services/api/src/main.py",
+            "services/api/worker/src/main.py",
+            "services/api-gateway/main.py",
+            "services/api",
+            "services/other/file.py",
+            "README.md",
+            "./README.md",
+        ]:
+            assert set(trie.projects_containing(path)) == {
+                project
+                for project in projects
+                if is_file_in_project(self.logger, project, path)
+            }
+
+        assert [
+            project.path
+            for project in trie.projects_containing("services/api/worker/main.py")
+        ] == [
+            "services/api/deployment/project.yml",
+            "services/api/worker/deployment/project.yml",
+        ]
+
+    def test_changed_projects(self):
+        changed = ChangedProjects.from_changeset(
+            self.projects,
+            Changeset(
+                {
+                    "tests/projects/service/src/sum.js": "M",
+                    "tests/projects/service/file.py": "M",
+                    "tests/projects/sbt-service-other/file.py": "A",
+                }
+            ),
+        )
+        assert {project.name: path for project, path in changed.by_content.items()} == {
+            "nodeservice": "tests/projects/service/file.py"
+        }
+        assert {
+            stage: {project.name: path for project, path in projects.items()}
+            for stage, projects in changed.by_dependency.items()
+        } == {"test": {"job": "tests/projects/service/file.py"}}
+
+    def test_dependency_index_matches_is_file_a_dependency(self):
+        dependency_index = DependencyIndex(self.projects)
+        stages = [TestStage.build().name, TestStage.test().name, "deploy"]
+
+        for path in [
+            "tests/projects/sbt-service/src/main/scala/vandebron/mpyl/Main.scala",
+            "tests/projects/sbt-service/src",
+            "tests/projects/sbt-service-other/file.py",
+            "tests/projects/service/file.py",
+            "tests/projects/service/file.pyc",
+            "tests",
+        ]:
+            assert set(dependency_index.dependents(path)) == {
+                (project, stage)
+                for project in self.projects
+                for stage in stages
+                if is_file_a_dependency(self.logger, project, stage, path)
+            }
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+from src.mpyl.plan.partitions import (
+    MAX_MATRIX_JOBS,
+    estimate_costs,
+    load_durations,
+    merge_durations,
+    partition,
+    record_duration,
+    write_matrix,
+)
+from src.mpyl.project import Project
+from tests.test_resources.test_data import get_minimal_project
+from tests.test_run_plan import stub_project
+
+
+def project_with_deployments(name: str, deployments: int) -> Project:
+    minimal = get_minimal_project()
+    return Project(
+        name=name,
+        description="",
+        path=f"{name}/deployment/project.yml",
+        pipeline=None,
+        stages=minimal.stages,
+        maintainer=[],
+        deployments=minimal.deployments * deployments,
+        dependencies=None,
+        kubernetes=None,
+        _dagster=None,
+    )
+
+
+class TestPartitions:
+    def test_record_duration(self, tmp_path):
+        durations_file = tmp_path / "durations.json"
+        assert not load_durations(durations_file)
+        record_duration("a", 12.5, durations_file)
+        record_duration("b", 3, durations_file)
+        record_duration("a", 10, durations_file)
+        assert load_durations(durations_file) == {"a": 10, "b": 3}
+
+    def test_load_durations_ignores_other_values(self, tmp_path):
+        durations_file = tmp_path / "durations.json"
+        durations_file.write_text(
+            '{"a": 1.5, "b": "2", "c": null, "d": true, "e": -1, "f": 3}'
+        )
+        assert load_durations(durations_file) == {"a": 1.5, "f": 3}
+        durations_file.write_text("[1, 2]")
+        assert not load_durations(durations_file)
+
+    def test_merge_durations(self, tmp_path):
+        durations_file = tmp_path / "durations.json"
+        record_duration("a", 1, durations_file)
+        record_duration("b", 2, durations_file)
+        first_job = tmp_path / "first.json"
+        record_duration("b", 3, first_job)
+        second_job = tmp_path / "second.json"
+        record_duration("b", 4, second_job)
+        record_duration("c", 5, second_job)
+
+        assert merge_durations([], durations_file) == {"a": 1, "b": 2}
+        assert merge_durations([first_job, second_job], durations_file) == {
+            "a": 1,
+            "b": 4,
+            "c": 5,
+        }
+        assert load_durations(durations_file) == {"a": 1, "b": 4, "c": 5}
+
+    def test_estimate_falls_back_to_deployment_count(self):
+        projects = [
+            project_with_deployments("measured", 2),
+            project_with_deployments("unmeasured", 3),
+            stub_project("no deployments"),
+        ]
+        assert estimate_costs(projects, {"measured": 100}) == {
+            "measured": 100,
+            "unmeasured": 150,
+            "no deployments": 50,
+        }
+
+    def test_partitions_have_roughly_equal_cost(self):
+        costs = {f"project-{index}": float(index % 7 + 1) for index in range(100)}
+        partitions = partition(costs, 4)
+
+        assert len(partitions) == 4
+        assert sorted(name for part in partitions for name in part.projects) == sorted(
+            costs
+        )
+        assert max(part.cost for part in partitions) - min(
+            part.cost for part in partitions
+        ) <= max(costs.values())
+
+    def test_number_of_partitions_is_limited(self):
+        assert len(partition({"a": 1, "b": 2}, 5)) == 2
+        assert not partition({}, 5)
+        many = {f"project-{index}": 1.0 for index in range(1000)}
+        assert len(partition(many, 1000)) == MAX_MATRIX_JOBS
+
+    def test_write_matrix(self, tmp_path):
+        matrix_file = Path(tmp_path) / "matrix.json"
+        write_matrix(partition({"a": 3, "b": 2, "c": 1}, 2), matrix_file)
+        assert json.loads(matrix_file.read_text()) == {
+            "include": [
+                {"partition": 0, "projects": ["a"], "cost": 3},
+                {"partition": 1, "projects": ["b", "c"], "cost": 3},
+            ]
+        }
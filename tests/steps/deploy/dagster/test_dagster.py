@@ -2,10 +2,13 @@ from pathlib import Path
 
 from ruamel.yaml import YAML
 
-from src.mpyl.project import Target, load_project
+from src.mpyl.project import Project, Target, load_project
 from src.mpyl.run_plan import RunPlan
 from src.mpyl.steps.deploy.k8s.chart import ChartBuilder
-from src.mpyl.steps.deploy.k8s.resources.dagster import to_user_code_values
+from src.mpyl.steps.deploy.k8s.resources.dagster import (
+    get_env_variables,
+    to_user_code_values,
+)
 from src.mpyl.steps.input import Input
 from src.mpyl.utilities.helm import get_name_suffix
 from src.mpyl.utilities.yaml import yaml_to_string
@@ -128,3 +131,27 @@ class TestDagster:
         self._roundtrip(
             self.generated_values_path, "values_with_extra_manifest", values
         )
+
+    def test_env_variables_without_value_for_target_are_kept(self):
+        project = Project.from_config(
+            {
+                "name": "dagster",
+                "description": "",
+                "deployments": [
+                    {
+                        "name": "dagster",
+                        "properties": {
+                            "env": [
+                                {"key": "ALL", "all": "value"},
+                                {"key": "PRODUCTION_ONLY", "production": "value"},
+                            ]
+                        },
+                    }
+                ],
+            },
+            Path("dagster/deployment/project.yml"),
+        )
+        assert get_env_variables(project, Target.PULL_REQUEST) == {
+            "ALL": "value",
+            "PRODUCTION_ONLY": None,
+        }
@@ -6,7 +6,7 @@ from kubernetes.client import V1Probe, V1ObjectMeta, V1DeploymentSpec, V1Job, V1
 from pyaml_env import parse_config
 
 from src.mpyl.constants import DEFAULT_CONFIG_FILE_NAME
-from src.mpyl.project import Target, Project
+from src.mpyl.project import Target, Project, ResolvedTraefikHost, TraefikHost
 from src.mpyl.run_plan import RunPlan
 from src.mpyl.steps.deploy.k8s.chart import (
     ChartBuilder,
@@ -15,7 +15,10 @@ from src.mpyl.steps.deploy.k8s.chart import (
     to_cron_job_chart,
 )
 from src.mpyl.steps.deploy.k8s.resources import to_yaml, CustomResourceDefinition
-from src.mpyl.steps.deploy.k8s.resources.traefik import V1AlphaIngressRoute
+from src.mpyl.steps.deploy.k8s.resources.traefik import (
+    HostWrapper,
+    V1AlphaIngressRoute,
+)
 from src.mpyl.steps.input import Input
 from tests import root_test_path
 from tests.test_resources import test_data
@@ -109,7 +112,6 @@ class TestKubernetesChart:
         route = V1AlphaIngressRoute.from_hosts(
             metadata=V1ObjectMeta(),
             host=wrappers[0],
-            target=Target.PRODUCTION,
             pr_number=1234,
             release_name="dockertest",
             namespace="pr-1234",
@@ -279,3 +281,47 @@ class TestKubernetesChart:
             .image
             == "test-image:latest"
         )
+
+    def test_sealed_secrets_without_value_for_target_are_kept(self):
+        sealed_secret = ChartBuilder.to_sealed_secrets(
+            [("SECRET", "encrypted"), ("PRODUCTION_SECRET", None)], "Dockertest"
+        )
+        assert sealed_secret.spec["encryptedData"] == {
+            "SECRET": "encrypted",
+            "PRODUCTION_SECRET": None,
+        }
+
+    @pytest.mark.parametrize(
+        "priority,route_priority",
+        [
+            ({}, {}),
+            ({"production": 10}, {"priority": None}),
+            ({"all": 10}, {"priority": 10}),
+        ],
+    )
+    def test_ingress_route_priority(self, priority, route_priority):
+        traefik_host = TraefikHost.from_config(
+            {"host": {"all": "Host(`some.host`)"}, "priority": priority}
+        )
+        ingress_route = V1AlphaIngressRoute.from_hosts(
+            metadata=V1ObjectMeta(name="dockertest"),
+            host=HostWrapper(
+                traefik_host=ResolvedTraefikHost.from_host(
+                    traefik_host, Target.PULL_REQUEST
+                ),
+                name="dockertest",
+                index=0,
+                service_port=8080,
+                white_lists={},
+                tls=None,
+                additional_route=None,
+            ),
+            release_name="dockertest",
+            namespace="pr-1234",
+            pr_number=1234,
+            middlewares_override=[],
+            entrypoints_override=[],
+            default_tls="le-custom-prod-wildcard-cert",
+        )
+        route = ingress_route.spec["routes"][0]
+        assert {key: route[key] for key in route if key == "priority"} == route_priority
@@ -0,0 +1,69 @@
+import importlib
+import inspect
+import logging
+import pkgutil
+import subprocess
+import sys
+
+from src.mpyl.steps import step as step_module
+from src.mpyl.steps.collection import STEPS_MANIFEST, StepsCollection
+from tests import root_test_path
+from tests.test_resources.test_data import TestStage
+
+STEPS_PACKAGE = "src.mpyl.steps"
+
+GET_ECHO_STEP = (
+    "import logging, sys; "
+    "from src.mpyl.steps.collection import StepsCollection; "
+    "from src.mpyl.project import Stage; "
+    "step = StepsCollection(logging.getLogger()).get_step(Stage('deploy', ''), 'Echo Deploy'); "
+    "print(step.meta.name); "
+    "print(sorted(name for name in sys.modules if 'kubernetes' in name or 'dagster' in name))"
+)
+
+
+def _built_in_steps() -> dict[tuple[str, str], str]:
+    package = importlib.import_module(STEPS_PACKAGE)
+    steps = {}
+    for module_info in pkgutil.walk_packages(
+        package.__path__, prefix=f"{STEPS_PACKAGE}."
+    ):
+        module = importlib.import_module(module_info.name)
+        for name, value in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(value, step_module.Step)
+                and value is not step_module.Step
+                and value.__module__ == module.__name__
+            ):
+                step_class: type = value
+                meta = step_class(logging.getLogger()).meta
+                location = f"{module.__name__.removeprefix(STEPS_PACKAGE + '.')}:{name}"
+                steps[(meta.stage, meta.name)] = location
+    return steps
+
+
+class TestStepsCollection:
+    def test_manifest_lists_all_built_in_steps(self):
+        assert _built_in_steps() == STEPS_MANIFEST
+
+    def test_get_step_imports_only_the_requested_step(self):
+        result = subprocess.run(
+            [sys.executable, "-c", GET_ECHO_STEP],
+            cwd=root_test_path.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.splitlines() == ["Echo Deploy", "[]"]
+
+    def test_list_steps(self):
+        steps = StepsCollection(logging.getLogger()).list_steps()
+        assert set(STEPS_MANIFEST) <= set(steps)
+        assert steps == sorted(steps)
+
+    def test_get_unknown_step(self):
+        collection = StepsCollection(logging.getLogger())
+        assert not collection.get_step(TestStage.deploy(), "Unknown Deploy")
+        assert collection.get_step(TestStage.deploy(), "Echo Deploy") is (
+            collection.get_step(TestStage.deploy(), "Echo Deploy")
+        )
@@ -1,14 +1,28 @@
 import os
+import pickle
+import shutil
+from dataclasses import astuple
 from pathlib import Path
 
 import pytest
 from jsonschema import ValidationError
 
-from src.mpyl.project import load_project, Target
+from src.mpyl.project import Project, ProjectHeader, Stage, load_project, Target
 from tests import root_test_path
 from tests.test_resources.test_data import TestStage
 
 
+class PickledState:
+    """Pickles as an instance of `cls` with the given state, like a pickle made by an earlier layout of the class"""
+
+    def __init__(self, cls: type, state) -> None:
+        self.cls = cls
+        self.state = state
+
+    def __reduce__(self):
+        return object.__new__, (self.cls,), self.state
+
+
 class TestMpylSchema:
     resource_path = root_test_path / "test_resources" / "test_projects"
     project = load_project(
@@ -110,3 +124,105 @@ class TestMpylSchema:
 
     def test_project_yaml_file_name(self):
         assert self.project.project_yaml_file_name() == "project.yml"
+
+    def test_header_of_deprecated_deployment(self):
+        values = {
+            "name": "legacy",
+            "description": "A project with a single deployment",
+            "deployment": {"namespace": "legacy-namespace"},
+        }
+        header = ProjectHeader.from_config(
+            values, Path("legacy/deployment/project.yml")
+        )
+        project = Project.from_config(values, Path("legacy/deployment/project.yml"))
+        assert astuple(header) == astuple(project.header)
+        assert header.namespace(Target.TEST) == "legacy-namespace"
+        assert header.deployment_names == ["legacy"]
+
+    def test_resolve_for_target(self):
+        project = load_project(
+            self.resource_path / "default" / "test_project.yml",
+            validate_project_yaml=False,
+        )
+        resolved = project.resolve(Target.PRODUCTION)
+        assert resolved is project.resolve(Target.PRODUCTION)
+        assert resolved.namespace == "dockertest"
+
+        deployment = resolved.for_deployment(project.deployments[0])
+        assert deployment.name == "cronjob"
+        assert ("PROD_ONLY_ENV", "Production") in deployment.env
+        assert ("PROD_ONLY_ENV", None) in project.resolve(Target.TEST).deployments[
+            0
+        ].env
+        assert deployment.cron == {
+            "schedule": "0 22 * * *",
+            "timeZone": "Europe/Amsterdam",
+        }
+        assert deployment.command == "script.sh --opt"
+
+        restored = pickle.loads(pickle.dumps(project))
+        assert restored.resolve(Target.PRODUCTION) == resolved
+
+    def test_traefik_companion_is_parsed_on_access(self):
+        path = self.resource_path / "traefik" / "test_project_traefik.yml"
+        validated = load_project(path, validate_project_yaml=True)
+        project = load_project(path, validate_project_yaml=False)
+        deployment = project.deployments[0]
+
+        unchanged = load_project(path, validate_project_yaml=False)
+
+        assert validated.deployments[0]._traefik_file is None
+        assert deployment._traefik_file == path.parent / "dockertest-traefik.yml"
+        assert not deployment._companion
+        assert project.deployments == unchanged.deployments
+        assert deployment.traefik == validated.deployments[0].traefik
+        assert deployment._companion
+        assert deployment._traefik_file == path.parent / "dockertest-traefik.yml"
+        # whether the companion was parsed does not matter for equality
+        assert project.deployments == unchanged.deployments
+        assert project.deployments != validated.deployments
+        assert deployment.traefik is not None
+        assert deployment.traefik.middlewares is not None
+
+        unparsed = load_project(path, validate_project_yaml=False)
+        restored = pickle.loads(pickle.dumps(unparsed))
+        assert restored.deployments[0].traefik == deployment.traefik
+
+    def test_pickles_of_other_layouts(self):
+        assert pickle.loads(pickle.dumps(PickledState(Stage, ["build", "🏗"]))) == (
+            Stage("build", "🏗")
+        )
+        assert pickle.loads(
+            pickle.dumps(PickledState(Stage, {"name": "build", "icon": "🏗"}))
+        ) == Stage("build", "🏗")
+        with pytest.raises(pickle.UnpicklingError, match="Pickled Stage"):
+            pickle.loads(pickle.dumps(PickledState(Stage, ["build"])))
+        with pytest.raises(pickle.UnpicklingError, match="unknown attributes"):
+            pickle.loads(
+                pickle.dumps(
+                    PickledState(Stage, {"name": "build", "icon": "🏗", "color": 1})
+                )
+            )
+        with pytest.raises(pickle.UnpicklingError, match="Pickled Project"):
+            pickle.loads(
+                pickle.dumps(
+                    PickledState(Project, {"name": "project", "path": "project.yml"})
+                )
+            )
+
+    def test_traefik_companion_that_fails_to_parse(self, tmp_path):
+        shutil.copytree(self.resource_path / "traefik", tmp_path, dirs_exist_ok=True)
+        companion = tmp_path / "dockertest-traefik.yml"
+        project = load_project(
+            tmp_path / "test_project_traefik.yml", validate_project_yaml=False
+        )
+        companion.write_text("hosts: []\n")
+
+        assert (
+            project.deployments
+            == load_project(
+                tmp_path / "test_project_traefik.yml", validate_project_yaml=False
+            ).deployments
+        )
+        with pytest.raises(ValueError, match=f"Failed to load {companion}"):
+            _ = project.deployments[0].traefik
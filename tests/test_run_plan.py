@@ -1,13 +1,21 @@
 import json
+import logging
+import pickle
+import shutil
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest.mock import patch
 
 import pytest
 
-from src.mpyl.project import Project, Stages
-from src.mpyl.run_plan import RunPlan
-from tests.test_resources.test_data import TestStage
+from src.mpyl.plan.discovery import DiscoveryConfig
+from src.mpyl.plan.result_cache import LocalPlanCacheBackend, plan_cache_key
+from src.mpyl.project import KeyValueProperty, Project, Stages, Target, load_project
+from src.mpyl.run_plan import RUN_PLAN_SHARDS_FOLDER, RunPlan, discover_run_plan
+from src.mpyl.utilities.repo import Changeset
+from src.mpyl.steps.deploy.k8s import substitute_namespaces
+from tests import root_test_path
+from tests.test_resources.test_data import TestStage, get_minimal_project
 
 build_stage = TestStage.build()
 test_stage = TestStage.test()
@@ -31,6 +39,7 @@ def stub_project(name: str) -> Project:
 
 project_1 = stub_project("project 1")
 project_2 = stub_project("project 2")
+minimal_project = get_minimal_project()
 
 
 class TestEmptyPlan:
@@ -398,3 +407,336 @@ class TestRunPlanWithSelectedProjectInMultipleStages:
             self.run_plan.get_project_to_execute(
                 stage_name=build_stage.name, project_name=project_2.name
             )
+
+
+class TestRunPlanRendering:
+    run_plan = RunPlan.create(
+        all_known_projects=set(),
+        plan={
+            build_stage: {project_2, project_1},
+            test_stage: set(),
+            deploy_stage: {project_2},
+        },
+    )
+
+    def test_to_markdown(self):
+        assert self.run_plan.to_markdown() == "  \n".join(
+            [
+                "**Execution plan:**",
+                f"{build_stage.to_markdown()}:",
+                "project 1, project 2",
+                f"{test_stage.to_markdown()}:",
+                "",
+                f"{deploy_stage.to_markdown()}:",
+                "project 2",
+            ]
+        )
+
+    def test_indexes_are_rebuilt_after_unpickling(self):
+        restored = pickle.loads(pickle.dumps(self.run_plan))
+        assert restored == self.run_plan
+        assert restored.to_markdown() == self.run_plan.to_markdown()
+        assert (
+            restored.get_project_to_execute(deploy_stage.name, project_2.name)
+            == project_2
+        )
+        selected = restored.select_project(project_2.name)
+        assert selected.get_projects_for_stage_name(build_stage.name) == {project_2}
+        assert selected.get_projects_for_stage_name(
+            build_stage.name, use_full_plan=True
+        ) == {project_1, project_2}
+
+
+class TestRunPlanFile:
+    run_plan = RunPlan.create(
+        all_known_projects={project_1.header, minimal_project.header},
+        plan={
+            build_stage: {project_1, project_2, minimal_project},
+            test_stage: set(),
+            deploy_stage: {project_2, minimal_project},
+        },
+    )
+
+    def test_roundtrip(self):
+        with TemporaryDirectory() as folder:
+            self.run_plan.write_to_file(Path(folder) / "run_plan.bin")
+            loaded = RunPlan.load(path=Path(folder) / "run_plan.bin")
+
+        assert loaded == self.run_plan
+        assert loaded.to_markdown() == self.run_plan.to_markdown()
+        assert (
+            loaded.get_project_to_execute(
+                deploy_stage.name, minimal_project.name
+            ).deployments
+            == minimal_project.deployments
+        )
+
+    def test_load_only_the_selected_project(self):
+        with TemporaryDirectory() as folder:
+            self.run_plan.select_project(project_2.name).write_to_file(
+                Path(folder) / "run_plan.bin"
+            )
+            loaded = RunPlan.load(project_2.name, Path(folder) / "run_plan.bin")
+
+        assert loaded._get_all_projects(use_full_plan=True) == {project_2}
+        assert loaded._get_all_stages() == [build_stage, deploy_stage]
+        assert loaded.get_project_to_execute(deploy_stage.name, project_2.name)
+        assert loaded.get_headers_for_stage_name(
+            deploy_stage.name, use_full_plan=True
+        ) == {project_2, minimal_project}
+        assert loaded.all_known_projects == {project_1, minimal_project}
+        known_minimal_project = next(
+            project
+            for project in loaded.all_known_projects
+            if project.name == minimal_project.name
+        )
+        assert known_minimal_project.namespace(Target.PRODUCTION) == "mpyl"
+        assert known_minimal_project.deployment_names == ["http"]
+
+    def test_load_project_outside_of_the_plan(self):
+        with TemporaryDirectory() as folder:
+            self.run_plan.select_project(project_2.name).write_to_file(
+                Path(folder) / "run_plan.bin"
+            )
+            with pytest.raises(ValueError):
+                RunPlan.load(project_1.name, Path(folder) / "run_plan.bin")
+            with pytest.raises(ValueError):
+                RunPlan.load("unknown", Path(folder) / "run_plan.bin")
+
+    def test_load_pickled_plan(self):
+        with TemporaryDirectory() as folder:
+            pickled = Path(folder) / "run_plan.pickle"
+            pickled.write_bytes(pickle.dumps(self.run_plan))
+            assert RunPlan.load(path=pickled) == self.run_plan
+            assert RunPlan.load(project_2.name, pickled)._get_all_projects() == {
+                project_2
+            }
+
+    def test_load_plan_pickled_by_the_baseline_version(self):
+        # pickled before the project classes had slots, the projects are attribute dictionaries
+        pickled = root_test_path / "test_resources" / "baseline_run_plan.pickle"
+        run_plan = RunPlan.load("nodeservice", pickled)
+
+        project = run_plan.get_project_to_execute("deploy", "nodeservice")
+        assert project.deployment_names == ["http"]
+        assert project.deployments[0].traefik
+        assert project.stages.for_stage("deploy") == "Kubernetes Deploy"
+        assert {known.name for known in run_plan.all_known_projects} == {
+            "nodeservice",
+            "sbtservice",
+            "job",
+            "example-dagster-user-code",
+        }
+        assert run_plan.get_projects_for_stage_name("build") == {project}
+
+
+def project_referring_to(name: str, *references: str) -> Project:
+    return Project.from_config(
+        {
+            "name": name,
+            "description": f"refers to {references}",
+            "maintainer": [],
+            "kubernetes": {"namespace": {"all": f"namespace-{name}"}},
+            "deployments": [
+                {
+                    "name": "http",
+                    "properties": {
+                        "env": [
+                            {"key": "URL", "all": f"http://{reference}.{{namespace}}"}
+                            for reference in references
+                        ]
+                    },
+                }
+            ],
+        },
+        Path(f"{name}/deployment/project.yml"),
+    )
+
+
+class TestRunPlanShards:
+    frontend = project_referring_to("frontend", "backend-http", "accounts")
+    backend = project_referring_to("backend")
+    accounts = project_referring_to("accounts")
+    unrelated = project_referring_to("unrelated", "not-a-project")
+    run_plan = RunPlan.create(
+        all_known_projects={
+            project.header for project in [frontend, backend, accounts, unrelated]
+        },
+        plan={
+            build_stage: {frontend, unrelated},
+            deploy_stage: {frontend, backend, unrelated},
+        },
+    )
+
+    def test_shard_holds_only_the_referenced_projects(self):
+        with TemporaryDirectory() as folder:
+            self.run_plan.write_shards(folder=Path(folder))
+            assert sorted(path.name for path in Path(folder).iterdir()) == [
+                "backend.bin",
+                "frontend.bin",
+                "unrelated.bin",
+            ]
+            with patch("src.mpyl.run_plan.RUN_PLAN_SHARDS_FOLDER", Path(folder)):
+                shard = RunPlan.load(self.frontend.name)
+
+        assert shard.get_project_to_execute(deploy_stage.name, "frontend")
+        assert shard._get_all_stages() == [build_stage, deploy_stage]
+        assert shard.all_known_projects == {self.frontend, self.backend, self.accounts}
+        assert shard.get_headers_for_stage_name(deploy_stage.name, True) == {
+            self.frontend,
+            self.backend,
+        }
+
+        def substituted(run_plan: RunPlan) -> dict[str, str]:
+            return substitute_namespaces(
+                env_vars={
+                    "BACKEND": "http://backend-http.{namespace}",
+                    "ACCOUNTS": "http://accounts.{namespace}",
+                },
+                all_projects=run_plan.all_known_projects,
+                projects_to_deploy=run_plan.get_headers_for_stage_name(
+                    deploy_stage.name, use_full_plan=True
+                ),
+                target=Target.PULL_REQUEST,
+                pr_identifier=123,
+            )
+
+        assert substituted(shard) == substituted(self.run_plan)
+        assert substituted(shard) == {
+            "BACKEND": "http://backend-http.pr-123",
+            "ACCOUNTS": "http://accounts.namespace-accounts",
+        }
+
+    def test_shard_holds_projects_referenced_by_the_default_env(self):
+        default_env = KeyValueProperty.from_config(
+            {"key": "ACCOUNTS", "pr": "http://accounts.{namespace}"}
+        )
+        with TemporaryDirectory() as folder:
+            self.run_plan.write_shards([default_env], folder=Path(folder))
+            shard = RunPlan.load("unrelated", Path(folder) / "unrelated.bin")
+
+        assert shard.all_known_projects == {self.unrelated, self.accounts}
+        assert not shard.get_headers_for_stage_name(deploy_stage.name, True) - {
+            self.unrelated
+        }
+
+    def test_shard_holds_the_traefik_companions(self, tmp_path):
+        shutil.copytree(
+            root_test_path / "test_resources" / "test_projects" / "traefik",
+            tmp_path / "traefik",
+        )
+        project = load_project(
+            tmp_path / "traefik" / "test_project_traefik.yml",
+            validate_project_yaml=False,
+        )
+        traefik = (
+            load_project(
+                tmp_path / "traefik" / "test_project_traefik.yml",
+                validate_project_yaml=False,
+            )
+            .deployments[0]
+            .traefik
+        )
+        RunPlan.create({project}, {deploy_stage: {project}}).write_shards(
+            folder=tmp_path / "shards"
+        )
+        (tmp_path / "traefik" / "dockertest-traefik.yml").unlink()
+
+        shard = RunPlan.load(project.name, tmp_path / "shards" / f"{project.name}.bin")
+        deployment = shard.get_project_to_execute(
+            deploy_stage.name, project.name
+        ).deployments[0]
+        assert traefik is not None
+        assert deployment.traefik == traefik
+
+    def test_storing_the_plan_removes_the_shards_of_the_previous_plan(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        self.run_plan.write_shards()
+        assert RunPlan.load("frontend").all_known_projects != (
+            self.run_plan.all_known_projects
+        )
+
+        self.run_plan.write_to_file()
+        assert not list(RUN_PLAN_SHARDS_FOLDER.iterdir())
+        assert RunPlan.load("frontend").all_known_projects == (
+            self.run_plan.all_known_projects
+        )
+
+
+class TestRunPlanCache:
+    logger = logging.getLogger(__name__)
+    stages = [build_stage, test_stage, deploy_stage]
+    changeset = Changeset({"service/src/main.py": "M"})
+
+    def _discover(self, backend: LocalPlanCacheBackend) -> RunPlan:
+        return discover_run_plan(
+            logger=self.logger,
+            all_stages=self.stages,
+            changeset=self.changeset,
+            discovery_config=DiscoveryConfig(),
+            plan_cache=backend,
+        )
+
+    def test_rediscovery_reads_the_plan_from_the_cache(
+        self, tmp_path, monkeypatch, caplog
+    ):
+        shutil.copytree("tests/projects/service", tmp_path / "service")
+        monkeypatch.chdir(tmp_path)
+        backend = LocalPlanCacheBackend(tmp_path / "cache")
+
+        discovered = self._discover(backend)
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+        with caplog.at_level(logging.INFO):
+            with patch(
+                "src.mpyl.run_plan.load_project_headers", side_effect=AssertionError
+            ):
+                cached = self._discover(backend)
+        assert "cache hit" in caplog.text
+        assert cached == discovered
+        assert cached.to_markdown() == discovered.to_markdown()
+
+        project_file = tmp_path / "service/deployment/project.yml"
+        project_file.write_text(
+            project_file.read_text().replace("maintainer: ['MPyL']", "maintainer: []")
+        )
+        assert (
+            self._discover(backend)
+            .get_project_to_execute(deploy_stage.name, "nodeservice")
+            .maintainer
+            == []
+        )
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_entries_without_a_valid_signature_are_ignored(self, tmp_path, monkeypatch):
+        shutil.copytree("tests/projects/service", tmp_path / "service")
+        monkeypatch.chdir(tmp_path)
+        backend = LocalPlanCacheBackend(tmp_path / "cache")
+        discovered = self._discover(backend)
+        [entry] = (tmp_path / "cache").iterdir()
+        signed = entry.read_bytes()
+
+        monkeypatch.setenv("MPYL_PLAN_CACHE_SECRET", "another secret")
+        with patch("src.mpyl.run_plan.RunPlan.load", side_effect=AssertionError):
+            assert self._discover(backend) == discovered
+        monkeypatch.delenv("MPYL_PLAN_CACHE_SECRET")
+
+        entry.write_bytes(signed[:-1] + b"!")
+        with patch("src.mpyl.run_plan.RunPlan.load", side_effect=AssertionError):
+            assert self._discover(backend) == discovered
+
+        assert entry.read_bytes() == signed
+        with patch(
+            "src.mpyl.run_plan.load_project_headers", side_effect=AssertionError
+        ):
+            assert self._discover(backend) == discovered
+
+    def test_key_depends_on_changeset_and_stages(self):
+        paths = [Path("tests/projects/service/deployment/project.yml")]
+        key = plan_cache_key(self.changeset, paths, self.stages)
+        assert key == plan_cache_key(self.changeset, paths, self.stages)
+        assert key != plan_cache_key(Changeset({}), paths, self.stages)
+        assert key != plan_cache_key(self.changeset, paths, self.stages[:2])
+        assert plan_cache_key(self.changeset, [Path("missing")], self.stages) is None
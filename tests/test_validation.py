@@ -1,7 +1,71 @@
+import ast
+import copy
+import json
 import pkgutil
+from pathlib import Path
+from typing import Any
 
-from src.mpyl.validation import validate
-from tests.test_resources.test_data import config_values
+import pytest
+from jsonschema import ValidationError
+
+from src.mpyl.utilities.pyaml_env import parse_config
+from src.mpyl.utilities.yaml import load_read_only
+from src.mpyl.validation import (
+    RUN_PROPERTIES_SCHEMA,
+    load_schema,
+    schema_by_name,
+    schema_validator,
+    validate,
+    validate_with_schema,
+)
+from src.mpyl.validators import compiled_validator
+from src.mpyl.validators.compiler import (
+    COMPILED_SCHEMAS,
+    CONVERTED_SCHEMAS,
+    GENERATED_MODULE,
+    SCHEMA_FOLDER,
+    convert,
+    generate,
+)
+from tests.test_resources.test_data import config_values, resource_path
+
+
+def _schema(name: str) -> str:
+    return (SCHEMA_FOLDER / name).read_text(encoding="utf-8")
+
+
+def _documents(*paths: Path) -> list[Any]:
+    return [load_read_only(path.read_bytes()) for path in paths]
+
+
+def _mutations(document: dict) -> list[Any]:
+    mutations: list[Any] = [None, [], "document", {**document, "unknown": 1}]
+    for key, value in document.items():
+        without = dict(document)
+        del without[key]
+        mutations.append(without)
+        for replacement in (None, 1, True, "value", [], {}, [value], {"key": value}):
+            mutations.append({**document, key: replacement})
+    return mutations
+
+
+def _test_projects() -> list[Any]:
+    folder = resource_path / "test_projects"
+    return _documents(*sorted([*folder.glob("*.yml"), *folder.glob("[!.]*/*.yml")]))
+
+
+CASES = {
+    "project.schema.yml": _test_projects(),
+    "run_properties.schema.yml": [
+        parse_config(resource_path / name)
+        for name in (
+            "run_properties.yml",
+            "run_properties_invalid.yml",
+            "run_properties_invalid_stage.yml",
+        )
+    ],
+    "mpyl_config.schema.yml": [copy.deepcopy(config_values)],
+}
 
 
 class TestValidation:
@@ -12,3 +76,52 @@ class TestValidation:
 
         assert schema_dict is not None
         validate(config_values, schema_dict.decode("utf-8"))
+
+    def test_generated_validators_are_up_to_date(self):
+        assert ast.dump(ast.parse(generate())) == ast.dump(
+            ast.parse(GENERATED_MODULE.read_text(encoding="utf-8"))
+        ), "Regenerate the validators with `pipenv run compile-schemas`"
+
+    def test_converted_schemas_are_up_to_date(self):
+        assert json.loads(convert()) == json.loads(
+            CONVERTED_SCHEMAS.read_text(encoding="utf-8")
+        ), "Regenerate the converted schemas with `pipenv run compile-schemas`"
+
+    def test_registry_serves_the_converted_schemas(self):
+        converted = json.loads(CONVERTED_SCHEMAS.read_text(encoding="utf-8"))
+        for path in SCHEMA_FOLDER.glob("*.schema.yml"):
+            assert path.name in converted
+            assert schema_by_name(path.name) == load_read_only(path.read_bytes())
+        assert schema_validator(RUN_PROPERTIES_SCHEMA) is schema_validator(
+            RUN_PROPERTIES_SCHEMA
+        )
+
+    def test_every_schema_is_compiled(self):
+        assert set(CASES) == set(COMPILED_SCHEMAS)
+        for name in COMPILED_SCHEMAS:
+            assert compiled_validator(_schema(name)) is not None
+        assert compiled_validator(_schema("mpyl_stages.schema.yml")) is None
+
+    @pytest.mark.parametrize("name", COMPILED_SCHEMAS)
+    def test_compiled_validators_agree_with_jsonschema(self, name: str):
+        schema = _schema(name)
+        compiled = compiled_validator(schema)
+        assert compiled is not None
+        valid = 0
+        for document in CASES[name]:
+            for instance in [document, *_mutations(document)]:
+                is_valid = load_schema(schema).is_valid(instance)
+                if compiled(instance):
+                    assert is_valid, f"{name} accepts {instance}"
+                valid += is_valid
+                if instance is document:
+                    # the documents themselves are exactly what the fast path is for
+                    assert compiled(instance) == is_valid
+        assert valid > 0
+
+    def test_invalid_values_are_explained_by_jsonschema(self):
+        run_properties = CASES["run_properties.schema.yml"][1]
+        with pytest.raises(ValidationError):
+            validate(run_properties, _schema("run_properties.schema.yml"))
+        with pytest.raises(ValidationError):
+            validate_with_schema(run_properties, RUN_PROPERTIES_SCHEMA)
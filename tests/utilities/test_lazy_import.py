@@ -0,0 +1,21 @@
+import sys
+
+import pytest
+
+from src.mpyl.utilities.lazy_import import lazy_import
+
+
+class TestLazyImport:
+    def test_module_is_executed_on_first_attribute_access(self):
+        sys.modules.pop("tabnanny", None)
+        module = lazy_import("tabnanny")
+        assert "check" not in object.__getattribute__(module, "__dict__")
+        assert callable(module.check)
+        assert sys.modules["tabnanny"] is module
+
+    def test_imported_module_is_returned_as_is(self):
+        assert lazy_import("sys") is sys
+
+    def test_missing_module_fails_immediately(self):
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import("mpyl_does_not_exist")
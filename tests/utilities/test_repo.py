@@ -0,0 +1,193 @@
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.mpyl.utilities.repo import Changeset
+from src.mpyl.utilities.repo.git import DiffEntry, parse_name_status
+from src.mpyl.utilities.repo.json_stream import iter_json_strings
+
+
+def commit_of(repository: Path, revision: str) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", revision],
+        cwd=repository,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+def git(repository: Path, *arguments: str):
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=MPyL",
+            "-c",
+            "user.email=mpyl@example.com",
+            *arguments,
+        ],
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+def write_files(repository: Path, files: dict[str, str]):
+    for name, content in files.items():
+        (repository / name).parent.mkdir(parents=True, exist_ok=True)
+        (repository / name).write_text(content)
+
+
+class TestChangeset:
+    def test_lookups(self):
+        changeset = Changeset(
+            {
+                "projects/job/src/main.py": "M",
+                "projects/job-two/README.md": "A",
+                "projects/job/deployment/project.yml": "D",
+                "projects/jobs": "M",
+                "other/file.txt": "R",
+            }
+        )
+        assert changeset.sorted_files == tuple(sorted(changeset.files_touched()))
+        assert changeset.files_touched({"M"}) == {
+            "projects/job/src/main.py",
+            "projects/jobs",
+        }
+        assert changeset.files_touched({"A", "D"}) == {
+            "projects/job-two/README.md",
+            "projects/job/deployment/project.yml",
+        }
+        assert changeset.files_touched({"C"}) == frozenset()
+        assert changeset.status_of("other/file.txt") == "R"
+        assert changeset.files_under("projects/job") == (
+            "projects/job/deployment/project.yml",
+            "projects/job/src/main.py",
+        )
+        assert changeset.files_under("projects/job/") == changeset.files_under(
+            "projects/job"
+        )
+        assert changeset.files_under("projects/jobs") == ()
+        assert changeset.files_under("") == changeset.sorted_files
+        assert changeset.status_of("projects/job") is None
+        assert changeset.status_of("projects/jobs/file.txt") is None
+
+    def test_paths_are_interned(self):
+        path = "".join(["projects/", "job/src/main.py"])
+        changeset = Changeset({path: "M"})
+        assert changeset.sorted_files[0] is sys.intern(path)
+        assert changeset == Changeset({"projects/job/src/main.py": "M"})
+        assert changeset != Changeset({"projects/job/src/main.py": "A"})
+
+    def test_parse_name_status(self):
+        fields = iter(
+            [
+                "M",
+                "modified.py",
+                "R087",
+                "old name.py",
+                "new name.py",
+                "T",
+                "link",
+                "X",
+                "unknown",
+                "",
+            ]
+        )
+        assert list(parse_name_status(fields)) == [
+            DiffEntry(status="M", path="modified.py"),
+            DiffEntry(status="R", path="new name.py", source="old name.py"),
+            DiffEntry(status="M", path="link"),
+        ]
+
+    def test_from_git(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        git(tmp_path, "init", "-q", "-b", "main")
+        write_files(
+            tmp_path,
+            {
+                "modified.py": "print('a')\n",
+                "deleted.py": "print('b')\n",
+                "project/deployment/project.yml": "name: project\n" * 10,
+            },
+        )
+        git(tmp_path, "add", ".")
+        git(tmp_path, "commit", "-q", "-m", "base")
+        git(tmp_path, "checkout", "-q", "-b", "feature")
+        write_files(
+            tmp_path,
+            {"modified.py": "print('c')\n", "added/file with spaces.py": ""},
+        )
+        (tmp_path / "deleted.py").unlink()
+        git(tmp_path, "mv", "project", "moved")
+        git(tmp_path, "add", "-A")
+        git(tmp_path, "commit", "-q", "-m", "feature")
+        git(tmp_path, "checkout", "-q", "main")
+        write_files(tmp_path, {"only-on-main.py": ""})
+        git(tmp_path, "add", ".")
+        git(tmp_path, "commit", "-q", "-m", "main")
+
+        cache_file = tmp_path / ".mpyl" / "merge_base_cache.json"
+        changeset = Changeset.from_git(
+            logging.getLogger(), "main", "feature", cache_file=cache_file
+        )
+
+        assert changeset.files_touched() == {
+            "modified.py",
+            "deleted.py",
+            "added/file with spaces.py",
+            "moved/deployment/project.yml",
+        }
+        assert changeset.files_touched({"D"}) == {"deleted.py"}
+        assert changeset.status_of("moved/deployment/project.yml") == "R"
+        assert (
+            changeset.renamed_from("moved/deployment/project.yml")
+            == "project/deployment/project.yml"
+        )
+        assert changeset.base_commit == commit_of(tmp_path, "main~1")
+        assert changeset.head_commit == commit_of(tmp_path, "feature")
+        assert cache_file.is_file()
+        assert (
+            Changeset.from_git(
+                logging.getLogger(), "main", "feature", cache_file=cache_file
+            )
+            == changeset
+        )
+
+    def test_from_git_with_unknown_revision(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        git(tmp_path, "init", "-q")
+        with pytest.raises(ValueError, match="Unable to run git"):
+            Changeset.from_git(logging.getLogger(), "does-not-exist")
+
+    def test_iter_json_strings(self, tmp_path):
+        files = [
+            "plain.py",
+            'quoted "name".py',
+            "back\\slash\\",
+            "ünïcödé/文件.py",
+            "new\nline",
+        ]
+        path = tmp_path / "modified_files.json"
+        path.write_text(json.dumps(files, ensure_ascii=False, indent=2))
+        assert list(iter_json_strings(path)) == files
+
+        path.write_text(json.dumps(files))
+        assert list(iter_json_strings(path)) == files
+
+        path.write_text(" [ ] ")
+        assert not list(iter_json_strings(path))
+
+    @pytest.mark.parametrize(
+        "contents", ["", "{}", '["a" "b"]', '["a", 1]', '["a",]', '["a"] x', '["a']
+    )
+    def test_iter_json_strings_rejects_invalid_input(self, tmp_path, contents):
+        path = tmp_path / "modified_files.json"
+        path.write_text(contents)
+        with pytest.raises(ValueError, match="Unable to read"):
+            list(iter_json_strings(path))